@@ -1,5 +1,6 @@
 from .base_agent import BaseAgent
 from .politician_agent import PoliticianAgent
+from .politician_persona import PoliticianPersona
 from .party_agent import PartyAgent
 from .supervisor_agent import SupervisorAgent
 from .agent_manager import AgentManager
@@ -7,6 +8,7 @@ from .agent_manager import AgentManager
 __all__ = [
     'BaseAgent',
     'PoliticianAgent',
+    'PoliticianPersona',
     'PartyAgent',
     'SupervisorAgent',
     'AgentManager'
@@ -1,7 +1,9 @@
-from .politician_agent import PoliticianAgent
 from .party_agent import PartyAgent
 from .supervisor_agent import SupervisorAgent
-from typing import List, Dict, Any
+from .politician_persona import PoliticianPersona
+from .politician_registry import politician_registry
+from .parallel_loader import ParallelLoader
+from typing import List, Dict, Any, Optional
 
 class AgentManager:
     """
@@ -13,7 +15,10 @@ class AgentManager:
         Initialize the agent manager.
         """
         self.parties = {}
+        # Politicians by (normalized name, normalized party), see PoliticianRegistry.key
         self.politicians = {}
+        # Timing of the loads of the last simulation created (see ParallelLoader.get_report)
+        self.last_load_report: Optional[Dict[str, Any]] = None
     
     def load_party(self, party_name: str, party_acronym: str = "") -> PartyAgent:
         """
@@ -38,9 +43,9 @@ class AgentManager:
         
         return party_agent
     
-    def load_politician(self, full_name: str, party_name: str = "", role: str = "") -> PoliticianAgent:
+    def load_politician(self, full_name: str, party_name: str = "", role: str = "") -> PoliticianPersona:
         """
-        Load a politician agent with context data.
+        Load a politician with context data.
         
         Args:
             full_name: The full name of the politician
@@ -48,32 +53,29 @@ class AgentManager:
             role: The role of the politician
             
         Returns:
-            A configured politician agent
+            The politician's persona
         """
         # Check if we already have this politician
-        if full_name in self.politicians:
-            return self.politicians[full_name]
+        key = politician_registry.key(full_name, party_name)
+        if key in self.politicians:
+            return self.politicians[key]
         
         # Split the name
         parts = full_name.split(maxsplit=1)
         first_name = parts[0]
         last_name = parts[1] if len(parts) > 1 else ""
         
-        # Create the politician agent
-        politician_agent = PoliticianAgent(
-            first_name=first_name,
-            last_name=last_name,
-            party_name=party_name
-        )
+        # Get the politician's persona (loaded only once per process, whichever manager or party asks first)
+        politician = politician_registry.get_or_create(first_name, last_name, party_name)
         
         # Set the role if provided
         if role:
-            politician_agent.role = role
+            politician.role = role
         
-        # Store the politician agent
-        self.politicians[full_name] = politician_agent
+        # Store the politician
+        self.politicians[key] = politician
         
-        return politician_agent
+        return politician
     
     def add_politician_to_party(self, politician_name: str, party_name: str, role: str = ""):
         """
@@ -91,36 +93,43 @@ class AgentManager:
         party = self.parties[party_name]
         
         # Check if the politician is already in the party
+        key = politician_registry.key(politician_name, party_name)
         for politician in party.politicians:
-            if politician.full_name == politician_name:
+            if politician_registry.key(politician.full_name, politician.party_name) == key:
                 # Update the role if provided
                 if role:
                     politician.role = role
                 return
         
-        # Load the politician if they don't exist
-        if politician_name not in self.politicians:
-            self.load_politician(politician_name, party_name, role)
-        
-        politician = self.politicians[politician_name]
-        
-        # Add the politician to the party
+        # Add the politician to the party (the party gets the persona from the shared registry)
         party.add_politician(politician_name, role)
+        self.politicians[key] = politician_registry.get(politician_name, party_name)
     
-    def create_simulation(self, party_names: List[str], politicians_per_party: Dict[str, List[Dict[str, str]]]) -> SupervisorAgent:
+    def create_simulation(self, party_names: List[str], politicians_per_party: Dict[str, List[Dict[str, str]]],
+                          cache_mode: Optional[str] = None, max_workers: Optional[int] = None,
+                          rate_per_minute: Optional[float] = None) -> SupervisorAgent:
         """
         Create a simulation with the specified parties and politicians.
         
+        All parties and politicians are loaded concurrently (see ParallelLoader). A party or
+        politician that fails to load is left out of the simulation.
+        
         Args:
             party_names: A list of party names
             politicians_per_party: A dictionary mapping party names to lists of politician dictionaries
                                   (each containing 'name' and optionally 'role')
+            cache_mode: LLM response cache mode for the simulation ("replay" or "fresh")
+            max_workers: Maximum number of parties and politicians loaded at the same time
+                         (defaults to SIMULATION_LOAD_WORKERS)
+            rate_per_minute: Maximum number of uncached loads started per minute
+                             (defaults to SIMULATION_LOAD_RATE_PER_MINUTE)
             
         Returns:
             A configured supervisor agent
         """
-        supervisor = SupervisorAgent()
+        supervisor = SupervisorAgent(cache_mode=cache_mode)
         
+        parties_config = []
         for party_name in party_names:
             # Extract the acronym if provided (format: "Party Name (ACRONYM)")
             acronym = ""
@@ -132,15 +141,23 @@ class AgentManager:
             else:
                 party_name_clean = party_name
             
-            # Load the party
-            party = self.load_party(party_name_clean, acronym)
-            
-            # Add politicians to the party
-            if party_name in politicians_per_party:
-                for politician_info in politicians_per_party[party_name]:
-                    name = politician_info["name"]
-                    role = politician_info.get("role", "")
-                    self.add_politician_to_party(name, party_name_clean, role)
+            parties_config.append({
+                'name': party_name_clean,
+                'acronym': acronym,
+                'politicians': politicians_per_party.get(party_name, [])
+            })
+        
+        # Load the parties and their politicians
+        loader = ParallelLoader(max_workers=max_workers, rate_per_minute=rate_per_minute)
+        with supervisor.simulation_scope():
+            # Names and roles are set in this simulation's sessions, not on the shared personas
+            parties = loader.load_simulation(parties_config, self.parties)
+        self.last_load_report = loader.get_report()
+        
+        for party in parties:
+            self.parties[party.party_name] = party
+            for politician in party.politicians:
+                self.politicians[politician_registry.key(politician.full_name, party.party_name)] = politician
             
             # Add the party to the simulation
             supervisor.add_party(party)
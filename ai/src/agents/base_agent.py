@@ -1,44 +1,42 @@
-from dotenv import load_dotenv
+import asyncio
 import os
-from langchain.memory import ConversationBufferMemory
-from langchain_openai import ChatOpenAI
+from langchain.memory import ConversationSummaryBufferMemory
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
 from ..utilities.prompt_manager import PromptManager
+from .llm_gateway import llm_gateway
 
 class BaseAgent(ABC):
     """
     Abstract base class for all agents in the AI Parliament system.
     Provides common functionality and defines the interface that all agents must implement.
     """
+    # Token budget of the conversation turns kept verbatim in memory;
+    # older turns are folded into a rolling summary. Overridden per agent type.
+    memory_max_tokens: int = 1000
+    
     def __init__(self):
-        # Load environment variables
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_dir)))
-        
-        # Try to load environment variables from different possible locations
-        env_files = [
-            os.path.join(project_root, '.env'),
-            os.path.join(project_root, '.env.shared'),
-            os.path.join(project_root, '.env.secret')
-        ]
-        
-        for env_file in env_files:
-            if os.path.exists(env_file):
-                load_dotenv(dotenv_path=env_file)
+        # Load environment variables (once per process)
+        llm_gateway.load_environment()
         
         # Initialize LLM and memory
         self.model_name = os.getenv("GPT_MODEL_NAME", "gpt-4o-mini")
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
-        self.memory = ConversationBufferMemory(return_messages=True)
         
-        # Initialize LLM
-        self.llm = ChatOpenAI(
-            model=self.model_name,
+        # Get the shared LLM client for this configuration
+        self.llm = llm_gateway.get_chat_model(
+            self.model_name,
             temperature=0.7,
             max_tokens=2000
         )
         
+        # Sliding window of recent turns plus a rolling summary, capped at memory_max_tokens
+        self.memory = ConversationSummaryBufferMemory(
+            llm=self.llm,
+            max_token_limit=self.memory_max_tokens,
+            return_messages=True
+        )
+        
         # For compatibility with derived classes
         self.model = self.llm
         
@@ -65,6 +63,21 @@ class BaseAgent(ABC):
         """
         pass
     
+    async def aanswer_question(self, question: str) -> str:
+        """
+        Process a question asynchronously and return an answer.
+        
+        Agents with an async LLM path override this; the default runs
+        answer_question in a worker thread so every agent is awaitable.
+        
+        Args:
+            question: The question to answer
+            
+        Returns:
+            A string containing the agent's response
+        """
+        return await asyncio.to_thread(self.answer_question, question)
+    
     @abstractmethod
     def _set_system_prompt(self) -> str:
         """
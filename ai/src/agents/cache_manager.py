@@ -1,144 +1,1054 @@
 # ai/src/agents/cache_manager.py
 import os
+import copy
 import json
-import pickle
+import time
+import zlib
+import sqlite3
+import zipfile
+import argparse
 import hashlib
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+import threading
+import contextvars
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Optional, Dict, Any, Iterable, Tuple, Callable, NamedTuple, List
 from pathlib import Path
 
+# Namespaces of the cached entries
+POLITICIANS = "politicians"
+PARTIES = "parties"
+WIKIPEDIA = "wikipedia"
+NAMESPACES = (POLITICIANS, PARTIES, WIKIPEDIA)
+
+# Failed or empty lookups of the namespaces above, keyed "<namespace>/<key>"
+NEGATIVE = "negative"
+# Bundles imported into the cache, keyed by the checksum of their entries
+BUNDLES = "bundles"
+# Pseudo-namespace of the memory tier holding decompressed Wikipedia page bodies
+WIKIPEDIA_BLOBS = "wikipedia_blobs"
+
+# Format of the archives written by export_bundle (bump the version on incompatible changes)
+BUNDLE_FORMAT = "ai-parliament-cache-bundle"
+BUNDLE_VERSION = 1
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+class CacheEntry(NamedTuple):
+    """A cached entry together with its age"""
+    data: Any
+    updated_at: float
+    stale: bool
+
+
+class MemoryLRUCache:
+    """Bounded in-process LRU of cache entries, limited by total size in bytes and by entry age"""
+
+    def __init__(self, max_size_mb: Optional[float] = None, ttl_seconds: Optional[float] = None):
+        self.max_size_bytes = int(float(max_size_mb if max_size_mb is not None
+                                        else os.getenv("CACHE_MEMORY_MAX_MB", "64")) * 1024 * 1024)
+        self.ttl_seconds = float(ttl_seconds if ttl_seconds is not None
+                                 else os.getenv("CACHE_MEMORY_TTL_SECONDS", "600"))
+
+        self._lock = threading.Lock()
+        # (namespace, key) -> (data, size, updated_at, stored_at, fingerprint)
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[Any, int, float, float, Optional[str]]]" = OrderedDict()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, namespace: str, key: str, min_updated_at: float = 0,
+            fingerprint: Optional[str] = None) -> Optional[Tuple[Any, float]]:
+        """
+        Get a copy of an entry written at or after min_updated_at (and with the given fingerprint, if any),
+        with its updated_at timestamp
+        """
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+            if entry is not None and time.monotonic() - entry[3] > self.ttl_seconds:
+                self._remove((namespace, key))
+                entry = None
+            if entry is None or entry[2] < min_updated_at or (fingerprint is not None and entry[4] != fingerprint):
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end((namespace, key))
+            self.hits += 1
+            data, updated_at = entry[0], entry[2]
+        # Callers mutate what they get back, so the cached object is never handed out
+        return copy.deepcopy(data), updated_at
+
+    def put(self, namespace: str, key: str, data: Any, size: int, updated_at: float,
+            fingerprint: Optional[str] = None):
+        """Store a copy of an entry, evicting least recently used entries above the size limit"""
+        if size > self.max_size_bytes:
+            self.discard(namespace, key)
+            return
+
+        data = copy.deepcopy(data)
+        with self._lock:
+            self._remove((namespace, key))
+            self._entries[(namespace, key)] = (data, size, updated_at, time.monotonic(), fingerprint)
+            self._size += size
+            while self._size > self.max_size_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def discard(self, namespace: str, key: str):
+        """Drop an entry"""
+        with self._lock:
+            self._remove((namespace, key))
+
+    def clear(self):
+        """Drop every entry"""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remove(self, entry_key: Tuple[str, str]):
+        entry = self._entries.pop(entry_key, None)
+        if entry is not None:
+            self._size -= entry[1]
+
+    def get_stats(self) -> Dict:
+        """Get memory tier statistics"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'size_mb': self._size / 1024 / 1024,
+                'max_size_mb': self.max_size_bytes / 1024 / 1024,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': self.hits / lookups if lookups else 0.0
+            }
+
+
 class CacheManager:
-    """Unified cache manager for all agents"""
-    
-    def __init__(self, cache_dir: str = "cache"):
+    """
+    Unified cache manager for all agents, backed by a single SQLite database in WAL mode.
+    Hot entries are served from a write-through in-memory LRU tier.
+
+    The database may be shared by several processes (backend workers and the frontend
+    container mount the same cache volume). Every write runs in a BEGIN IMMEDIATE
+    transaction and waits up to CACHE_BUSY_TIMEOUT_MS for other writers, and
+    read-modify-write changes go through update() so concurrent writers never lose
+    each other's changes.
+
+    Entries derived from LLM output record a fingerprint of the prompt and model that
+    produced them. Lookups with a fingerprint ignore entries made by other versions, and
+    find_outdated()/invalidate_outdated() select exactly those entries.
+
+    Wikipedia page bodies are stored once, zlib-compressed and addressed by their SHA-256,
+    in content_blobs; Wikipedia entries only keep the list of hashes they are made of.
+    Overlapping queries returning the same pages therefore share one copy of each page.
+
+    Lookups that failed or found nothing are recorded as negative entries with their own,
+    much shorter TTL (CACHE_NEGATIVE_TTL_HOURS), so they are not retried on every load.
+
+    Expired entries are kept for CACHE_STALE_MAX_DAYS: get_entry() still returns them
+    (marked stale) so callers can serve them immediately and refresh them in the
+    background with revalidate().
+
+    export_bundle()/import_bundle() copy the persona, party and Wikipedia entries between
+    databases as one zip archive. A bundle named by CACHE_BUNDLE_PATH is merged in when
+    the cache is opened, so images can ship with a pre-warmed cache.
+    """
+
+    def __init__(self, cache_dir: str = "cache", db_path: Optional[str] = None,
+                 memory_cache: Optional[MemoryLRUCache] = None):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
-        
-        # Create subdirectories
-        self.politicians_dir = self.cache_dir / "politicians"
-        self.parties_dir = self.cache_dir / "parties"
-        self.wikipedia_dir = self.cache_dir / "wikipedia"
-        
-        for dir in [self.politicians_dir, self.parties_dir, self.wikipedia_dir]:
-            dir.mkdir(exist_ok=True)
-    
-    def _get_file_age_days(self, file_path: Path) -> float:
-        """Get age of file in days"""
-        if not file_path.exists():
-            return float('inf')
-        
-        file_time = datetime.fromtimestamp(file_path.stat().st_mtime)
-        return (datetime.now() - file_time).days
-    
+        self.db_path = Path(db_path or os.getenv("CACHE_DB_PATH", self.cache_dir / "cache.sqlite"))
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.memory = memory_cache or MemoryLRUCache()
+        self.stale_max_days = float(os.getenv("CACHE_STALE_MAX_DAYS", "365"))
+        self.negative_ttl_hours = float(os.getenv("CACHE_NEGATIVE_TTL_HOURS", "6"))
+        self._negative_hits = 0
+        self._negative_hits_lock = threading.Lock()
+        self._revalidation_executor = ThreadPoolExecutor(
+            max_workers=int(os.getenv("CACHE_REVALIDATE_WORKERS", "2")),
+            thread_name_prefix="cache-revalidate"
+        )
+        self._revalidating = set()
+        self._revalidating_lock = threading.Lock()
+        busy_timeout_ms = int(os.getenv("CACHE_BUSY_TIMEOUT_MS", "30000"))
+        self._lock = threading.Lock()
+        # Autocommit mode: transactions are opened explicitly in _write_transaction
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                     timeout=busy_timeout_ms / 1000, isolation_level=None)
+        self._conn.execute(f"PRAGMA busy_timeout={busy_timeout_ms}")
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                data TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                fingerprint TEXT,
+                PRIMARY KEY (namespace, key)
+            )
+        """)
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(cache_entries)")]
+        if 'fingerprint' not in columns:
+            self._conn.execute("ALTER TABLE cache_entries ADD COLUMN fingerprint TEXT")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_entries_updated_at ON cache_entries(updated_at)")
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cache_entries_namespace_updated_at ON cache_entries(namespace, updated_at)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cache_entries_namespace_fingerprint ON cache_entries(namespace, fingerprint)"
+        )
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS content_blobs (
+                hash TEXT PRIMARY KEY,
+                data BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                compressed_size INTEGER NOT NULL,
+                stored_at REAL NOT NULL
+            )
+        """)
+
+        # Carry over the caches written by the previous one-JSON-file-per-entry layout
+        if self._is_empty():
+            self.import_json_cache(self.cache_dir)
+
+        # Merge a pre-warmed cache shipped with the deployment (once per bundle)
+        bundle_path = os.getenv("CACHE_BUNDLE_PATH")
+        if bundle_path and Path(bundle_path).is_file():
+            try:
+                self.import_bundle(bundle_path, skip_imported=True)
+            except (OSError, ValueError, zipfile.BadZipFile) as e:
+                print(f"⚠️ Could not import cache bundle {bundle_path}: {e}")
+
+    @contextmanager
+    def _write_transaction(self):
+        """Hold the database write lock (across threads and processes) for the duration of the block"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+                self._conn.execute("COMMIT")
+            except BaseException:
+                # Also after a failed COMMIT (e.g. SQLITE_BUSY), which leaves the transaction open
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+                raise
+
+    def _is_empty(self) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM cache_entries LIMIT 1").fetchone() is None
+
+    # ========== GENERIC ACCESS ==========
+
+    def get(self, namespace: str, key: str, max_age_days: Optional[float] = None,
+            fingerprint: Optional[str] = None) -> Optional[Any]:
+        """
+        Get a cached entry.
+
+        Args:
+            namespace: The namespace of the entry (politicians, parties or wikipedia)
+            key: The key of the entry
+            max_age_days: Ignore entries older than this (None accepts any age)
+            fingerprint: Ignore entries made with a different prompt/model version (None accepts any)
+
+        Returns:
+            The cached data, or None if there is no fresh entry
+        """
+        return self.get_many(namespace, [key], max_age_days, fingerprint).get(key)
+
+    def get_entry(self, namespace: str, key: str, max_age_days: float,
+                  fingerprint: Optional[str] = None) -> Optional[CacheEntry]:
+        """
+        Get a cached entry, including one that expired less than CACHE_STALE_MAX_DAYS ago.
+
+        Args:
+            namespace: The namespace of the entry
+            key: The key of the entry
+            max_age_days: Entries older than this are returned marked as stale
+            fingerprint: Ignore entries made with a different prompt/model version (None accepts any)
+
+        Returns:
+            The entry, or None if there is no usable entry
+        """
+        found = self._lookup(namespace, [key], time.time() - self.stale_max_days * SECONDS_PER_DAY, fingerprint)
+        if key not in found:
+            return None
+
+        data, updated_at = found[key]
+        return CacheEntry(data, updated_at, updated_at < time.time() - max_age_days * SECONDS_PER_DAY)
+
+    def get_many(self, namespace: str, keys: Iterable[str], max_age_days: Optional[float] = None,
+                 fingerprint: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get several cached entries with one query.
+
+        Args:
+            namespace: The namespace of the entries
+            keys: The keys to look up
+            max_age_days: Ignore entries older than this (None accepts any age)
+            fingerprint: Ignore entries made with a different prompt/model version (None accepts any)
+
+        Returns:
+            A dictionary with the data of every fresh entry found, by key
+        """
+        min_updated_at = time.time() - max_age_days * SECONDS_PER_DAY if max_age_days is not None else 0
+        return {key: data for key, (data, _) in self._lookup(namespace, keys, min_updated_at, fingerprint).items()}
+
+    def _lookup(self, namespace: str, keys: Iterable[str], min_updated_at: float,
+                fingerprint: Optional[str] = None) -> Dict[str, Tuple[Any, float]]:
+        """Look entries up in the memory tier, then in the database, returning (data, updated_at) by key"""
+        found = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            entry = self.memory.get(namespace, key, min_updated_at, fingerprint)
+            if entry is not None:
+                found[key] = entry
+            else:
+                missing.append(key)
+        if not missing:
+            return found
+
+        placeholders = ", ".join("?" for _ in missing)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT key, data, updated_at, fingerprint FROM cache_entries "
+                f"WHERE namespace = ? AND key IN ({placeholders}) AND updated_at >= ?",
+                (namespace, *missing, min_updated_at)
+            ).fetchall()
+
+        for key, data, updated_at, entry_fingerprint in rows:
+            value = json.loads(data)
+            self.memory.put(namespace, key, value, len(data), updated_at, entry_fingerprint)
+            if fingerprint is None or entry_fingerprint == fingerprint:
+                found[key] = (value, updated_at)
+        return found
+
+    def put(self, namespace: str, key: str, data: Any, fingerprint: Optional[str] = None):
+        """
+        Save an entry to the cache.
+
+        Args:
+            namespace: The namespace of the entry
+            key: The key of the entry
+            data: JSON-serializable data
+            fingerprint: The prompt/model version the data was made with
+        """
+        self.put_many(namespace, {key: data}, fingerprint=fingerprint)
+
+    def put_many(self, namespace: str, items: Dict[str, Any], updated_at: Optional[float] = None,
+                 fingerprint: Optional[str] = None):
+        """
+        Save several entries in one transaction.
+
+        Args:
+            namespace: The namespace of the entries
+            items: The data to save, by key
+            updated_at: Timestamp to record for the entries (defaults to now)
+            fingerprint: The prompt/model version the data was made with
+        """
+        if not items:
+            return
+
+        now = updated_at or time.time()
+        rows = [
+            (namespace, key, json.dumps(data, ensure_ascii=False), now, now, fingerprint)
+            for key, data in items.items()
+        ]
+        with self._write_transaction() as conn:
+            conn.executemany(
+                "INSERT INTO cache_entries (namespace, key, data, created_at, updated_at, fingerprint) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(namespace, key) DO UPDATE SET "
+                "data = excluded.data, updated_at = excluded.updated_at, fingerprint = excluded.fingerprint",
+                rows
+            )
+
+        for _, key, serialized, _, _, _ in rows:
+            self.memory.put(namespace, key, items[key], len(serialized), now, fingerprint)
+
+    def delete(self, namespace: str, key: str) -> bool:
+        """
+        Remove an entry from the cache.
+
+        Args:
+            namespace: The namespace of the entry
+            key: The key of the entry
+
+        Returns:
+            True if an entry was removed
+        """
+        self.memory.discard(namespace, key)
+        with self._write_transaction() as conn:
+            cursor = conn.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND key = ?", (namespace, key)
+            )
+        return cursor.rowcount > 0
+
+    def find_outdated(self, namespace: str, fingerprint: str) -> Dict[str, Any]:
+        """
+        Get the entries of a namespace made with a prompt/model version other than the current one.
+
+        Args:
+            namespace: The namespace of the entries
+            fingerprint: The current fingerprint
+
+        Returns:
+            The data of every outdated entry (including entries without a fingerprint), by key
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, data FROM cache_entries "
+                "WHERE namespace = ? AND (fingerprint IS NULL OR fingerprint != ?)",
+                (namespace, fingerprint)
+            ).fetchall()
+        return {key: json.loads(data) for key, data in rows}
+
+    def invalidate_outdated(self, namespace: str, fingerprint: str) -> int:
+        """
+        Remove the entries of a namespace made with a prompt/model version other than the current one.
+
+        Args:
+            namespace: The namespace of the entries
+            fingerprint: The current fingerprint
+
+        Returns:
+            The number of removed entries
+        """
+        with self._write_transaction() as conn:
+            cursor = conn.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND (fingerprint IS NULL OR fingerprint != ?)",
+                (namespace, fingerprint)
+            )
+        self.memory.clear()
+
+        print(f"🧹 Invalidated {cursor.rowcount} outdated {namespace} cache entries")
+        return cursor.rowcount
+
+    def touch(self, namespace: str, key: str):
+        """
+        Mark an entry as fresh without changing its data (e.g. after confirming the source is unchanged).
+
+        Args:
+            namespace: The namespace of the entry
+            key: The key of the entry
+        """
+        self.memory.discard(namespace, key)
+        with self._write_transaction() as conn:
+            conn.execute(
+                "UPDATE cache_entries SET updated_at = ? WHERE namespace = ? AND key = ?",
+                (time.time(), namespace, key)
+            )
+
+    def revalidate(self, namespace: str, key: str, refresh: Callable[..., Any], *args) -> bool:
+        """
+        Refresh a stale entry in the background.
+
+        Args:
+            namespace: The namespace of the entry
+            key: The key of the entry
+            refresh: Function that recomputes the entry and saves it to the cache
+            *args: Arguments passed to refresh
+
+        Returns:
+            False if a refresh of the entry is already pending
+        """
+        with self._revalidating_lock:
+            if (namespace, key) in self._revalidating:
+                return False
+            self._revalidating.add((namespace, key))
+
+        # Copy the caller's context so tracing and per-simulation settings follow the refresh
+        self._revalidation_executor.submit(
+            contextvars.copy_context().run,
+            self._run_revalidation, namespace, key, refresh, *args
+        )
+        return True
+
+    def _run_revalidation(self, namespace: str, key: str, refresh: Callable[..., Any], *args):
+        try:
+            print(f"♻️ Refreshing stale cache entry {namespace}/{key[:50]}")
+            refresh(*args)
+        except Exception as e:
+            print(f"⚠️ Could not refresh cache entry {namespace}/{key[:50]}, keeping the stale copy: {e}")
+        finally:
+            with self._revalidating_lock:
+                self._revalidating.discard((namespace, key))
+
+    def pending_revalidations(self) -> List[Tuple[str, str]]:
+        """Get the entries currently being refreshed in the background"""
+        with self._revalidating_lock:
+            return list(self._revalidating)
+
+    def update(self, namespace: str, key: str, updater: Callable[[Optional[Any]], Any]) -> Any:
+        """
+        Atomically read, modify and write an entry.
+
+        The current value is always read from the database inside the write transaction,
+        so changes made by other threads or processes in the meantime are never overwritten.
+
+        Args:
+            namespace: The namespace of the entry
+            key: The key of the entry
+            updater: Function receiving the current data (None if missing) and returning the new data
+
+        Returns:
+            The new data
+        """
+        with self._write_transaction() as conn:
+            row = conn.execute(
+                "SELECT data, fingerprint FROM cache_entries WHERE namespace = ? AND key = ?", (namespace, key)
+            ).fetchone()
+            data = updater(json.loads(row[0]) if row else None)
+            serialized = json.dumps(data, ensure_ascii=False)
+            now = time.time()
+            conn.execute(
+                "INSERT INTO cache_entries (namespace, key, data, created_at, updated_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(namespace, key) DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at",
+                (namespace, key, serialized, now, now)
+            )
+
+        self.memory.put(namespace, key, data, len(serialized), now, row[1] if row else None)
+        return data
+
+    # ========== NEGATIVE CACHING ==========
+
+    def save_negative(self, namespace: str, key: str, reason: str):
+        """
+        Record that a lookup failed or found nothing.
+
+        Args:
+            namespace: The namespace of the entry that could not be built
+            key: The key of the entry
+            reason: Why the lookup failed
+        """
+        self.put(NEGATIVE, f"{namespace}/{key}", {
+            'namespace': namespace,
+            'key': key,
+            'reason': reason,
+            'cached_at': datetime.now().isoformat()
+        })
+
+    def get_negative(self, namespace: str, key: str) -> Optional[str]:
+        """
+        Check whether a lookup failed recently.
+
+        Args:
+            namespace: The namespace of the entry
+            key: The key of the entry
+
+        Returns:
+            The reason of the failure, or None if the lookup may be tried
+        """
+        data = self.get(NEGATIVE, f"{namespace}/{key}", self.negative_ttl_hours / 24)
+        if data is None:
+            return None
+
+        with self._negative_hits_lock:
+            self._negative_hits += 1
+        return data['reason']
+
+    def clear_negative(self, namespace: str, key: str) -> bool:
+        """
+        Forget that a lookup failed, so the next load tries it again.
+
+        Args:
+            namespace: The namespace of the entry
+            key: The key of the entry
+
+        Returns:
+            True if a failure was recorded
+        """
+        return self.delete(NEGATIVE, f"{namespace}/{key}")
+
     # ========== POLITICIAN CACHING ==========
-    
-    def get_politician_cache_path(self, first_name: str, last_name: str, party: str) -> Path:
-        """Get cache file path for politician"""
-        key = f"{first_name}_{last_name}_{party}".lower().replace(" ", "_")
-        return self.politicians_dir / f"{key}.json"
-    
-    def get_politician(self, first_name: str, last_name: str, party: str, max_age_days: int = 30) -> Optional[Dict]:
-        """Get cached politician data"""
-        cache_path = self.get_politician_cache_path(first_name, last_name, party)
-        
-        if cache_path.exists() and self._get_file_age_days(cache_path) < max_age_days:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return None
-    
-    def save_politician(self, first_name: str, last_name: str, party: str, data: Dict):
-        """Save politician data to cache"""
-        cache_path = self.get_politician_cache_path(first_name, last_name, party)
-        
+
+    @staticmethod
+    def get_politician_key(first_name: str, last_name: str, party: str) -> str:
+        """Get cache key for politician"""
+        return f"{first_name}_{last_name}_{party}".lower().replace(" ", "_")
+
+    def get_politician(self, first_name: str, last_name: str, party: str, max_age_days: int = 30,
+                       fingerprint: Optional[str] = None) -> Optional[Dict]:
+        """Get cached politician data (made with the given prompt/model fingerprint, if any)"""
+        return self.get(POLITICIANS, self.get_politician_key(first_name, last_name, party), max_age_days, fingerprint)
+
+    def save_politician(self, first_name: str, last_name: str, party: str, data: Dict,
+                        fingerprint: Optional[str] = None):
+        """Save politician data to cache, recording the prompt/model fingerprint it was made with"""
         data['cached_at'] = datetime.now().isoformat()
-        data['cache_version'] = '1.0'
-        
-        with open(cache_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-    
+        data['cache_version'] = fingerprint or '1.0'
+
+        self.put(POLITICIANS, self.get_politician_key(first_name, last_name, party), data, fingerprint)
+
+    def get_politician_entry(self, first_name: str, last_name: str, party: str, max_age_days: int = 30,
+                             fingerprint: Optional[str] = None) -> Optional[CacheEntry]:
+        """Get cached politician data, including a stale copy"""
+        return self.get_entry(
+            POLITICIANS, self.get_politician_key(first_name, last_name, party), max_age_days, fingerprint
+        )
+
+    def delete_politician(self, first_name: str, last_name: str, party: str) -> bool:
+        """Remove cached politician data"""
+        return self.delete(POLITICIANS, self.get_politician_key(first_name, last_name, party))
+
     # ========== PARTY CACHING ==========
-    
-    def get_party_cache_path(self, party_name: str, acronym: str) -> Path:
-        """Get cache file path for party"""
-        key = f"{party_name}_{acronym}".lower().replace(" ", "_")
-        return self.parties_dir / f"{key}.json"
-    
+
+    @staticmethod
+    def get_party_key(party_name: str, acronym: str) -> str:
+        """Get cache key for party"""
+        return f"{party_name}_{acronym}".lower().replace(" ", "_")
+
     def get_party(self, party_name: str, acronym: str, max_age_days: int = 30) -> Optional[Dict]:
         """Get cached party data"""
-        cache_path = self.get_party_cache_path(party_name, acronym)
-        
-        if cache_path.exists() and self._get_file_age_days(cache_path) < max_age_days:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return None
-    
+        return self.get(PARTIES, self.get_party_key(party_name, acronym), max_age_days)
+
+    def get_party_entry(self, party_name: str, acronym: str, max_age_days: int = 30) -> Optional[CacheEntry]:
+        """Get cached party data, including a stale copy"""
+        return self.get_entry(PARTIES, self.get_party_key(party_name, acronym), max_age_days)
+
+    def save_party_info(self, party_name: str, acronym: str, party_info: str) -> Dict:
+        """Save party information to cache, keeping the cached politicians"""
+        def set_party_info(data: Optional[Dict]) -> Dict:
+            data = data or {'politicians_data': []}
+            data['party_info'] = party_info
+            data['party_info_found'] = True
+            data['cached_at'] = datetime.now().isoformat()
+            data['cache_version'] = '1.0'
+            return data
+
+        return self.update(PARTIES, self.get_party_key(party_name, acronym), set_party_info)
+
     def save_party(self, party_name: str, acronym: str, data: Dict):
         """Save party data to cache"""
-        cache_path = self.get_party_cache_path(party_name, acronym)
-        
         data['cached_at'] = datetime.now().isoformat()
         data['cache_version'] = '1.0'
-        
-        with open(cache_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-    
+
+        self.put(PARTIES, self.get_party_key(party_name, acronym), data)
+
+    def add_party_politician(self, party_name: str, acronym: str, party_info: str, politician_data: Dict,
+                             party_info_found: bool = True) -> Dict:
+        """
+        Add a politician to the cached party data (a politician already listed is replaced).
+
+        Args:
+            party_name: The name of the party
+            acronym: The acronym of the party
+            party_info: The party information, used if the party is not cached yet
+            politician_data: The politician's entry, identified by its full_name
+            party_info_found: False if party_info is only a placeholder for a failed lookup
+
+        Returns:
+            The updated party data
+        """
+        def add_politician(data: Optional[Dict]) -> Dict:
+            data = data or {'party_info': party_info, 'party_info_found': party_info_found, 'politicians_data': []}
+            data['politicians_data'] = [
+                entry for entry in data.get('politicians_data', [])
+                if entry.get('full_name') != politician_data['full_name']
+            ] + [politician_data]
+            data['cached_at'] = datetime.now().isoformat()
+            data['cache_version'] = '1.0'
+            return data
+
+        return self.update(PARTIES, self.get_party_key(party_name, acronym), add_politician)
+
     # ========== WIKIPEDIA CACHING ==========
-    
-    def get_wikipedia_cache_path(self, query: str) -> Path:
-        """Get cache file path for Wikipedia query"""
-        # Create a hash of the query for filename
-        query_hash = hashlib.md5(query.encode()).hexdigest()[:12]
-        safe_query = "".join(c for c in query if c.isalnum() or c in (' ', '-'))[:50]
-        return self.wikipedia_dir / f"{safe_query}_{query_hash}.json"
-    
+
     def get_wikipedia(self, query: str, max_age_days: int = 7) -> Optional[str]:
         """Get cached Wikipedia result"""
-        cache_path = self.get_wikipedia_cache_path(query)
-        
-        if cache_path.exists() and self._get_file_age_days(cache_path) < max_age_days:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return data['content']
-        return None
-    
-    def save_wikipedia(self, query: str, content: str):
-        """Save Wikipedia result to cache"""
-        cache_path = self.get_wikipedia_cache_path(query)
-        
+        data = self.get(WIKIPEDIA, query, max_age_days)
+        return self._resolve_wikipedia(data)['content'] if data else None
+
+    def get_wikipedia_entry(self, query: str, max_age_days: int = 7) -> Optional[CacheEntry]:
+        """Get cached Wikipedia result (content and page revisions), including a stale copy"""
+        entry = self.get_entry(WIKIPEDIA, query, max_age_days)
+        return entry._replace(data=self._resolve_wikipedia(entry.data)) if entry else None
+
+    def save_wikipedia(self, query: str, content: str, revisions: Optional[Dict[str, int]] = None,
+                       sections: Optional[List[str]] = None):
+        """
+        Save Wikipedia result to cache, with the revision IDs of the pages it was built from.
+
+        Args:
+            query: The search query
+            content: The result returned for the query
+            revisions: The revision ID of every page in the result, by title
+            sections: The per-page parts content is made of (joined by blank lines, then truncated);
+                      each is stored once however many queries return it
+        """
         data = {
             'query': query,
             'content': content,
+            'sections': sections,
+            'revisions': revisions or {},
             'cached_at': datetime.now().isoformat()
         }
-        
-        with open(cache_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-    
+
+        self.put(WIKIPEDIA, query, self._compact_wikipedia(data))
+
+    def _compact_wikipedia(self, data: Dict) -> Dict:
+        """Move the content of a Wikipedia entry to the blob store, leaving the hashes of its parts"""
+        data = dict(data)
+        content = data.pop('content', None)
+        sections = data.pop('sections', None) or ([content] if content is not None else [])
+        data['blobs'] = self._put_blobs(sections)
+        data['max_chars'] = len(content) if content is not None else None
+        return data
+
+    def _resolve_wikipedia(self, data: Dict) -> Dict:
+        """Rebuild the content of a Wikipedia entry from the blob store"""
+        if 'content' in data or 'blobs' not in data:
+            return data
+
+        blobs = self._get_blobs(data['blobs'])
+        content = "\n\n".join(blobs[blob_hash] for blob_hash in data['blobs'])
+        data['content'] = content[:data['max_chars']] if data.get('max_chars') is not None else content
+        return data
+
+    def _put_blobs(self, texts: List[str]) -> List[str]:
+        """Store texts compressed and content-addressed, returning their hashes"""
+        hashes = []
+        rows = []
+        now = time.time()
+        for text in texts:
+            raw = text.encode('utf-8')
+            blob_hash = hashlib.sha256(raw).hexdigest()
+            compressed = zlib.compress(raw, 6)
+            hashes.append(blob_hash)
+            rows.append((blob_hash, compressed, len(raw), len(compressed), now))
+
+        if rows:
+            with self._write_transaction() as conn:
+                # Re-storing an existing blob refreshes stored_at, which protects it from collect_garbage
+                # until the entry referencing it is written
+                conn.executemany(
+                    "INSERT INTO content_blobs (hash, data, size, compressed_size, stored_at) VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT(hash) DO UPDATE SET stored_at = excluded.stored_at",
+                    rows
+                )
+        return hashes
+
+    def _get_blobs(self, hashes: List[str]) -> Dict[str, str]:
+        """Get decompressed texts by hash, from the memory tier or the database"""
+        texts = {}
+        missing = []
+        for blob_hash in dict.fromkeys(hashes):
+            entry = self.memory.get(WIKIPEDIA_BLOBS, blob_hash)
+            if entry is not None:
+                texts[blob_hash] = entry[0]
+            else:
+                missing.append(blob_hash)
+
+        if missing:
+            placeholders = ", ".join("?" for _ in missing)
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT hash, data, stored_at FROM content_blobs WHERE hash IN ({placeholders})", missing
+                ).fetchall()
+            for blob_hash, data, stored_at in rows:
+                texts[blob_hash] = zlib.decompress(data).decode('utf-8')
+                self.memory.put(WIKIPEDIA_BLOBS, blob_hash, texts[blob_hash], len(texts[blob_hash]), stored_at)
+
+        # A part lost to garbage collection reads as empty rather than failing the lookup
+        return {blob_hash: texts.get(blob_hash, '') for blob_hash in hashes}
+
+    def collect_garbage(self, min_age_seconds: float = 3600) -> int:
+        """
+        Remove blobs no longer referenced by any Wikipedia entry.
+
+        Args:
+            min_age_seconds: Keep blobs stored more recently than this (their entry may still be being written)
+
+        Returns:
+            The number of removed blobs
+        """
+        with self._write_transaction() as conn:
+            cursor = conn.execute("""
+                DELETE FROM content_blobs WHERE stored_at < ? AND hash NOT IN (
+                    SELECT refs.value FROM cache_entries, json_each(cache_entries.data, '$.blobs') AS refs
+                    WHERE cache_entries.namespace = ?
+                )
+            """, (time.time() - min_age_seconds, WIKIPEDIA))
+        return cursor.rowcount
+
     # ========== CACHE MANAGEMENT ==========
-    
-    def clear_old_cache(self, max_age_days: int = 30):
-        """Clear cache files older than specified days"""
-        cleared = 0
-        for dir in [self.politicians_dir, self.parties_dir, self.wikipedia_dir]:
-            for file in dir.glob("*.json"):
-                if self._get_file_age_days(file) > max_age_days:
-                    file.unlink()
-                    cleared += 1
-        
-        print(f"🧹 Cleared {cleared} old cache files")
+
+    def import_json_cache(self, cache_dir: str) -> int:
+        """
+        Import caches stored as one JSON file per entry (cache_dir/<namespace>/*.json).
+
+        Entries keep their original age: the cached_at field, or the file's modification time.
+
+        Args:
+            cache_dir: The directory containing the politicians, parties and wikipedia subdirectories
+
+        Returns:
+            The number of imported entries
+        """
+        imported = 0
+        for namespace in NAMESPACES:
+            namespace_dir = Path(cache_dir) / namespace
+            if not namespace_dir.is_dir():
+                continue
+
+            for file in namespace_dir.glob("*.json"):
+                try:
+                    with open(file, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                except (OSError, ValueError) as e:
+                    print(f"⚠️ Skipping unreadable cache file {file}: {e}")
+                    continue
+
+                # Wikipedia files are named after a hash, the query itself is stored inside
+                key = data.get('query', file.stem) if namespace == WIKIPEDIA else file.stem
+                if namespace == WIKIPEDIA:
+                    data = self._compact_wikipedia(data)
+                self.put_many(namespace, {key: data}, updated_at=self._json_entry_timestamp(file, data))
+                imported += 1
+
+        if imported:
+            print(f"📦 Imported {imported} cache entries from {cache_dir}")
+        return imported
+
+    @staticmethod
+    def _json_entry_timestamp(file: Path, data: Dict) -> float:
+        """Get when a JSON cache entry was written"""
+        try:
+            return datetime.fromisoformat(data['cached_at']).timestamp()
+        except (KeyError, TypeError, ValueError):
+            return file.stat().st_mtime
+
+    def export_bundle(self, path: str, namespaces: Iterable[str] = NAMESPACES) -> Dict:
+        """
+        Pack cache entries into a versioned zip archive.
+
+        The archive holds manifest.json (format, version, counts and the SHA-256 of entries.jsonl),
+        entries.jsonl (one entry per line, with its timestamps and fingerprint) and the Wikipedia
+        page bodies the entries refer to as blobs/<sha256>.
+
+        Args:
+            path: The archive to write
+            namespaces: The namespaces to export (negative entries are never worth shipping)
+
+        Returns:
+            The manifest of the archive
+        """
+        namespaces = list(namespaces)
+        placeholders = ", ".join("?" for _ in namespaces)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT namespace, key, data, created_at, updated_at, fingerprint FROM cache_entries "
+                f"WHERE namespace IN ({placeholders}) ORDER BY namespace, key",
+                namespaces
+            ).fetchall()
+
+        lines = []
+        counts = {namespace: 0 for namespace in namespaces}
+        blob_hashes = set()
+        for namespace, key, data, created_at, updated_at, fingerprint in rows:
+            lines.append(json.dumps({
+                'namespace': namespace, 'key': key, 'data': json.loads(data),
+                'created_at': created_at, 'updated_at': updated_at, 'fingerprint': fingerprint
+            }, ensure_ascii=False))
+            counts[namespace] += 1
+            if namespace == WIKIPEDIA:
+                blob_hashes.update(json.loads(data).get('blobs', []))
+        entries = ("\n".join(lines) + "\n").encode('utf-8') if lines else b""
+
+        # Parts lost to garbage collection read as empty and are left out
+        blobs = {
+            blob_hash: text for blob_hash, text in self._get_blobs(sorted(blob_hashes)).items()
+            if hashlib.sha256(text.encode('utf-8')).hexdigest() == blob_hash
+        }
+        manifest = {
+            'format': BUNDLE_FORMAT,
+            'version': BUNDLE_VERSION,
+            'created_at': datetime.now().isoformat(),
+            'counts': counts,
+            'blobs': len(blobs),
+            'entries_sha256': hashlib.sha256(entries).hexdigest()
+        }
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with zipfile.ZipFile(tmp_path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("manifest.json", json.dumps(manifest, indent=2))
+            archive.writestr("entries.jsonl", entries)
+            for blob_hash, text in blobs.items():
+                archive.writestr(f"blobs/{blob_hash}", text.encode('utf-8'))
+        tmp_path.replace(path)
+
+        print(f"📦 Exported {len(rows)} cache entries and {len(blobs)} blobs to {path}")
+        return manifest
+
+    def import_bundle(self, path: str, skip_imported: bool = False) -> Dict:
+        """
+        Merge an archive written by export_bundle into the cache.
+
+        An entry replaces the local one only if it was updated more recently, so importing
+        never throws away fresher local research. The archive is verified before anything
+        is written.
+
+        Args:
+            path: The archive to read
+            skip_imported: Do nothing if this bundle was already imported
+
+        Returns:
+            The number of entries added, updated and skipped (local copy as new or newer), and of blobs
+
+        Raises:
+            ValueError: If the archive has another format, a newer version or fails its checksums
+        """
+        with zipfile.ZipFile(path) as archive:
+            manifest = json.loads(archive.read("manifest.json"))
+            if manifest.get('format') != BUNDLE_FORMAT:
+                raise ValueError(f"{path} is not a cache bundle")
+            if manifest.get('version', 0) > BUNDLE_VERSION:
+                raise ValueError(f"Cache bundle version {manifest.get('version')} is newer than "
+                                 f"supported version {BUNDLE_VERSION}")
+
+            bundle_id = manifest['entries_sha256']
+            if skip_imported and self.get(BUNDLES, bundle_id) is not None:
+                return {'added': 0, 'updated': 0, 'skipped': 0, 'blobs': 0, 'already_imported': True}
+
+            entries = archive.read("entries.jsonl")
+            if hashlib.sha256(entries).hexdigest() != bundle_id:
+                raise ValueError(f"Cache bundle {path} is corrupted (entries checksum mismatch)")
+
+            blob_rows = []
+            now = time.time()
+            for name in archive.namelist():
+                if not name.startswith("blobs/"):
+                    continue
+                raw = archive.read(name)
+                blob_hash = name[len("blobs/"):]
+                if hashlib.sha256(raw).hexdigest() != blob_hash:
+                    raise ValueError(f"Cache bundle {path} is corrupted (blob {blob_hash} checksum mismatch)")
+                compressed = zlib.compress(raw, 6)
+                blob_rows.append((blob_hash, compressed, len(raw), len(compressed), now))
+
+        rows = []
+        for line in entries.decode('utf-8').splitlines():
+            if not line:
+                continue
+            entry = json.loads(line)
+            rows.append((
+                entry['namespace'], entry['key'], json.dumps(entry['data'], ensure_ascii=False),
+                entry['created_at'], entry['updated_at'], entry.get('fingerprint')
+            ))
+
+        with self._write_transaction() as conn:
+            conn.executemany(
+                "INSERT INTO content_blobs (hash, data, size, compressed_size, stored_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(hash) DO UPDATE SET stored_at = excluded.stored_at",
+                blob_rows
+            )
+            added = updated = 0
+            for row in rows:
+                exists = conn.execute(
+                    "SELECT 1 FROM cache_entries WHERE namespace = ? AND key = ?", row[:2]
+                ).fetchone() is not None
+                cursor = conn.execute(
+                    "INSERT INTO cache_entries (namespace, key, data, created_at, updated_at, fingerprint) "
+                    "VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(namespace, key) DO UPDATE SET "
+                    "data = excluded.data, updated_at = excluded.updated_at, fingerprint = excluded.fingerprint "
+                    "WHERE excluded.updated_at > cache_entries.updated_at",
+                    row
+                )
+                if cursor.rowcount:
+                    if exists:
+                        updated += 1
+                    else:
+                        added += 1
+        self.memory.clear()
+
+        result = {'added': added, 'updated': updated, 'skipped': len(rows) - added - updated, 'blobs': len(blob_rows)}
+        self.put(BUNDLES, bundle_id, {
+            'path': str(path), 'created_at': manifest.get('created_at'),
+            'imported_at': datetime.now().isoformat(), **result
+        })
+        print(f"📦 Imported cache bundle {path}: {added} added, {updated} updated, {result['skipped']} kept")
+        return result
+
+    def clear_old_cache(self, max_age_days: Optional[float] = None):
+        """
+        Clear cache entries older than specified days.
+
+        Args:
+            max_age_days: Entries not updated for this many days are removed (defaults to
+                          CACHE_STALE_MAX_DAYS, so entries still served while revalidated are kept)
+        """
+        if max_age_days is None:
+            max_age_days = self.stale_max_days
+        with self._write_transaction() as conn:
+            cursor = conn.execute(
+                "DELETE FROM cache_entries WHERE updated_at < ?",
+                (time.time() - max_age_days * SECONDS_PER_DAY,)
+            )
+            cleared = cursor.rowcount
+            # Negative entries are useless once expired
+            cursor = conn.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND updated_at < ?",
+                (NEGATIVE, time.time() - self.negative_ttl_hours * 3600)
+            )
+            cleared += cursor.rowcount
+        self.memory.clear()
+        self.collect_garbage()
+
+        print(f"🧹 Cleared {cleared} old cache entries")
         return cleared
-    
+
     def get_cache_stats(self) -> Dict:
         """Get cache statistics"""
-        stats = {
-            'politicians': len(list(self.politicians_dir.glob("*.json"))),
-            'parties': len(list(self.parties_dir.glob("*.json"))),
-            'wikipedia': len(list(self.wikipedia_dir.glob("*.json"))),
-            'total_size_mb': sum(
-                f.stat().st_size for f in self.cache_dir.rglob("*.json")
-            ) / 1024 / 1024
+        with self._lock:
+            counts = dict(self._conn.execute(
+                "SELECT namespace, COUNT(*) FROM cache_entries GROUP BY namespace"
+            ).fetchall())
+            page_count = self._conn.execute("PRAGMA page_count").fetchone()[0]
+            page_size = self._conn.execute("PRAGMA page_size").fetchone()[0]
+            negative_active = self._conn.execute(
+                "SELECT COUNT(*) FROM cache_entries WHERE namespace = ? AND updated_at >= ?",
+                (NEGATIVE, time.time() - self.negative_ttl_hours * 3600)
+            ).fetchone()[0]
+            blobs, blob_size, blob_compressed_size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(compressed_size), 0) FROM content_blobs"
+            ).fetchone()
+
+        stats = {namespace: counts.get(namespace, 0) for namespace in NAMESPACES}
+        stats['total_size_mb'] = page_count * page_size / 1024 / 1024
+        stats['content_blobs'] = {
+            'count': blobs,
+            'size_mb': blob_size / 1024 / 1024,
+            'compressed_size_mb': blob_compressed_size / 1024 / 1024
+        }
+        stats['negative'] = {
+            'active': negative_active,
+            'hits': self._negative_hits,
+            'ttl_hours': self.negative_ttl_hours
         }
+        stats['memory'] = self.memory.get_stats()
+        stats['revalidating'] = len(self.pending_revalidations())
         return stats
 
 # Create global cache instance
-cache_manager = CacheManager()
\ No newline at end of file
+cache_manager = CacheManager()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export or import a portable cache bundle")
+    parser.add_argument("command", choices=["export", "import"])
+    parser.add_argument("path", help="The bundle archive (e.g. cache_bundle.zip)")
+    args = parser.parse_args()
+
+    if args.command == "export":
+        cache_manager.export_bundle(args.path)
+    else:
+        cache_manager.import_bundle(args.path)
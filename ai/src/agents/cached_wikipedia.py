@@ -1,38 +1,77 @@
 # ai/src/agents/cached_wikipedia.py
-from langchain_community.tools import WikipediaQueryRun
-from langchain_community.utilities import WikipediaAPIWrapper
+from typing import Optional
 from langchain_core.tools import Tool
-from .cache_manager import CacheManager
+from .cache_manager import CacheManager, WIKIPEDIA
+from .single_flight import single_flight
+from .wikipedia_client import WikipediaClient, NO_RESULT
 
 class CachedWikipediaTool:
     """Wikipedia tool with built-in caching"""
-    
-    def __init__(self, cache_manager: CacheManager, lang: str = "pl"):
+
+    def __init__(self, cache_manager: CacheManager, lang: str = "pl", client: Optional[WikipediaClient] = None):
         self.cache_manager = cache_manager
-        self.wiki_wrapper = WikipediaAPIWrapper(lang=lang)
-        self.base_tool = WikipediaQueryRun(api_wrapper=self.wiki_wrapper)
-    
+        self.client = client or WikipediaClient(lang=lang)
+
     def search(self, query: str) -> str:
         """Search Wikipedia with caching"""
-        # Check cache first
+        # Check cache first (an expired result is served right away and refreshed in the background)
+        cached_entry = self.cache_manager.get_wikipedia_entry(query)
+        if cached_entry:
+            print(f"📚 Wikipedia cache hit: {query[:50]}...")
+            if cached_entry.stale and not self.cache_manager.get_negative(WIKIPEDIA, query):
+                self.cache_manager.revalidate(WIKIPEDIA, query, self._revalidate, query, cached_entry.data)
+            return cached_entry.data['content']
+
+        # Queries that failed or found nothing recently are not retried until their negative entry expires
+        failure = self.cache_manager.get_negative(WIKIPEDIA, query)
+        if failure:
+            print(f"📭 Wikipedia negative cache hit: {query[:50]}... ({failure})")
+            return NO_RESULT
+
+        # If not cached, fetch from Wikipedia (identical concurrent searches share one API call)
+        return single_flight.do(("wikipedia", query), self._fetch, query)
+
+    def _fetch(self, query: str) -> str:
+        """Fetch a result from Wikipedia and cache it, unless a search that just finished already did"""
         cached_result = self.cache_manager.get_wikipedia(query)
         if cached_result:
-            print(f"📚 Wikipedia cache hit: {query[:50]}...")
             return cached_result
-        
-        # If not cached, fetch from Wikipedia
+        if self.cache_manager.get_negative(WIKIPEDIA, query):
+            return NO_RESULT
+
+        return self._download(query)
+
+    def _download(self, query: str) -> str:
+        """Fetch a result from the Wikipedia API and save it to the cache"""
         print(f"🔍 Wikipedia API call: {query[:50]}...")
-        result = self.base_tool.run(query)
-        
-        # Save to cache
-        self.cache_manager.save_wikipedia(query, result)
-        
+        try:
+            sections, revisions = self.client.run_sections(query)
+        except Exception as e:
+            self.cache_manager.save_negative(WIKIPEDIA, query, f"lookup failed: {e}")
+            raise
+        if not sections:
+            self.cache_manager.save_negative(WIKIPEDIA, query, "no results")
+            return NO_RESULT
+        result = self.client.join_sections(sections)
+
+        # Save to cache (each page is stored once, however many queries return it)
+        self.cache_manager.save_wikipedia(query, result, revisions, sections)
+
         return result
-    
+
+    def _revalidate(self, query: str, cached_data: dict):
+        """Refresh a stale result, downloading it again only if one of its pages changed"""
+        revisions = cached_data.get('revisions')
+        if revisions and self.client.get_revisions(list(revisions)) == revisions:
+            self.cache_manager.touch(WIKIPEDIA, query)
+            return
+
+        self._download(query)
+
     def as_tool(self) -> Tool:
         """Return as LangChain tool"""
         return Tool(
             name="Wikipedia",
             func=self.search,
             description="Search Wikipedia. Input should be a search query."
-        )
\ No newline at end of file
+        )
@@ -0,0 +1,278 @@
+# ai/src/agents/fake_llm.py
+"""
+Offline stand-ins for the OpenAI chat model.
+
+Selected through the LLM_BACKEND environment variable (see llm_gateway):
+- "fake":   deterministic synthetic answers with configurable latency (LLM_FAKE_LATENCY_MS)
+- "record": calls the real model and appends every response to a cassette (LLM_CASSETTE_PATH)
+- "replay": answers from a recorded cassette without touching the network
+
+Synthetic answers follow the formats the simulation parses (POSITION/ARGUMENT lines,
+I SUPPORT / I DO NOT SUPPORT, FOR/AGAINST/ABSTAIN), so a full simulation runs end to end.
+"""
+import os
+import json
+import time
+import asyncio
+import hashlib
+import logging
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, ChatResult, LLMResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+logger = logging.getLogger(__name__)
+
+
+def _hash_messages(messages: List[BaseMessage], **kwargs: Any) -> str:
+    """Stable hash of a request (messages plus bound options such as tools)"""
+    payload = json.dumps(
+        [[message_to_dict(message) for message in messages], kwargs],
+        sort_keys=True, ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+def synthetic_answer(messages: List[BaseMessage]) -> str:
+    """
+    Build a deterministic answer for a request.
+
+    The stance is derived from the hash of the whole request, so the same
+    conversation always gets the same answer.
+    """
+    digest = _hash_messages(messages)
+    supports = int(digest[:8], 16) % 2 == 0
+    question = str(messages[-1].content) if messages else ""
+    upper_question = question.upper()
+    topic = " ".join(question.split())[:160]
+
+    if "FOR, AGAINST, OR ABSTAIN" in upper_question:
+        return ["FOR", "AGAINST", "ABSTAIN"][int(digest[8:16], 16) % 3]
+
+    if "POSITION:" in upper_question:
+        return (
+            f"POSITION: {'SUPPORTS' if supports else 'DOES NOT SUPPORT'}\n"
+            f"ARGUMENT 1: The bill's impact on the public budget ({digest[:6]}).\n"
+            f"ARGUMENT 2: Consistency with the party programme.\n"
+            f"ARGUMENT 3: Expected effect on citizens' everyday lives."
+        )
+
+    if "VOTES FOR/AGAINST" in upper_question:
+        return (
+            f"Having weighed the arguments of this debate, our position is settled. "
+            f"The party VOTES {'FOR' if supports else 'AGAINST'} the bill."
+        )
+
+    if "I SUPPORT" in upper_question:
+        return (
+            f"{'I SUPPORT' if supports else 'I DO NOT SUPPORT'} this bill. "
+            f"My assessment follows from my programme and the arguments raised so far ({digest[:6]})."
+        )
+
+    stance = "support" if supports else "do not support"
+    return f"I {stance} the proposal as presented. Regarding: {topic}"
+
+
+class FakeParliamentChatModel(BaseChatModel):
+    """Deterministic chat model producing synthetic parliamentary answers after a configurable delay"""
+
+    latency_ms: float = 0.0
+    model_name: str = "fake-parliament"
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-parliament"
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return {"model_name": self.model_name, "latency_ms": self.latency_ms}
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        return self._result(messages)
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        if self.latency_ms:
+            await asyncio.sleep(self.latency_ms / 1000)
+        return self._result(messages)
+
+    def _result(self, messages: List[BaseMessage]) -> ChatResult:
+        content = synthetic_answer(messages)
+        prompt_tokens = sum(_estimate_tokens(str(message.content)) for message in messages)
+        completion_tokens = _estimate_tokens(content)
+        message = AIMessage(
+            content=content,
+            usage_metadata={
+                "input_tokens": prompt_tokens,
+                "output_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
+            }
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> "FakeParliamentChatModel":
+        """Synthetic answers never call tools, so binding them is a no-op"""
+        return self
+
+    def get_num_tokens(self, text: str) -> int:
+        return _estimate_tokens(text)
+
+    def get_num_tokens_from_messages(self, messages: List[BaseMessage], tools: Any = None) -> int:
+        return sum(_estimate_tokens(str(message.content)) for message in messages)
+
+
+class Cassette:
+    """JSONL file of recorded responses, keyed by request hash (repeated requests replay in order)"""
+
+    _instances: Dict[str, "Cassette"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, List[Dict]] = defaultdict(list)
+        self._replay_positions: Dict[str, int] = defaultdict(int)
+        self._load()
+
+    @classmethod
+    def open(cls, path: str) -> "Cassette":
+        """Get the shared cassette for a path"""
+        with cls._instances_lock:
+            if path not in cls._instances:
+                cls._instances[path] = cls(path)
+            return cls._instances[path]
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    self._entries[entry['key']].append(entry['message'])
+
+    def record(self, key: str, message: BaseMessage):
+        """Append a response to the cassette"""
+        entry = {'key': key, 'message': message_to_dict(message), 'recorded_at': time.time()}
+        with self._lock:
+            self._entries[key].append(entry['message'])
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def replay(self, key: str) -> Optional[BaseMessage]:
+        """Get the next recorded response for a request, cycling through repeats"""
+        with self._lock:
+            recorded = self._entries.get(key)
+            if not recorded:
+                return None
+            position = self._replay_positions[key]
+            self._replay_positions[key] = position + 1
+            return messages_from_dict([recorded[position % len(recorded)]])[0]
+
+
+class CassetteChatModel(BaseChatModel):
+    """Records the responses of a real chat model to a cassette, or replays them offline"""
+
+    mode: str = "replay"
+    cassette_path: str = "cache/cassettes/default.jsonl"
+    inner: Optional[BaseChatModel] = None
+    strict: bool = False
+    model_name: str = "cassette"
+
+    @property
+    def _llm_type(self) -> str:
+        return "cassette"
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return {"mode": self.mode, "cassette_path": self.cassette_path, "model_name": self.model_name}
+
+    @property
+    def cassette(self) -> Cassette:
+        return Cassette.open(self.cassette_path)
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        key = _hash_messages(messages, **kwargs)
+        if self.mode == "record":
+            # Through generate(), so the inner model's callbacks (usage tracking) and response cache run
+            result = self.inner.generate([messages], stop=stop, **kwargs)
+            return self._record(key, result)
+        return self._replay(key, messages)
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        key = _hash_messages(messages, **kwargs)
+        if self.mode == "record":
+            result = await self.inner.agenerate([messages], stop=stop, **kwargs)
+            return self._record(key, result)
+        return self._replay(key, messages)
+
+    def _record(self, key: str, result: LLMResult) -> ChatResult:
+        generations = result.generations[0]
+        self.cassette.record(key, generations[0].message)
+        return ChatResult(generations=generations, llm_output=result.llm_output)
+
+    def _replay(self, key: str, messages: List[BaseMessage]) -> ChatResult:
+        message = self.cassette.replay(key)
+        if message is None:
+            if self.strict:
+                raise KeyError(f"No recorded response in {self.cassette_path} for request {key[:12]}")
+            logger.warning(f"Cassette miss for request {key[:12]}, using a synthetic answer")
+            message = AIMessage(content=synthetic_answer(messages))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def bind_tools(self, tools: Any, **kwargs: Any):
+        """Bind tools in OpenAI format so recordings and replays hash the same request"""
+        return self.bind(tools=[convert_to_openai_tool(tool) for tool in tools], **kwargs)
+
+    def get_num_tokens(self, text: str) -> int:
+        if self.inner is not None:
+            return self.inner.get_num_tokens(text)
+        return _estimate_tokens(text)
+
+    def get_num_tokens_from_messages(self, messages: List[BaseMessage], tools: Any = None) -> int:
+        if self.inner is not None:
+            return self.inner.get_num_tokens_from_messages(messages)
+        return sum(_estimate_tokens(str(message.content)) for message in messages)
+
+
+def create_offline_model(backend: str, model_name: str, inner: Optional[BaseChatModel] = None) -> BaseChatModel:
+    """
+    Create the chat model for a non-OpenAI backend.
+
+    Args:
+        backend: "fake", "record" or "replay"
+        model_name: The configured model name (kept for cache keys and reporting)
+        inner: The real model to record from (record mode only)
+
+    Returns:
+        A chat model usable wherever ChatOpenAI is
+    """
+    if backend == "fake":
+        return FakeParliamentChatModel(
+            model_name=model_name,
+            latency_ms=float(os.getenv("LLM_FAKE_LATENCY_MS", "0"))
+        )
+    if backend in ("record", "replay"):
+        return CassetteChatModel(
+            mode=backend,
+            inner=inner,
+            model_name=model_name,
+            cassette_path=os.getenv("LLM_CASSETTE_PATH", "cache/cassettes/default.jsonl"),
+            strict=os.getenv("LLM_CASSETTE_STRICT", "false").lower() == "true"
+        )
+    raise ValueError(f"Unknown LLM backend: {backend}")
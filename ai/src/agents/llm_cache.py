@@ -0,0 +1,194 @@
+# ai/src/agents/llm_cache.py
+import os
+import json
+import sqlite3
+import hashlib
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Optional
+
+from langchain_core.caches import BaseCache, RETURN_VAL_TYPE
+from langchain_core.load import dumps, loads
+
+# Cache modes: "replay" answers from stored responses when possible,
+# "fresh" always calls the model (responses are still recorded for later replay)
+REPLAY = "replay"
+FRESH = "fresh"
+CACHE_MODES = (REPLAY, FRESH)
+
+_cache_mode: ContextVar[Optional[str]] = ContextVar("llm_cache_mode", default=None)
+
+
+class LLMResponseCache:
+    """SQLite-backed store of LLM responses with size-based LRU eviction"""
+
+    def __init__(self, db_path: Optional[str] = None, max_size_mb: Optional[float] = None,
+                 default_mode: Optional[str] = None):
+        self.db_path = Path(db_path or os.getenv("LLM_CACHE_PATH", "cache/llm_responses.sqlite"))
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = int(float(max_size_mb or os.getenv("LLM_CACHE_MAX_MB", "256")) * 1024 * 1024)
+        self.default_mode = default_mode or os.getenv("LLM_CACHE_MODE", FRESH)
+        if self.default_mode not in CACHE_MODES:
+            raise ValueError(f"Unknown LLM cache mode: {self.default_mode}")
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                key TEXT PRIMARY KEY,
+                model_name TEXT NOT NULL,
+                temperature REAL,
+                max_tokens INTEGER,
+                messages_hash TEXT NOT NULL,
+                response TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_responses_last_access ON llm_responses(last_access)")
+        self._conn.commit()
+        self._total_size = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_responses").fetchone()[0]
+
+    @staticmethod
+    def make_key(model_name: str, temperature: Optional[float], max_tokens: Optional[int],
+                 messages_hash: str) -> str:
+        """Build the cache key from the model configuration and the hashed messages"""
+        raw = json.dumps([model_name, temperature, max_tokens, messages_hash])
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[RETURN_VAL_TYPE]:
+        """Get a stored response and mark it as recently used"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE llm_responses SET last_access = ? WHERE key = ?", (time.time(), key)
+            )
+            self._conn.commit()
+        return [loads(generation) for generation in json.loads(row[0])]
+
+    def put(self, key: str, model_name: str, temperature: Optional[float], max_tokens: Optional[int],
+            messages_hash: str, return_val: RETURN_VAL_TYPE):
+        """Store a response, evicting least recently used entries above the size limit"""
+        response = json.dumps([dumps(generation) for generation in return_val])
+        size = len(response.encode())
+        now = time.time()
+
+        with self._lock:
+            previous = self._conn.execute(
+                "SELECT size FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses "
+                "(key, model_name, temperature, max_tokens, messages_hash, response, size, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, model_name, temperature, max_tokens, messages_hash, response, size, now, now)
+            )
+            self._total_size += size - (previous[0] if previous else 0)
+            if self._total_size > self.max_size_bytes:
+                self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """Drop least recently used entries until the store is back under 90% of its limit"""
+        target = int(self.max_size_bytes * 0.9)
+        rows = self._conn.execute(
+            "SELECT key, size FROM llm_responses ORDER BY last_access ASC"
+        )
+        evicted = []
+        for key, size in rows:
+            if self._total_size <= target:
+                break
+            evicted.append((key,))
+            self._total_size -= size
+        self._conn.executemany("DELETE FROM llm_responses WHERE key = ?", evicted)
+
+    def clear(self):
+        """Remove every stored response"""
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_responses")
+            self._conn.commit()
+            self._total_size = 0
+
+    def get_stats(self) -> dict:
+        """Get cache statistics"""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+        return {
+            'entries': entries,
+            'total_size_mb': self._total_size / 1024 / 1024,
+            'max_size_mb': self.max_size_bytes / 1024 / 1024,
+            'mode': get_cache_mode()
+        }
+
+    def for_model(self, model_name: str, temperature: Optional[float] = None,
+                  max_tokens: Optional[int] = None) -> "ModelResponseCache":
+        """Get a LangChain cache bound to one model configuration"""
+        return ModelResponseCache(self, model_name, temperature, max_tokens)
+
+
+class ModelResponseCache(BaseCache):
+    """LangChain cache view over LLMResponseCache for one (model, temperature, max_tokens) configuration"""
+
+    def __init__(self, store: LLMResponseCache, model_name: str,
+                 temperature: Optional[float], max_tokens: Optional[int]):
+        self.store = store
+        self.model_name = model_name
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+
+    def _key(self, prompt: str, llm_string: str):
+        # llm_string carries bound tools and call options, so it is hashed together with the messages
+        messages_hash = hashlib.sha256(f"{prompt}\n{llm_string}".encode()).hexdigest()
+        return self.store.make_key(self.model_name, self.temperature, self.max_tokens, messages_hash), messages_hash
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        """Return a stored response when the current simulation replays"""
+        if get_cache_mode() != REPLAY:
+            return None
+        key, _ = self._key(prompt, llm_string)
+        generations = self.store.get(key)
+        # Tag replayed responses so usage tracking does not count the recorded tokens again
+        for generation in generations or []:
+            generation.generation_info = {**(generation.generation_info or {}), 'cached': True}
+        return generations
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """Record a fresh response"""
+        key, messages_hash = self._key(prompt, llm_string)
+        self.store.put(key, self.model_name, self.temperature, self.max_tokens, messages_hash, return_val)
+
+    def clear(self, **kwargs: Any) -> None:
+        """Remove every stored response"""
+        self.store.clear()
+
+
+def get_cache_mode() -> str:
+    """Get the cache mode of the current simulation"""
+    return _cache_mode.get() or llm_cache.default_mode
+
+
+@contextmanager
+def cache_mode_scope(mode: Optional[str]):
+    """Apply a cache mode to every LLM call made inside the block (None keeps the current mode)"""
+    if mode is None:
+        yield
+        return
+    if mode not in CACHE_MODES:
+        raise ValueError(f"Unknown LLM cache mode: {mode}")
+    token = _cache_mode.set(mode)
+    try:
+        yield
+    finally:
+        _cache_mode.reset(token)
+
+
+# Create global LLM response cache instance
+llm_cache = LLMResponseCache()
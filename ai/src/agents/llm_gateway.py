@@ -0,0 +1,170 @@
+# ai/src/agents/llm_gateway.py
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+import httpx
+from dotenv import load_dotenv
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_openai import ChatOpenAI
+
+from .llm_cache import llm_cache
+from .rate_limiter import LLMGovernor, GovernedTransport, AsyncGovernedTransport, llm_governor
+from .fake_llm import create_offline_model
+from .usage_tracker import llm_usage_tracker
+
+
+class LLMGateway:
+    """
+    Hands out shared, thread-safe chat model clients backed by one pooled HTTP connection pool.
+    Every request made by these clients passes through the governor (rate limits and AIMD concurrency).
+    LLM_BACKEND selects the model implementation: "openai" (default), or the offline
+    "fake", "record" and "replay" stand-ins from fake_llm.
+    """
+
+    def __init__(self, max_connections: Optional[int] = None, max_keepalive_connections: Optional[int] = None,
+                 keepalive_expiry: Optional[float] = None, timeout: Optional[float] = None,
+                 governor: Optional[LLMGovernor] = None):
+        self.max_connections = max_connections or int(os.getenv("LLM_POOL_MAX_CONNECTIONS", "100"))
+        self.max_keepalive_connections = max_keepalive_connections or int(os.getenv("LLM_POOL_MAX_KEEPALIVE", "20"))
+        self.keepalive_expiry = keepalive_expiry or float(os.getenv("LLM_POOL_KEEPALIVE_EXPIRY", "30"))
+        self.timeout = timeout or float(os.getenv("LLM_HTTP_TIMEOUT", "120"))
+        self.governor = governor or llm_governor
+
+        self._lock = threading.Lock()
+        self._env_loaded = False
+        self._models: Dict[Tuple[str, float, int], BaseChatModel] = {}
+        self._http_client: Optional[httpx.Client] = None
+        self._http_async_client: Optional[httpx.AsyncClient] = None
+
+    def load_environment(self):
+        """Load environment variables from the project's .env files (once per process)"""
+        if self._env_loaded:
+            return
+
+        with self._lock:
+            if self._env_loaded:
+                return
+
+            current_dir = os.path.dirname(os.path.abspath(__file__))
+            project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_dir)))
+
+            # Try to load environment variables from different possible locations
+            env_files = [
+                os.path.join(project_root, '.env'),
+                os.path.join(project_root, '.env.shared'),
+                os.path.join(project_root, '.env.secret')
+            ]
+
+            for env_file in env_files:
+                if os.path.exists(env_file):
+                    load_dotenv(dotenv_path=env_file)
+
+            self._env_loaded = True
+
+    def get_chat_model(self, model_name: Optional[str] = None, temperature: float = 0.7,
+                       max_tokens: int = 2000) -> BaseChatModel:
+        """
+        Get the shared chat model for a configuration.
+
+        Args:
+            model_name: The model to use (defaults to GPT_MODEL_NAME)
+            temperature: Sampling temperature
+            max_tokens: Maximum number of tokens in a response
+
+        Returns:
+            A chat model shared by every caller with the same configuration
+        """
+        self.load_environment()
+        model_name = model_name or os.getenv("GPT_MODEL_NAME", "gpt-4o-mini")
+        key = (model_name, temperature, max_tokens)
+
+        model = self._models.get(key)
+        if model is not None:
+            return model
+
+        with self._lock:
+            if key not in self._models:
+                self._models[key] = self._create_model(model_name, temperature, max_tokens)
+            return self._models[key]
+
+    def _create_model(self, model_name: str, temperature: float, max_tokens: int) -> BaseChatModel:
+        """Create the chat model for the configured backend (caller holds the lock)"""
+        backend = os.getenv("LLM_BACKEND", "openai").lower()
+        if backend in ("fake", "replay"):
+            model = create_offline_model(backend, model_name)
+            model.callbacks = [llm_usage_tracker]
+            return model
+
+        http_client, http_async_client = self._get_http_clients()
+        model = ChatOpenAI(
+            model=model_name,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            cache=llm_cache.for_model(model_name, temperature, max_tokens),
+            http_client=http_client,
+            http_async_client=http_async_client,
+            callbacks=[llm_usage_tracker]
+        )
+        if backend == "record":
+            return create_offline_model(backend, model_name, inner=model)
+        return model
+
+    def _get_http_clients(self) -> Tuple[httpx.Client, httpx.AsyncClient]:
+        """Create the keep-alive HTTP clients shared by every model (caller holds the lock)"""
+        if self._http_client is None:
+            limits = httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry
+            )
+            self._http_client = httpx.Client(
+                timeout=self.timeout,
+                transport=GovernedTransport(self.governor, httpx.HTTPTransport(limits=limits))
+            )
+            self._http_async_client = httpx.AsyncClient(
+                timeout=self.timeout,
+                transport=AsyncGovernedTransport(self.governor, httpx.AsyncHTTPTransport(limits=limits))
+            )
+        return self._http_client, self._http_async_client
+
+    def get_stats(self) -> Dict:
+        """Get gateway statistics"""
+        return {
+            'models': len(self._models),
+            'backend': os.getenv("LLM_BACKEND", "openai").lower(),
+            'max_connections': self.max_connections,
+            'max_keepalive_connections': self.max_keepalive_connections,
+            'rate_limiter': self.governor.get_stats(),
+            'usage': llm_usage_tracker.get_stats()
+        }
+
+    def _detach_http_clients(self) -> Tuple[Optional[httpx.Client], Optional[httpx.AsyncClient]]:
+        """Forget the shared HTTP clients and the models using them, returning the clients to close"""
+        with self._lock:
+            clients = self._http_client, self._http_async_client
+            self._http_client = None
+            self._http_async_client = None
+            self._models.clear()
+        return clients
+
+    def close(self):
+        """Close the shared sync HTTP client and drop the cached models (use aclose() to close the async client too)"""
+        http_client, http_async_client = self._detach_http_clients()
+        if http_client is not None:
+            http_client.close()
+        if http_async_client is not None:
+            # The async client can only be closed on an event loop, which aclose() runs on
+            print("⚠️ LLM gateway closed without aclose(), the async HTTP client was left open")
+
+    async def aclose(self):
+        """Close the shared HTTP clients and drop the cached models without blocking the event loop"""
+        http_client, http_async_client = self._detach_http_clients()
+        if http_client is not None:
+            http_client.close()
+        if http_async_client is not None:
+            await http_async_client.aclose()
+
+
+# Create global LLM gateway instance
+llm_gateway = LLMGateway()
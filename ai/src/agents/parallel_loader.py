@@ -1,59 +1,211 @@
 # ai/src/agents/parallel_loader.py
+import os
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional
 import time
 
+from .cache_manager import cache_manager
+from .party_agent import PartyAgent
+from .politician_agent import persona_fingerprint
+from .politician_persona import PoliticianPersona
+from .politician_registry import politician_registry
+from .rate_limiter import TokenBucket
+
+
+def _split_full_name(full_name: str):
+    parts = full_name.split(maxsplit=1)
+    return parts[0], parts[1] if len(parts) > 1 else ""
+
+
 class ParallelLoader:
-    @staticmethod
-    def load_parties_parallel(parties_config: List[Dict]) -> List[PartyAgent]:
-        """Load multiple parties in parallel"""
-        parties = []
+    """
+    Loads parties and politicians concurrently.
+
+    All parties and all politicians are loaded at the same time on one thread pool of
+    max_workers (SIMULATION_LOAD_WORKERS), so a cold setup takes about as long as its
+    slowest research. Loads that are not served from the cache first take a token from a
+    bucket refilled at rate_per_minute (SIMULATION_LOAD_RATE_PER_MINUTE, 0 disables the limit).
+    A party or politician that fails to load is left out and reported instead of failing
+    the whole load.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, rate_per_minute: Optional[float] = None):
+        self.max_workers = max_workers or int(os.getenv("SIMULATION_LOAD_WORKERS", "24"))
+        self.rate_per_minute = (rate_per_minute if rate_per_minute is not None
+                                else float(os.getenv("SIMULATION_LOAD_RATE_PER_MINUTE", "0")))
+        self._bucket = TokenBucket(self.rate_per_minute, capacity=self.max_workers)
+        self._lock = threading.Lock()
+        self.timings: List[Dict] = []
+        self.errors: List[Dict] = []
+
+    def _timed(self, kind: str, name: str, cached: bool, load, *args):
+        """Run a load, recording how long it took and whether it failed"""
+        if not cached:
+            self._bucket.acquire()
+
         start_time = time.time()
-        
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            # Submit party creation tasks
-            future_to_party = {
-                executor.submit(
-                    PartyAgent,
-                    config['name'],
-                    config.get('acronym', '')
-                ): config for config in parties_config
-            }
-            
-            # Collect results
-            for future in as_completed(future_to_party):
-                config = future_to_party[future]
-                try:
-                    party = future.result()
-                    parties.append(party)
-                    print(f"✅ Loaded party: {config['name']}")
-                except Exception as e:
-                    print(f"❌ Error loading party {config['name']}: {e}")
-        
+        try:
+            result = load(*args)
+        except Exception as e:
+            with self._lock:
+                self.timings.append({'kind': kind, 'name': name, 'cached': cached,
+                                     'seconds': time.time() - start_time, 'ok': False})
+                self.errors.append({'kind': kind, 'name': name, 'error': str(e)})
+            raise
+
+        with self._lock:
+            self.timings.append({'kind': kind, 'name': name, 'cached': cached,
+                                 'seconds': time.time() - start_time, 'ok': True})
+        return result
+
+    def _submit_party(self, executor: ThreadPoolExecutor, config: Dict):
+        name, acronym = config['name'], config.get('acronym', '')
+        cached = cache_manager.get_party_entry(name, acronym) is not None
+        return executor.submit(self._timed, 'party', name, cached, PartyAgent, name, acronym)
+
+    def _submit_politician(self, executor: ThreadPoolExecutor, fingerprint: str, party_name: str, pol_config: Dict):
+        first_name, last_name = _split_full_name(pol_config['name'])
+        cached = (
+            politician_registry.get(pol_config['name'], party_name) is not None
+            or cache_manager.get_politician_entry(first_name, last_name, party_name, fingerprint=fingerprint) is not None
+        )
+        return executor.submit(
+            self._timed, 'politician', pol_config['name'], cached,
+            politician_registry.get_or_create, first_name, last_name, party_name
+        )
+
+    def load_parties_parallel(self, parties_config: List[Dict]) -> List[PartyAgent]:
+        """
+        Load multiple parties in parallel.
+
+        Args:
+            parties_config: Dictionaries with the 'name' and optionally 'acronym' of each party
+
+        Returns:
+            The parties that loaded, in the order of parties_config
+        """
+        start_time = time.time()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [self._submit_party(executor, config) for config in parties_config]
+            parties = [party for party in self._collect(futures, parties_config) if party is not None]
+
         print(f"⏱️ Loaded {len(parties)} parties in {time.time() - start_time:.2f}s")
         return parties
-    
-    @staticmethod
-    def load_politicians_for_party_parallel(party: PartyAgent, politicians_config: List[Dict]):
-        """Load politicians for a party in parallel"""
+
+    def load_politicians_for_party_parallel(self, party: PartyAgent, politicians_config: List[Dict]):
+        """
+        Load politicians for a party in parallel.
+
+        Args:
+            party: The party the politicians are added to
+            politicians_config: Dictionaries with the 'name' and optionally 'role' of each politician
+        """
         start_time = time.time()
-        
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = []
-            
-            for pol_config in politicians_config:
-                future = executor.submit(
-                    party.add_politician,
-                    pol_config['name'],
-                    pol_config.get('role', '')
-                )
-                futures.append(future)
-            
-            # Wait for all to complete
-            for future in as_completed(futures):
-                try:
-                    future.result()
-                except Exception as e:
-                    print(f"❌ Error adding politician: {e}")
-        
-        print(f"⏱️ Added {len(politicians_config)} politicians in {time.time() - start_time:.2f}s")
\ No newline at end of file
+        fingerprint = persona_fingerprint()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                self._submit_politician(executor, fingerprint, party.party_name, pol_config)
+                for pol_config in politicians_config
+            ]
+            personas = self._collect(futures, politicians_config)
+
+        added = self._add_politicians(party, politicians_config, personas)
+        print(f"⏱️ Added {added} politicians in {time.time() - start_time:.2f}s")
+
+    def load_simulation(self, parties_config: List[Dict],
+                        parties: Optional[Dict[str, PartyAgent]] = None) -> List[PartyAgent]:
+        """
+        Load parties and their politicians, all at the same time.
+
+        Args:
+            parties_config: Dictionaries with the 'name', optionally 'acronym', and the
+                            'politicians' (each with 'name' and optionally 'role') of each party
+            parties: Parties loaded before, by name (reused instead of loaded again)
+
+        Returns:
+            The parties that loaded, with the politicians that loaded, in the order of parties_config
+        """
+        start_time = time.time()
+        fingerprint = persona_fingerprint()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Personas do not depend on their party's agent, so everything is submitted at once
+            parties = parties or {}
+            party_futures = [
+                self._submit_party(executor, config) for config in parties_config if config['name'] not in parties
+            ]
+            politician_futures = [
+                [
+                    self._submit_politician(executor, fingerprint, config['name'], pol_config)
+                    for pol_config in config.get('politicians', [])
+                ]
+                for config in parties_config
+            ]
+
+            new_configs = [config for config in parties_config if config['name'] not in parties]
+            new_parties = iter(self._collect(party_futures, new_configs))
+            loaded_parties = [parties.get(config['name']) or next(new_parties) for config in parties_config]
+            personas = [
+                self._collect(futures, config.get('politicians', []))
+                for futures, config in zip(politician_futures, parties_config)
+            ]
+
+        loaded = []
+        for party, config, party_personas in zip(loaded_parties, parties_config, personas):
+            if party is None:
+                continue
+            self._add_politicians(party, config.get('politicians', []), party_personas)
+            loaded.append(party)
+
+        print(f"⏱️ Loaded {len(loaded)} parties and {sum(len(party.politicians) for party in loaded)} politicians "
+              f"in {time.time() - start_time:.2f}s ({len(self.errors)} failed)")
+        return loaded
+
+    @staticmethod
+    def _collect(futures: List, configs: List[Dict]) -> List:
+        """Wait for the loads, returning their results (None for failed loads) in submission order"""
+        results = [None] * len(futures)
+        index = {future: i for i, future in enumerate(futures)}
+        for future in as_completed(futures):
+            config = configs[index[future]]
+            try:
+                results[index[future]] = future.result()
+                print(f"✅ Loaded: {config['name']}")
+            except Exception as e:
+                print(f"❌ Error loading {config['name']}: {e}")
+        return results
+
+    @staticmethod
+    def _add_politicians(party: PartyAgent, politicians_config: List[Dict],
+                         personas: List[Optional[PoliticianPersona]]) -> int:
+        """Add the politicians that loaded to their party (their personas are in the registry by now)"""
+        added = 0
+        for pol_config, persona in zip(politicians_config, personas):
+            if persona is None:
+                continue
+            if persona in party.politicians:
+                # Already a member: the name and role are per simulation, so set them for this one
+                persona.name = pol_config['name']
+                if pol_config.get('role'):
+                    persona.role = pol_config['role']
+                continue
+            party.add_politician(pol_config['name'], pol_config.get('role', ''))
+            added += 1
+        return added
+
+    def get_report(self) -> Dict:
+        """
+        Get the timing of every load.
+
+        Returns:
+            A dictionary with the per-entity timings, the slowest load and the failures
+        """
+        with self._lock:
+            timings = sorted(self.timings, key=lambda timing: timing['seconds'], reverse=True)
+            return {
+                'timings': timings,
+                'slowest': timings[0] if timings else None,
+                'errors': list(self.errors),
+                'max_workers': self.max_workers,
+                'rate_per_minute': self.rate_per_minute
+            }
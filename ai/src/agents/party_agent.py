@@ -1,34 +1,45 @@
 import os
 from .base_agent import BaseAgent
-from .politician_agent import PoliticianAgent
+from .politician_persona import PoliticianPersona
+from .politician_registry import politician_registry
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain.agents import create_tool_calling_agent, AgentExecutor
-from langsmith import Client, traceable
+from langsmith import traceable
 from langchain_community.tools import WikipediaQueryRun
 from langchain_community.utilities import WikipediaAPIWrapper
-from typing import List, Dict, Any
-from .cache_manager import cache_manager
+from typing import List, Dict, Any, Optional, Tuple
+from ..utilities.agent_prompt import load_agent_prompt
+from .cache_manager import cache_manager, PARTIES
 from .cached_wikipedia import CachedWikipediaTool
+from .single_flight import single_flight
 
 
 class PartyAgent(BaseAgent):
     """
     Agent representing a political party in the AI Parliament system.
     """
-    def __init__(self, name: str, acronym: str = ""):
+    def __init__(self, name: str, acronym: str = "", party_info: Optional[str] = None):
         """
         Initialize a party agent.
         
         Args:
             name: The name of the party
             acronym: The acronym of the party
+            party_info: Known party information (e.g. from a snapshot); skips the cache and the lookup
         """
-        # Check cache first
-        cached_data = cache_manager.get_party(name, acronym)
+        # Check cache first (expired party info is used right away and refreshed in the background)
+        cached_entry = cache_manager.get_party_entry(name, acronym) if party_info is None else None
+        cached_data = cached_entry.data if cached_entry else None
         
-        if cached_data:
+        if party_info is not None:
+            self.party_info = party_info
+            self._party_info_found = True
+            self._cached_politicians_data = []
+            super().__init__()
+        elif cached_data:
             print(f"✅ Loaded party {name} from cache!")
             self.party_info = cached_data['party_info']
+            self._party_info_found = cached_data.get('party_info_found', True)
             self._cached_politicians_data = cached_data.get('politicians_data', [])
             super().__init__()
         else:
@@ -40,17 +51,18 @@ class PartyAgent(BaseAgent):
         self.party_acronym = acronym
         
         # List of politicians and discussion history
-        self.politicians: List[PoliticianAgent] = []
+        self.politicians: List[PoliticianPersona] = []
         self.discussion_history: List[Dict[str, str]] = []
         
-        # Only fetch party info if not cached
+        # Only fetch party info if not cached (concurrent loads of the same party share one lookup)
+        party_key = cache_manager.get_party_key(name, acronym)
         if not hasattr(self, 'party_info'):
-            self.party_info = self._get_party_info()
-            # Save to cache
-            cache_manager.save_party(name, acronym, {
-                'party_info': self.party_info,
-                'politicians_data': []
-            })
+            self.party_info, self._party_info_found = single_flight.do(("party", party_key), self._load_party_info)
+        elif cached_entry is not None and (
+            cached_entry.stale or (not self._party_info_found and not cache_manager.get_negative(PARTIES, party_key))
+        ):
+            # Refresh expired info, and retry a failed lookup once its negative entry has expired
+            cache_manager.revalidate(PARTIES, party_key, self._refresh_party_info)
         
         # Set up agent
         self.system_prompt = self._set_system_prompt()
@@ -95,29 +107,21 @@ class PartyAgent(BaseAgent):
         first_name = parts[0]
         last_name = parts[1] if len(parts) > 1 else ""
         
-        politician = PoliticianAgent(
-            first_name=first_name, 
-            last_name=last_name,
-            party_name=self.party_name
-        )
-        politician.name = full_name  
+        # One persona per politician and process, shared with the agent manager and other simulations;
+        # the name and role are set for the current simulation only (see PersonaSession)
+        politician = politician_registry.get_or_create(first_name, last_name, self.party_name)
+        politician.name = full_name
         politician.role = role
-        self.politicians.append(politician)
+        if politician not in self.politicians:
+            self.politicians.append(politician)
         
-        # Update party cache with new politician
-        current_cache = cache_manager.get_party(self.party_name, self.party_acronym) or {}
-        politicians_data = current_cache.get('politicians_data', [])
-        politicians_data.append({
+        # Update party cache with new politician (atomically, members may be added concurrently)
+        cache_manager.add_party_politician(self.party_name, self.party_acronym, self.party_info, {
             'full_name': full_name,
             'first_name': first_name,
             'last_name': last_name,
             'role': role
-        })
-        
-        cache_manager.save_party(self.party_name, self.party_acronym, {
-            'party_info': self.party_info,
-            'politicians_data': politicians_data
-        })
+        }, party_info_found=self._party_info_found)
         
         print(f"Added politician: {full_name} to party {self.party_name}")
     
@@ -212,13 +216,78 @@ class PartyAgent(BaseAgent):
         response = self.agent_executor.invoke({"input": prompt})
         return response["output"]
     
+    async def aanswer_question(self, question: str) -> str:
+        """
+        Answer a question as this party without blocking the event loop.
+        
+        Args:
+            question: The question to answer
+            
+        Returns:
+            The party's response
+        """
+        prompt = self.prompt_manager.format_prompt(
+            'party',
+            'question_prompt',
+            party_name=self.party_name,
+            question=question
+        )
+            
+        response = await self.agent_executor.ainvoke({"input": prompt})
+        return response["output"]
+    
+    def _load_party_info(self) -> Tuple[str, bool]:
+        """
+        Look up the party information and cache it, unless a load that just finished already did.
+        A failed lookup is recorded in the negative cache instead, so it is not retried on every load.
+        
+        Returns:
+            Information about the party as a string, and whether it was actually found
+        """
+        cached_data = cache_manager.get_party(self.party_name, self.party_acronym)
+        if cached_data:
+            return cached_data['party_info'], cached_data.get('party_info_found', True)
+        
+        party_key = cache_manager.get_party_key(self.party_name, self.party_acronym)
+        failure = cache_manager.get_negative(PARTIES, party_key)
+        if failure:
+            print(f"📭 Party {self.party_name} lookup failed recently ({failure}), using generic info")
+            return self._get_party_info(), False
+        
+        party_info = self._lookup_party_info()
+        if party_info is None:
+            cache_manager.save_negative(PARTIES, party_key, "no usable Wikipedia result")
+            return self._get_party_info(), False
+        
+        cache_manager.save_party_info(self.party_name, self.party_acronym, party_info)
+        return party_info, True
+    
+    def _refresh_party_info(self):
+        """Look up the party information again and update the cache (used for stale entries)"""
+        party_info = self._lookup_party_info()
+        if party_info:
+            cache_manager.save_party_info(self.party_name, self.party_acronym, party_info)
+        else:
+            cache_manager.save_negative(
+                PARTIES, cache_manager.get_party_key(self.party_name, self.party_acronym), "no usable Wikipedia result"
+            )
+    
     def _get_party_info(self) -> str:
         """
-        Get information about the party.
+        Get generic information about the party, used when nothing was found.
         
         Returns:
             Information about the party as a string
         """
+        return f"Political party {self.party_name} ({self.party_acronym}) operating in Poland."
+    
+    def _lookup_party_info(self) -> Optional[str]:
+        """
+        Look up information about the party on Wikipedia.
+        
+        Returns:
+            Information about the party, or None if nothing useful was found
+        """
         wiki_tool = self._setup_wikipedia_tool()
         try:
             party_info = wiki_tool.invoke(f"{self.party_name} political party Poland")
@@ -227,7 +296,7 @@ class PartyAgent(BaseAgent):
         except Exception:
             pass
         
-        return f"Political party {self.party_name} ({self.party_acronym}) operating in Poland."
+        return None
     
     def _set_system_prompt(self) -> str:
         """
@@ -260,9 +329,7 @@ class PartyAgent(BaseAgent):
         Returns:
             The configured agent
         """
-        langsmith_api_key = os.getenv("LANGSMITH_API_KEY")
-        hub_client = Client(api_key=langsmith_api_key)
-        basic_prompt = hub_client.pull_prompt("hwchase17/openai-tools-agent")
+        basic_prompt = load_agent_prompt("hwchase17/openai-tools-agent")
         return create_tool_calling_agent(self.llm, self.tools, basic_prompt)
     
     def _get_context(self) -> Dict[str, Any]:
@@ -0,0 +1,82 @@
+# ai/src/agents/persona_rebuild.py
+"""Rebuild cached politician personas made with an outdated beliefs prompt or model"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Tuple
+
+from .cache_manager import cache_manager, POLITICIANS
+from .politician_agent import PoliticianAgent, persona_fingerprint
+from .politician_registry import politician_registry
+
+
+def _politician_identity(data: Dict) -> Tuple[str, str, str]:
+    """Get (first_name, last_name, party_name) of a cached persona"""
+    first_name = data.get('first_name')
+    last_name = data.get('last_name')
+    if first_name is None:
+        # Entries cached before names were stored separately
+        parts = data.get('full_name', '').split(maxsplit=1)
+        first_name = parts[0] if parts else ''
+        last_name = parts[1] if len(parts) > 1 else ''
+    return first_name, last_name or '', data.get('party_name', '')
+
+
+def _rebuild(key: str, data: Dict):
+    first_name, last_name, party_name = _politician_identity(data)
+    # A deliberate rebuild retries research that failed recently
+    cache_manager.clear_negative(POLITICIANS, cache_manager.get_politician_key(first_name, last_name, party_name))
+
+    # A fingerprint mismatch is a cache miss, so creating the agent researches and re-caches the persona
+    agent = PoliticianAgent(first_name, last_name, party_name)
+
+    # Failed research falls back to generic beliefs without caching them: the persona is still outdated
+    cached_data = cache_manager.get_politician(first_name, last_name, party_name, fingerprint=agent.persona_fingerprint)
+    if not cached_data:
+        raise RuntimeError(f"Research of {agent.full_name} failed, persona not rebuilt")
+
+    # Running simulations get the rebuilt persona too
+    politician_registry.update_beliefs(agent.full_name, party_name, cached_data['beliefs'])
+
+    if cache_manager.get_politician_key(first_name, last_name, party_name) != key:
+        cache_manager.delete(POLITICIANS, key)
+
+
+def rebuild_outdated_personas(max_workers: int = 4) -> Dict:
+    """
+    Research again every cached persona made with another beliefs prompt or model.
+
+    Args:
+        max_workers: Maximum number of personas rebuilt at the same time
+
+    Returns:
+        A dictionary with the current fingerprint and the outcome of the rebuild
+    """
+    fingerprint = persona_fingerprint()
+    outdated = cache_manager.find_outdated(POLITICIANS, fingerprint)
+    print(f"🔁 Rebuilding {len(outdated)} outdated personas (fingerprint {fingerprint})...")
+
+    start_time = time.time()
+    rebuilt = 0
+    failed = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(_rebuild, key, data): key for key, data in outdated.items()}
+        for future in as_completed(futures):
+            try:
+                future.result()
+                rebuilt += 1
+            except Exception as e:
+                print(f"❌ Error rebuilding persona {futures[future]}: {e}")
+                failed.append(futures[future])
+
+    print(f"⏱️ Rebuilt {rebuilt} personas in {time.time() - start_time:.2f}s")
+    return {
+        'fingerprint': fingerprint,
+        'outdated': len(outdated),
+        'rebuilt': rebuilt,
+        'failed': failed
+    }
+
+
+if __name__ == "__main__":
+    rebuild_outdated_personas()
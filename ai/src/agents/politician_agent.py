@@ -2,18 +2,42 @@ import os
 from .base_agent import BaseAgent
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain.agents import create_tool_calling_agent, AgentExecutor
-from langsmith import Client, traceable
+from langsmith import traceable
 from langchain_community.tools import WikipediaQueryRun
 from langchain_community.utilities import WikipediaAPIWrapper
-from typing import List, Dict, Any
-from .cache_manager import cache_manager
+from typing import List, Dict, Any, Optional
+from ..utilities.agent_prompt import load_agent_prompt
+from ..utilities.prompt_manager import PromptManager
+from .cache_manager import cache_manager, POLITICIANS
+from .llm_gateway import llm_gateway
 from .cached_wikipedia import CachedWikipediaTool
+from .single_flight import single_flight
+
+
+def persona_fingerprint(prompt_manager: Optional[PromptManager] = None, model_name: Optional[str] = None) -> str:
+    """
+    Get the fingerprint of everything a cached persona depends on: the beliefs prompt and the model.
+    
+    Args:
+        prompt_manager: The prompt manager to read the beliefs prompt from
+        model_name: The model researching the beliefs (defaults to GPT_MODEL_NAME)
+        
+    Returns:
+        The fingerprint recorded with cached personas
+    """
+    llm_gateway.load_environment()
+    prompt_manager = prompt_manager or PromptManager()
+    model_name = model_name or os.getenv("GPT_MODEL_NAME", "gpt-4o-mini")
+    return prompt_manager.fingerprint(('politician', 'beliefs_prompt'), extra=model_name)
 
 
 class PoliticianAgent(BaseAgent):
     """
     Agent representing a politician in the AI Parliament system.
     """
+    # Politicians accumulate opinions, rebuttals, speeches and votes over a run
+    memory_max_tokens: int = 1500
+    
     @traceable(name="Get Politician Opinion")
     def __init__(self, first_name: str, last_name: str, party_name: str = ""):
         """
@@ -24,8 +48,11 @@ class PoliticianAgent(BaseAgent):
             last_name: The last name of the politician
             party_name: The name of the party the politician belongs to
         """
-        # Check cache first
-        cached_data = cache_manager.get_politician(first_name, last_name, party_name)
+        # Check cache first (an expired persona is used right away and refreshed in the background)
+        # Personas researched with another beliefs prompt or model are not reused
+        fingerprint = persona_fingerprint()
+        cached_entry = cache_manager.get_politician_entry(first_name, last_name, party_name, fingerprint=fingerprint)
+        cached_data = cached_entry.data if cached_entry else None
         
         if cached_data:
             print(f"✅ Loaded {first_name} {last_name} from cache!")
@@ -45,11 +72,13 @@ class PoliticianAgent(BaseAgent):
             super().__init__()
             self._from_cache = False
         
+        self.persona_fingerprint = fingerprint
         self.first_name = first_name
         self.last_name = last_name
         self.full_name = f"{first_name} {last_name}"
         self.party_name = party_name
         self.role = ""  # Can be set later (e.g., "Minister of Finance")
+        self.legislation_text = ""  # Set once the legislation is known (see set_legislation_beliefs)
         
         # Set up tools and agent
         self.tools = self._get_all_tools()
@@ -63,24 +92,76 @@ class PoliticianAgent(BaseAgent):
         
         # Get politician's beliefs and set system prompt
         if not self._from_cache:
-            self.beliefs = self._get_beliefs()
-            # Save to cache
-            self._save_to_cache()
+            # Concurrent loads of the same politician share a single research run
+            self.beliefs = single_flight.do(
+                ("politician", cache_manager.get_politician_key(first_name, last_name, party_name)),
+                self._load_beliefs
+            )
+        elif cached_entry.stale:
+            cache_manager.revalidate(
+                POLITICIANS,
+                cache_manager.get_politician_key(first_name, last_name, party_name),
+                self._refresh_beliefs
+            )
         
         self.system_prompt = self._set_system_prompt()
     
-    def _save_to_cache(self):
+    def _load_beliefs(self) -> str:
+        """
+        Research the politician's beliefs and cache them, unless a load that just finished already did.
+        
+        Returns:
+            A string containing the politician's political beliefs
+        """
+        cached_data = cache_manager.get_politician(
+            self.first_name, self.last_name, self.party_name, fingerprint=self.persona_fingerprint
+        )
+        force_refresh = getattr(self, '_force_refresh', False)
+        if cached_data and not force_refresh:
+            return cached_data['beliefs']
+        
+        # If we're refreshing, clear the cache
+        if force_refresh:
+            cache_manager.delete_politician(self.first_name, self.last_name, self.party_name)
+        
+        # Research that failed recently is not retried until its negative entry expires
+        politician_key = cache_manager.get_politician_key(self.first_name, self.last_name, self.party_name)
+        failure = cache_manager.get_negative(POLITICIANS, politician_key)
+        if failure and not force_refresh:
+            print(f"📭 Research of {self.full_name} failed recently ({failure}), using generic beliefs")
+            return self._get_fallback_beliefs()
+        
+        try:
+            self.beliefs = self._research_beliefs()
+        except Exception as e:
+            cache_manager.save_negative(POLITICIANS, politician_key, f"research failed: {e}")
+            return self._get_fallback_beliefs()
+        
+        self._save_to_cache()
+        return self.beliefs
+    
+    def _refresh_beliefs(self):
+        """
+        Research the politician's beliefs again and update the cache (used for stale entries).
+        The running agent keeps its current persona; the refreshed one is used by later loads.
+        """
+        self._save_to_cache(self._research_beliefs())
+    
+    def _save_to_cache(self, beliefs: str = None):
         """Save politician data to cache"""
         cache_manager.save_politician(
             self.first_name,
             self.last_name,
             self.party_name,
             {
-                'beliefs': self.beliefs,
+                'beliefs': beliefs or self.beliefs,
                 'wikipedia_summary': getattr(self, 'wikipedia_summary', ''),
                 'full_name': self.full_name,
+                'first_name': self.first_name,
+                'last_name': self.last_name,
                 'party_name': self.party_name
-            }
+            },
+            fingerprint=self.persona_fingerprint
         )
         
     @traceable(name="Get Politician Opinion")
@@ -94,54 +175,91 @@ class PoliticianAgent(BaseAgent):
         Returns:
             The politician's response
         """
-        conversation_history = self.memory.load_memory_variables({})["history"]
+        response = self.model.invoke(self._build_messages(question))
         
-        messages = [
-            SystemMessage(content=f"{self.system_prompt}. Consider your previous statements in this conversation: {conversation_history}"),
-            HumanMessage(content=question)
-        ]
+        self.memory.save_context({"input": question}, {"output": response.content})
+        return response.content
+    
+    @traceable(name="Get Politician Opinion")
+    async def aanswer_question(self, question: str) -> str:
+        """
+        Answer a question as this politician without blocking the event loop.
         
-        response = self.model.invoke(messages)
+        Args:
+            question: The question to answer
+            
+        Returns:
+            The politician's response
+        """
+        response = await self.model.ainvoke(self._build_messages(question))
         
-        self.memory.chat_memory.add_ai_message(response.content)
+        await self.memory.asave_context({"input": question}, {"output": response.content})
         return response.content
     
-    def _get_beliefs(self) -> str:
+    def _build_messages(self, question: str) -> List:
         """
-        Get the politician's beliefs by querying for information.
+        Build the messages sent to the LLM for a question.
+        
+        The stable part comes first and is byte-identical across calls (persona, then
+        legislation), followed by the conversation turns and the new question. Each call
+        therefore extends the previous one, which keeps provider-side prompt caching effective.
         
+        Args:
+            question: The question to answer
+            
         Returns:
-            A string containing the politician's political beliefs
+            A list of messages including the conversation history
         """
-        # If we're refreshing, clear the cache
-        if hasattr(self, '_force_refresh') and self._force_refresh:
-            cache_path = cache_manager.get_politician_cache_path(
-                self.first_name, self.last_name, self.party_name
-            )
-            if cache_path.exists():
-                cache_path.unlink()
+        messages = [SystemMessage(content=self.system_prompt)]
+        if self.legislation_text:
+            messages.append(SystemMessage(content=f"Legislation under discussion:\n{self.legislation_text}"))
+        
+        messages.extend(self.memory.load_memory_variables({})["history"])
+        messages.append(HumanMessage(content=question))
+        return messages
+    
+    def set_legislation_beliefs(self, legislation: str):
+        """
+        Make the politician aware of the legislation being discussed.
+        
+        Args:
+            legislation: The text of the legislation
+        """
+        self.legislation_text = legislation
+    
+    def _get_fallback_beliefs(self) -> str:
+        """
+        Get generic beliefs, used when researching the politician fails.
+        
+        Returns:
+            A string containing generic political beliefs
+        """
+        return f"A politician with moderate views on most issues. Represents {self.party_name}."
+    
+    def _research_beliefs(self) -> str:
+        """
+        Research the politician's beliefs with the agent.
         
+        Returns:
+            A string containing the politician's political beliefs
+        """
         prompt = self.prompt_manager.format_prompt(
             'politician', 
             'beliefs_prompt', 
             full_name=f'"{self.full_name}" polityk {self.party_name} Polska'
         )
         
-        try:
+        summary = self.agent_executor.invoke({"input": prompt})
+        output = summary['output']
+        
+        # Verify we got the right person
+        if self.last_name.lower() not in output.lower():
+            # Try again with more specific search
+            prompt = f'Find information about Polish politician {self.full_name} from {self.party_name} party'
             summary = self.agent_executor.invoke({"input": prompt})
             output = summary['output']
-            
-            # Verify we got the right person
-            if self.last_name.lower() not in output.lower():
-                # Try again with more specific search
-                prompt = f'Find information about Polish politician {self.full_name} from {self.party_name} party'
-                summary = self.agent_executor.invoke({"input": prompt})
-                output = summary['output']
-            
-            return output
-        except Exception as e:
-            # Fallback if agent execution fails
-            return f"A politician with moderate views on most issues. Represents {self.party_name}."
+        
+        return output
     
     def _set_system_prompt(self) -> str:
         """
@@ -174,9 +292,7 @@ class PoliticianAgent(BaseAgent):
         Returns:
             The configured agent
         """
-        langsmith_api_key = os.getenv("LANGSMITH_API_KEY")
-        hub_client = Client(api_key=langsmith_api_key)
-        basic_prompt = hub_client.pull_prompt("hwchase17/openai-tools-agent")
+        basic_prompt = load_agent_prompt("hwchase17/openai-tools-agent")
         return create_tool_calling_agent(self.llm, self.tools, basic_prompt)
     
     def _get_context(self) -> Dict[str, Any]:
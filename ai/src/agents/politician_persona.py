@@ -0,0 +1,264 @@
+# ai/src/agents/politician_persona.py
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+from langchain.memory import ConversationSummaryBufferMemory
+from langchain_core.messages import HumanMessage, SystemMessage
+from langsmith import traceable
+
+from ..utilities.prompt_manager import PromptManager
+from .cache_manager import cache_manager, POLITICIANS
+from .llm_gateway import llm_gateway
+from .politician_agent import PoliticianAgent, persona_fingerprint
+
+# Prompt templates shared by every persona
+_prompt_manager = PromptManager()
+
+# Per-simulation state of each persona, set by SupervisorAgent.simulation_scope
+_simulation_sessions: ContextVar[Optional[Dict]] = ContextVar("simulation_sessions", default=None)
+
+
+@contextmanager
+def simulation_session_scope(sessions: Dict):
+    """
+    Keep persona memories and legislation in the given dictionary for the calls made inside the block.
+
+    Personas are shared by every simulation in the process; each simulation passes its own
+    dictionary, so their conversations do not mix.
+    """
+    token = _simulation_sessions.set(sessions)
+    try:
+        yield
+    finally:
+        _simulation_sessions.reset(token)
+
+
+class PersonaSession:
+    """A politician's membership in one simulation: their name and role there, and what they have heard and said"""
+    __slots__ = ('name', 'role', 'memory', 'legislation_text')
+
+    def __init__(self):
+        self.name: Optional[str] = None
+        self.role = ""
+        self.memory: Optional[ConversationSummaryBufferMemory] = None
+        self.legislation_text = ""
+
+
+def _refresh_persona(persona: "PoliticianPersona"):
+    """Research a stale persona again (run in the background by the cache) and update it in place"""
+    PoliticianAgent(persona.first_name, persona.last_name, persona.party_name)._refresh_beliefs()
+    cached_data = cache_manager.get_politician(
+        persona.first_name, persona.last_name, persona.party_name, fingerprint=persona_fingerprint(_prompt_manager)
+    )
+    if cached_data:
+        persona.update_beliefs(cached_data['beliefs'])
+
+
+class PoliticianPersona:
+    """
+    Lightweight politician taking part in simulations.
+
+    Holds only the politician's identity and beliefs; the LLM client and prompt
+    templates are shared by every persona. The name, role and conversation memory
+    of each simulation are kept in its PersonaSession, the memory created on first use. A full research PoliticianAgent (with its own
+    tools and executor) is only built when the beliefs are not cached yet.
+    """
+    __slots__ = ('first_name', 'last_name', 'full_name', 'party_name', 'beliefs', '_system_prompt', '_session')
+
+    # Same memory budget as PoliticianAgent
+    memory_max_tokens: int = PoliticianAgent.memory_max_tokens
+
+    def __init__(self, first_name: str, last_name: str, party_name: str, beliefs: str):
+        """
+        Initialize a persona from known beliefs (use load() to get them from the cache or research).
+
+        Args:
+            first_name: The first name of the politician
+            last_name: The last name of the politician
+            party_name: The name of the party the politician belongs to
+            beliefs: The politician's political beliefs
+        """
+        self.first_name = first_name
+        self.last_name = last_name
+        self.full_name = f"{first_name} {last_name}"
+        self.party_name = party_name
+        self.beliefs = beliefs
+        self._system_prompt: Optional[str] = None
+        # Session used outside of any simulation scope
+        self._session: Optional[PersonaSession] = None
+
+    @classmethod
+    def load(cls, first_name: str, last_name: str, party_name: str = "") -> "PoliticianPersona":
+        """
+        Load a politician's persona from the cache, researching it only on a cache miss.
+
+        Args:
+            first_name: The first name of the politician
+            last_name: The last name of the politician
+            party_name: The name of the party the politician belongs to
+
+        Returns:
+            The persona
+        """
+        fingerprint = persona_fingerprint(_prompt_manager)
+        cached_entry = cache_manager.get_politician_entry(first_name, last_name, party_name, fingerprint=fingerprint)
+        if cached_entry is None:
+            # The research agent researches and caches the persona, then is dropped
+            agent = PoliticianAgent(first_name, last_name, party_name)
+            return cls(first_name, last_name, party_name, agent.beliefs)
+
+        print(f"✅ Loaded {first_name} {last_name} from cache!")
+        persona = cls(first_name, last_name, party_name, cached_entry.data['beliefs'])
+        if cached_entry.stale:
+            # The persona is used right away and gets the refreshed beliefs once they are researched
+            cache_manager.revalidate(
+                POLITICIANS,
+                cache_manager.get_politician_key(first_name, last_name, party_name),
+                _refresh_persona, persona
+            )
+        return persona
+
+    def update_beliefs(self, beliefs: str):
+        """
+        Replace the politician's beliefs (e.g. after they were researched again).
+
+        Args:
+            beliefs: The new political beliefs
+        """
+        self.beliefs = beliefs
+        self._system_prompt = None
+
+    @property
+    def session(self) -> PersonaSession:
+        """The persona's state in the current simulation"""
+        sessions = _simulation_sessions.get()
+        if sessions is None:
+            if self._session is None:
+                self._session = PersonaSession()
+            return self._session
+
+        session = sessions.get(self)
+        if session is None:
+            session = sessions.setdefault(self, PersonaSession())
+        return session
+
+    @property
+    def name(self) -> str:
+        """The politician's name as given in the current simulation"""
+        return self.session.name or self.full_name
+
+    @name.setter
+    def name(self, value: str):
+        self.session.name = value
+
+    @property
+    def role(self) -> str:
+        """The politician's role in the current simulation"""
+        return self.session.role
+
+    @role.setter
+    def role(self, value: str):
+        self.session.role = value
+
+    @property
+    def memory(self) -> ConversationSummaryBufferMemory:
+        """The conversation memory of the current simulation"""
+        session = self.session
+        if session.memory is None:
+            session.memory = ConversationSummaryBufferMemory(
+                llm=self.model,
+                max_token_limit=self.memory_max_tokens,
+                return_messages=True
+            )
+        return session.memory
+
+    @property
+    def legislation_text(self) -> str:
+        return self.session.legislation_text
+
+    @property
+    def model(self):
+        """The shared LLM client"""
+        return llm_gateway.get_chat_model(os.getenv("GPT_MODEL_NAME", "gpt-4o-mini"), temperature=0.7,
+                                          max_tokens=2000)
+
+    @property
+    def system_prompt(self) -> str:
+        if self._system_prompt is None:
+            self._system_prompt = _prompt_manager.format_prompt(
+                'politician',
+                'system_prompt',
+                full_name=self.full_name,
+                party_name=self.party_name,
+                beliefs=self.beliefs
+            )
+        return self._system_prompt
+
+    @traceable(name="Get Politician Opinion")
+    def answer_question(self, question: str) -> str:
+        """
+        Answer a question as this politician.
+
+        Args:
+            question: The question to answer
+
+        Returns:
+            The politician's response
+        """
+        memory = self.memory
+        response = self.model.invoke(self._build_messages(question, memory))
+
+        memory.save_context({"input": question}, {"output": response.content})
+        return response.content
+
+    @traceable(name="Get Politician Opinion")
+    async def aanswer_question(self, question: str) -> str:
+        """
+        Answer a question as this politician without blocking the event loop.
+
+        Args:
+            question: The question to answer
+
+        Returns:
+            The politician's response
+        """
+        memory = self.memory
+        response = await self.model.ainvoke(self._build_messages(question, memory))
+
+        await memory.asave_context({"input": question}, {"output": response.content})
+        return response.content
+
+    def _build_messages(self, question: str, memory: ConversationSummaryBufferMemory) -> List:
+        """Build the messages sent to the LLM for a question (same layout as PoliticianAgent)"""
+        messages = [SystemMessage(content=self.system_prompt)]
+        if self.legislation_text:
+            messages.append(SystemMessage(content=f"Legislation under discussion:\n{self.legislation_text}"))
+
+        messages.extend(memory.load_memory_variables({})["history"])
+        messages.append(HumanMessage(content=question))
+        return messages
+
+    def set_legislation_beliefs(self, legislation: str):
+        """
+        Make the politician aware of the legislation being discussed in the current simulation.
+
+        Args:
+            legislation: The text of the legislation
+        """
+        self.session.legislation_text = legislation
+
+    def _get_context(self) -> Dict[str, Any]:
+        """
+        Get the context for the politician.
+
+        Returns:
+            A dictionary containing context information
+        """
+        return {
+            "name": self.full_name,
+            "party": self.party_name,
+            "role": self.role,
+            "beliefs": self.beliefs
+        }
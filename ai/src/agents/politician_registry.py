@@ -0,0 +1,138 @@
+# ai/src/agents/politician_registry.py
+import threading
+import unicodedata
+from typing import Dict, List, Optional, Tuple
+
+from .politician_persona import PoliticianPersona
+from .single_flight import single_flight
+
+# Letters NFKD does not decompose into a base letter and a diacritic
+_FOLDED_LETTERS = str.maketrans({'ł': 'l', 'Ł': 'L', 'ø': 'o', 'Ø': 'O', 'đ': 'd', 'Đ': 'D'})
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a person or party name for identity comparisons.
+
+    "Rafał  Trzaskowski" and "rafal trzaskowski" normalize to the same string, so names
+    typed with or without Polish diacritics refer to the same politician.
+
+    Args:
+        name: The name
+
+    Returns:
+        The name without diacritics, casefolded and with single spaces
+    """
+    decomposed = unicodedata.normalize('NFKD', name.translate(_FOLDED_LETTERS))
+    stripped = ''.join(char for char in decomposed if not unicodedata.combining(char))
+    return ' '.join(stripped.casefold().split())
+
+
+class PoliticianRegistry:
+    """
+    Identity map of politicians: one PoliticianPersona per (normalized name, party) and process.
+
+    Shared by AgentManager and PartyAgent, so a politician added to a party is built, and
+    researched, only once however many simulations and parties refer to them. Concurrent
+    requests for the same politician wait for the one persona being built.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._politicians: Dict[Tuple[str, str], PoliticianPersona] = {}
+        self._stats = {'created': 0, 'reused': 0}
+
+    @staticmethod
+    def key(full_name: str, party_name: str = "") -> Tuple[str, str]:
+        """Get the identity of a politician"""
+        return normalize_name(full_name), normalize_name(party_name)
+
+    def get(self, full_name: str, party_name: str = "") -> Optional[PoliticianPersona]:
+        """Get a politician if it was already loaded"""
+        with self._lock:
+            return self._politicians.get(self.key(full_name, party_name))
+
+    def get_or_create(self, first_name: str, last_name: str, party_name: str = "") -> PoliticianPersona:
+        """
+        Get the persona of a politician, loading it on first use.
+
+        Args:
+            first_name: The first name of the politician
+            last_name: The last name of the politician
+            party_name: The name of the party the politician belongs to
+
+        Returns:
+            The politician's persona, shared with every other caller
+        """
+        key = self.key(f"{first_name} {last_name}", party_name)
+        with self._lock:
+            politician = self._politicians.get(key)
+            if politician is not None:
+                self._stats['reused'] += 1
+                return politician
+
+        return single_flight.do(("politician_persona", key), self._create, key, first_name, last_name, party_name)
+
+    def _create(self, key: Tuple[str, str], first_name: str, last_name: str, party_name: str) -> PoliticianPersona:
+        # A caller that just finished building it may have registered it already
+        with self._lock:
+            politician = self._politicians.get(key)
+            if politician is not None:
+                self._stats['reused'] += 1
+                return politician
+
+        politician = PoliticianPersona.load(first_name, last_name, party_name)
+        with self._lock:
+            self._politicians[key] = politician
+            self._stats['created'] += 1
+        return politician
+
+    def update_beliefs(self, full_name: str, party_name: str, beliefs: str) -> bool:
+        """
+        Give a loaded politician new beliefs (e.g. after their persona was rebuilt).
+
+        Simulations holding the persona use the new beliefs from their next question on.
+
+        Args:
+            full_name: The full name of the politician
+            party_name: The name of the party the politician belongs to
+            beliefs: The new political beliefs
+
+        Returns:
+            Whether the politician was loaded
+        """
+        politician = self.get(full_name, party_name)
+        if politician is None:
+            return False
+        politician.update_beliefs(beliefs)
+        return True
+
+    def remove(self, full_name: str, party_name: str = "") -> bool:
+        """Forget a politician (the next request loads it again)"""
+        with self._lock:
+            return self._politicians.pop(self.key(full_name, party_name), None) is not None
+
+    def clear(self):
+        """Forget every politician"""
+        with self._lock:
+            self._politicians.clear()
+
+    def all(self) -> List[PoliticianPersona]:
+        """Get every politician loaded so far"""
+        with self._lock:
+            return list(self._politicians.values())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._politicians)
+
+    def get_stats(self) -> Dict:
+        """Get registry statistics"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['politicians'] = len(self._politicians)
+        return stats
+
+
+# Create global registry shared by every agent manager and party
+politician_registry = PoliticianRegistry()
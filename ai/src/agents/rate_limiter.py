@@ -0,0 +1,470 @@
+# ai/src/agents/rate_limiter.py
+import os
+import json
+import time
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+import httpx
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at rate_per_minute (a rate of 0 disables the limit)"""
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate_per_second = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate_per_second > 0
+
+    def reserve(self, amount: float = 1.0) -> float:
+        """Take tokens now and return how long the caller must wait before using them"""
+        if not self.enabled:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate_per_second)
+            self._updated_at = now
+            # Tokens may go negative: later callers queue up behind the debt
+            self._tokens -= min(amount, self.capacity)
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate_per_second
+
+    def refund(self, amount: float):
+        """Give back tokens that were reserved but not used"""
+        if not self.enabled or amount <= 0:
+            return
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + amount)
+
+    def acquire(self, amount: float = 1.0):
+        """Block until the tokens are available"""
+        wait = self.reserve(amount)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, amount: float = 1.0):
+        """Wait on the event loop until the tokens are available"""
+        wait = self.reserve(amount)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD concurrency window: grows additively on success and shrinks
+    multiplicatively when the provider signals overload (429s and timeouts).
+    Usable from threads and from asyncio tasks at the same time.
+    """
+
+    def __init__(self, initial: int = 8, minimum: int = 1, maximum: int = 32,
+                 decrease_factor: float = 0.5):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.decrease_factor = decrease_factor
+        self._limit = float(min(max(initial, self.minimum), self.maximum))
+        self._in_flight = 0
+        self._cond = threading.Condition()
+        self._async_waiters = deque()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self):
+        """Block until a slot in the window is free"""
+        with self._cond:
+            while self._in_flight >= self.limit:
+                self._cond.wait()
+            self._in_flight += 1
+
+    async def aacquire(self):
+        """Wait on the event loop until a slot in the window is free"""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._cond:
+                if self._in_flight < self.limit:
+                    self._in_flight += 1
+                    return
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            await waiter
+
+    def release(self, overloaded: bool = False):
+        """Free a slot and adapt the window to the outcome of the request"""
+        with self._cond:
+            self._in_flight -= 1
+            if overloaded:
+                self._limit = max(self.minimum, self._limit * self.decrease_factor)
+            else:
+                # Roughly +1 per full window of successful requests
+                self._limit = min(self.maximum, self._limit + 1.0 / self._limit)
+
+            self._cond.notify_all()
+            while self._async_waiters:
+                loop, waiter = self._async_waiters.popleft()
+                # Waiters that were cancelled or whose event loop has ended need no wake-up
+                if not waiter.done() and not loop.is_closed():
+                    loop.call_soon_threadsafe(_wake, waiter)
+
+
+def _wake(waiter: asyncio.Future):
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class LLMGovernor:
+    """
+    Shared limiter every LLM request goes through: requests-per-minute and
+    tokens-per-minute buckets in front of an AIMD concurrency window.
+    """
+
+    def __init__(self, requests_per_minute: Optional[float] = None, tokens_per_minute: Optional[float] = None,
+                 initial_concurrency: Optional[int] = None, min_concurrency: Optional[int] = None,
+                 max_concurrency: Optional[int] = None):
+        self.requests = TokenBucket(float(requests_per_minute if requests_per_minute is not None
+                                          else os.getenv("LLM_RATE_LIMIT_RPM", "0")))
+        self.tokens = TokenBucket(float(tokens_per_minute if tokens_per_minute is not None
+                                        else os.getenv("LLM_RATE_LIMIT_TPM", "0")))
+        self.concurrency = AdaptiveConcurrencyLimiter(
+            initial=initial_concurrency or int(os.getenv("LLM_CONCURRENCY_INITIAL", "8")),
+            minimum=min_concurrency or int(os.getenv("LLM_CONCURRENCY_MIN", "1")),
+            maximum=max_concurrency or int(os.getenv("LLM_CONCURRENCY_MAX", "32"))
+        )
+        self._lock = threading.Lock()
+        self._paused_until = 0.0
+        self._stats = {'requests': 0, 'throttled': 0, 'timeouts': 0}
+
+    def _pause_remaining(self) -> float:
+        return max(0.0, self._paused_until - time.monotonic())
+
+    def acquire(self, estimated_tokens: int = 0):
+        """Block until a request of the given size may be sent"""
+        pause = self._pause_remaining()
+        if pause:
+            time.sleep(pause)
+        self.requests.acquire(1)
+        self.tokens.acquire(estimated_tokens)
+        self.concurrency.acquire()
+
+    async def aacquire(self, estimated_tokens: int = 0):
+        """Wait on the event loop until a request of the given size may be sent"""
+        pause = self._pause_remaining()
+        if pause:
+            await asyncio.sleep(pause)
+        await self.requests.aacquire(1)
+        await self.tokens.aacquire(estimated_tokens)
+        await self.concurrency.aacquire()
+
+    def release(self, status_code: Optional[int] = None, timed_out: bool = False,
+                retry_after: Optional[float] = None):
+        """Record the outcome of a request and free its concurrency slot"""
+        throttled = status_code == 429
+        with self._lock:
+            self._stats['requests'] += 1
+            if throttled:
+                self._stats['throttled'] += 1
+            if timed_out:
+                self._stats['timeouts'] += 1
+            if retry_after:
+                self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+        self.concurrency.release(overloaded=throttled or timed_out)
+
+    def get_stats(self) -> Dict:
+        """Get limiter statistics"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats.update({
+            'concurrency_limit': self.concurrency.limit,
+            'in_flight': self.concurrency.in_flight,
+            'requests_per_minute': self.requests.rate_per_second * 60,
+            'tokens_per_minute': self.tokens.rate_per_second * 60
+        })
+        return stats
+
+
+def estimate_request_tokens(request: httpx.Request) -> int:
+    """Estimate the tokens a chat completion request counts against TPM (prompt plus max_tokens)"""
+    try:
+        body = request.content
+    except httpx.RequestNotRead:
+        return 0
+    if not body:
+        return 0
+
+    estimate = len(body) // 4
+    try:
+        payload = json.loads(body)
+        estimate += int(payload.get('max_tokens') or payload.get('max_completion_tokens') or 0)
+    except (ValueError, AttributeError, TypeError):
+        pass
+    return estimate
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    try:
+        return float(response.headers.get('retry-after', ''))
+    except ValueError:
+        return None
+
+
+class _GovernedStream:
+    """
+    Response body that holds the request's concurrency slot until the response is closed,
+    so the AIMD window counts requests whose body is still being received.
+    """
+
+    def __init__(self, stream, governor: LLMGovernor, status_code: int, retry_after: Optional[float]):
+        self._stream = stream
+        self._governor = governor
+        self._status_code = status_code
+        self._retry_after = retry_after
+        self._timed_out = False
+        self._released = False
+
+    def _release(self):
+        if not self._released:
+            self._released = True
+            self._governor.release(status_code=self._status_code, timed_out=self._timed_out,
+                                   retry_after=self._retry_after)
+
+
+class _GovernedByteStream(_GovernedStream, httpx.SyncByteStream):
+    def __iter__(self):
+        try:
+            for chunk in self._stream:
+                yield chunk
+        except httpx.TimeoutException:
+            self._timed_out = True
+            raise
+
+    def close(self):
+        try:
+            self._stream.close()
+        finally:
+            self._release()
+
+
+class _AsyncGovernedByteStream(_GovernedStream, httpx.AsyncByteStream):
+    async def __aiter__(self):
+        try:
+            async for chunk in self._stream:
+                yield chunk
+        except httpx.TimeoutException:
+            self._timed_out = True
+            raise
+
+    async def aclose(self):
+        try:
+            await self._stream.aclose()
+        finally:
+            self._release()
+
+
+def _govern_response(governor: LLMGovernor, response: httpx.Response, stream_class) -> httpx.Response:
+    """Free the request's concurrency slot when the response is closed"""
+    if isinstance(response.stream, httpx.ByteStream):
+        # The body is already in memory (httpx never closes such responses), nothing is left in flight
+        governor.release(status_code=response.status_code, retry_after=_retry_after(response))
+    else:
+        response.stream = stream_class(response.stream, governor, response.status_code, _retry_after(response))
+    return response
+
+
+class GovernedTransport(httpx.BaseTransport):
+    """
+    httpx transport that routes every request through an LLMGovernor.
+    The concurrency slot is freed when the response is closed, not when its headers arrive.
+    """
+
+    def __init__(self, governor: LLMGovernor, transport: Optional[httpx.BaseTransport] = None):
+        self.governor = governor
+        self._transport = transport or httpx.HTTPTransport()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.governor.acquire(estimate_request_tokens(request))
+        try:
+            response = self._transport.handle_request(request)
+        except httpx.TimeoutException:
+            self.governor.release(timed_out=True)
+            raise
+        except BaseException:
+            # Also when cancelled (asyncio.CancelledError, KeyboardInterrupt), or the slot is lost for good
+            self.governor.release()
+            raise
+        return _govern_response(self.governor, response, _GovernedByteStream)
+
+    def close(self):
+        self._transport.close()
+
+
+class AsyncGovernedTransport(httpx.AsyncBaseTransport):
+    """Async httpx transport that routes every request through an LLMGovernor (see GovernedTransport)"""
+
+    def __init__(self, governor: LLMGovernor, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.governor = governor
+        self._transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await self.governor.aacquire(estimate_request_tokens(request))
+        try:
+            response = await self._transport.handle_async_request(request)
+        except httpx.TimeoutException:
+            self.governor.release(timed_out=True)
+            raise
+        except BaseException:
+            # Also when cancelled (asyncio.CancelledError, KeyboardInterrupt), or the slot is lost for good
+            self.governor.release()
+            raise
+        return _govern_response(self.governor, response, _AsyncGovernedByteStream)
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+# Create global governor shared by every LLM client
+llm_governor = LLMGovernor()
+
+
+def check_governed_transports(requests: int = 60, throttle_every: int = 4) -> Dict:
+    """
+    Exercise the governed transports against a local fake provider (httpx.MockTransport)
+    that answers every throttle_every-th request with 429, and against a slow one whose
+    requests are cancelled.
+
+    Args:
+        requests: Number of requests sent by each transport
+        throttle_every: Every how many requests the fake answers 429
+
+    Returns:
+        A dictionary with the governor statistics and the failed checks (empty if all passed)
+    """
+    counter = {'requests': 0}
+    counter_lock = threading.Lock()
+
+    class StreamedBody(httpx.SyncByteStream, httpx.AsyncByteStream):
+        """Body received after the headers, like from a real connection"""
+
+        def __init__(self, payload: Dict):
+            self._body = json.dumps(payload).encode()
+
+        def __iter__(self):
+            yield self._body
+
+        async def __aiter__(self):
+            yield self._body
+
+    def fake_provider(request: httpx.Request) -> httpx.Response:
+        with counter_lock:
+            counter['requests'] += 1
+            throttled = counter['requests'] % throttle_every == 0
+        if throttled:
+            return httpx.Response(429, stream=StreamedBody({'error': {'message': 'Rate limit reached'}}))
+        return httpx.Response(200, stream=StreamedBody({'choices': [{'message': {'content': 'ok'}}]}))
+
+    governor = LLMGovernor(requests_per_minute=0, tokens_per_minute=0,
+                           initial_concurrency=8, min_concurrency=1, max_concurrency=32)
+    failures = []
+
+    def check(condition: bool, description: str):
+        if not condition:
+            failures.append(description)
+
+    url = "http://fake-provider/v1/chat/completions"
+    with httpx.Client(transport=GovernedTransport(governor, httpx.MockTransport(fake_provider))) as client:
+        # The slot is held until the body has been read and the response closed
+        with client.stream("POST", url, json={'max_tokens': 10}) as response:
+            check(governor.concurrency.in_flight == 1, "slot held while the body is unread")
+            response.read()
+        check(governor.concurrency.in_flight == 0, "slot freed when the response is closed")
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            statuses = list(executor.map(lambda _: client.post(url, json={'max_tokens': 10}).status_code,
+                                         range(requests)))
+        check(governor.concurrency.in_flight == 0, "no slot leaked by the sync transport")
+
+    async def send_async():
+        transport = AsyncGovernedTransport(governor, httpx.MockTransport(fake_provider))
+        async with httpx.AsyncClient(transport=transport) as client:
+            async with client.stream("POST", url, json={'max_tokens': 10}) as response:
+                check(governor.concurrency.in_flight == 1, "slot held while the async body is unread")
+                await response.aread()
+            responses = await asyncio.gather(*(client.post(url, json={'max_tokens': 10}) for _ in range(requests)))
+        return [response.status_code for response in responses]
+
+    statuses += asyncio.run(send_async())
+    check(governor.concurrency.in_flight == 0, "no slot leaked by the async transport")
+
+    # Responses whose body is already in memory are never closed by httpx
+    in_memory_governor = LLMGovernor(requests_per_minute=0, tokens_per_minute=0)
+    in_memory = httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+    with httpx.Client(transport=GovernedTransport(in_memory_governor, in_memory)) as client:
+        client.post(url, json={'max_tokens': 10})
+    check(in_memory_governor.concurrency.in_flight == 0, "slot freed for a response read into memory")
+
+    # Requests cancelled while waiting for the provider (asyncio.wait_for, client disconnects) free their slot
+    cancel_governor = LLMGovernor(requests_per_minute=0, tokens_per_minute=0,
+                                  initial_concurrency=2, min_concurrency=1, max_concurrency=2)
+
+    async def slow_provider(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(1)
+        return httpx.Response(200, json={})
+
+    async def cancel_async():
+        transport = AsyncGovernedTransport(cancel_governor, httpx.MockTransport(slow_provider))
+        async with httpx.AsyncClient(transport=transport) as client:
+            for _ in range(2):
+                try:
+                    await asyncio.wait_for(client.post(url, json={'max_tokens': 10}), 0.05)
+                except asyncio.TimeoutError:
+                    pass
+        check(cancel_governor.concurrency.in_flight == 0, "slot freed when a request is cancelled")
+
+    async def cancel_waiter():
+        # A waiter cancelled while the window is full is skipped when a slot frees up
+        try:
+            await asyncio.wait_for(cancel_governor.concurrency.aacquire(), 0.05)
+        except asyncio.TimeoutError:
+            pass
+
+    asyncio.run(cancel_async())
+    if cancel_governor.concurrency.in_flight == 0:
+        cancel_governor.concurrency.acquire()
+        cancel_governor.concurrency.acquire()
+        asyncio.run(cancel_waiter())
+        try:
+            # The waiter's event loop has ended by now
+            cancel_governor.concurrency.release()
+            cancel_governor.concurrency.release()
+        except RuntimeError as e:
+            check(False, f"release with a waiter from a closed event loop ({e})")
+
+    stats = governor.get_stats()
+    check(stats['throttled'] == statuses.count(429), "every 429 counted as throttled")
+    check(stats['requests'] == counter['requests'], "every request released exactly once")
+    check(stats['concurrency_limit'] < 8, "429s shrink the concurrency window")
+    return {'stats': stats, 'failures': failures}
+
+
+if __name__ == "__main__":
+    result = check_governed_transports()
+    print(json.dumps(result['stats'], indent=2))
+    for failure in result['failures']:
+        print(f"❌ Check failed: {failure}")
+    if result['failures']:
+        raise SystemExit(1)
+    print("✅ Governed transports release their slots on close and on cancellation, and back off on 429s")
@@ -0,0 +1,169 @@
+# ai/src/agents/simulation_snapshot.py
+"""Save a built simulation to a compact file and restore it without research or network calls"""
+
+import gzip
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from langchain_core.messages import messages_from_dict, messages_to_dict
+
+from .party_agent import PartyAgent
+from .politician_persona import PoliticianPersona, simulation_session_scope
+from .supervisor_agent import SupervisorAgent
+
+# Format of the snapshot files (bump the version on incompatible changes)
+SNAPSHOT_FORMAT = "ai-parliament-simulation"
+SNAPSHOT_VERSION = 1
+
+
+def snapshot_path(name: str) -> Path:
+    """Get the path of a named snapshot in SIMULATION_SNAPSHOT_DIR"""
+    return Path(os.getenv("SIMULATION_SNAPSHOT_DIR", "cache/snapshots")) / f"{name}.json.gz"
+
+
+def _dump_memory(memory) -> Dict:
+    return {
+        'summary': memory.moving_summary_buffer,
+        'messages': messages_to_dict(memory.chat_memory.messages)
+    }
+
+
+def _restore_memory(memory, data: Dict):
+    memory.moving_summary_buffer = data.get('summary', '')
+    memory.chat_memory.messages = messages_from_dict(data.get('messages', []))
+
+
+def save_snapshot(supervisor: SupervisorAgent, path: str, include_memory: bool = True) -> Dict:
+    """
+    Save a simulation: its configuration, the persona of every politician and, optionally,
+    the conversation so far (memories, legislation and results).
+
+    Args:
+        supervisor: The simulation
+        path: The file to write (gzip-compressed JSON)
+        include_memory: Whether to save the conversation so far, to resume the session later
+
+    Returns:
+        A summary of the snapshot
+    """
+    snapshot: Dict[str, Any] = {
+        'format': SNAPSHOT_FORMAT,
+        'version': SNAPSHOT_VERSION,
+        'created_at': datetime.now().isoformat(),
+        'cache_mode': supervisor.cache_mode,
+        'concurrent_deliberation': supervisor.concurrent_deliberation,
+        'max_concurrency': supervisor.max_concurrency,
+        'parties': []
+    }
+
+    with supervisor.simulation_scope():
+        for party in supervisor.parties:
+            party_data = {
+                'name': party.party_name,
+                'acronym': party.party_acronym,
+                'party_info': party.party_info,
+                'politicians': []
+            }
+            for politician in party.politicians:
+                politician_data = {
+                    'first_name': politician.first_name,
+                    'last_name': politician.last_name,
+                    'name': politician.name,
+                    'role': politician.role,
+                    'beliefs': politician.beliefs
+                }
+                if include_memory:
+                    session = politician.session
+                    politician_data['legislation_text'] = session.legislation_text
+                    if session.memory is not None:
+                        politician_data['memory'] = _dump_memory(session.memory)
+                party_data['politicians'].append(politician_data)
+            if include_memory:
+                party_data['discussion_history'] = party.discussion_history
+            snapshot['parties'].append(party_data)
+
+    if include_memory:
+        snapshot['legislation_text'] = supervisor.legislation_text
+        snapshot['simulation_results'] = supervisor.simulation_results
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+        # Results may hold values JSON has no type for; they are saved as text
+        json.dump(snapshot, f, ensure_ascii=False, default=str)
+    tmp_path.replace(path)
+
+    politicians = sum(len(party['politicians']) for party in snapshot['parties'])
+    print(f"💾 Saved simulation snapshot with {len(snapshot['parties'])} parties and {politicians} politicians to {path}")
+    return {
+        'path': str(path),
+        'parties': len(snapshot['parties']),
+        'politicians': politicians,
+        'include_memory': include_memory,
+        'size_kb': path.stat().st_size / 1024
+    }
+
+
+def load_snapshot(path: str) -> SupervisorAgent:
+    """
+    Restore a simulation saved with save_snapshot.
+
+    Parties and personas are rebuilt from the snapshot alone: nothing is researched,
+    looked up or read from the cache. The restored personas belong to this simulation
+    only (they are not added to the politician registry), so they keep the saved beliefs.
+
+    Args:
+        path: The snapshot file
+
+    Returns:
+        The restored simulation
+
+    Raises:
+        ValueError: If the file is not a snapshot or has a newer version
+    """
+    start_time = time.time()
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        snapshot = json.load(f)
+    if snapshot.get('format') != SNAPSHOT_FORMAT:
+        raise ValueError(f"{path} is not a simulation snapshot")
+    if snapshot.get('version', 0) > SNAPSHOT_VERSION:
+        raise ValueError(f"Simulation snapshot version {snapshot.get('version')} is newer than "
+                         f"supported version {SNAPSHOT_VERSION}")
+
+    supervisor = SupervisorAgent(
+        concurrent_deliberation=snapshot.get('concurrent_deliberation', True),
+        max_concurrency=snapshot.get('max_concurrency', 4),
+        cache_mode=snapshot.get('cache_mode')
+    )
+    supervisor.legislation_text = snapshot.get('legislation_text', '')
+    supervisor.simulation_results = snapshot.get('simulation_results', {})
+
+    with supervisor.simulation_scope():
+        for party_data in snapshot['parties']:
+            party = PartyAgent(party_data['name'], party_data['acronym'], party_info=party_data['party_info'])
+            party.discussion_history = party_data.get('discussion_history', [])
+
+            for politician_data in party_data['politicians']:
+                # Personas of their own: the registered ones may have other beliefs by now
+                politician = PoliticianPersona(
+                    politician_data['first_name'], politician_data['last_name'],
+                    party.party_name, politician_data['beliefs']
+                )
+                politician.name = politician_data['name']
+                politician.role = politician_data['role']
+
+                session = politician.session
+                session.legislation_text = politician_data.get('legislation_text', '')
+                if 'memory' in politician_data:
+                    _restore_memory(politician.memory, politician_data['memory'])
+                party.politicians.append(politician)
+
+            supervisor.add_party(party)
+
+    print(f"⏱️ Restored simulation snapshot {path} in {time.time() - start_time:.3f}s")
+    return supervisor
@@ -0,0 +1,82 @@
+# ai/src/agents/single_flight.py
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class _Flight:
+    """A computation in progress and its outcome"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical loads: while a computation for a key is in flight,
+    other callers with the same key wait for it and share its result instead of
+    starting their own.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._stats = {'executions': 0, 'coalesced': 0}
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run fn once per key at a time.
+
+        Args:
+            key: Identifies identical loads (e.g. the cache key of the entry being loaded)
+            fn: The computation
+            *args, **kwargs: Arguments passed to fn
+
+        Returns:
+            The result of fn, shared by every caller that joined the same flight.
+            If fn raises, every caller gets the exception.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+                leader = True
+                self._stats['executions'] += 1
+            else:
+                leader = False
+                self._stats['coalesced'] += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = fn(*args, **kwargs)
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            # Later callers start a new flight (and will usually find the result in the cache)
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def in_flight(self) -> int:
+        """Get the number of computations currently running"""
+        with self._lock:
+            return len(self._flights)
+
+    def get_stats(self) -> Dict:
+        """Get single-flight statistics"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['in_flight'] = len(self._flights)
+        return stats
+
+
+# Create global single-flight group shared by politician, party and Wikipedia loads
+single_flight = SingleFlight()
@@ -1,28 +1,64 @@
 import os
+import asyncio
+import functools
+from contextlib import contextmanager
 from .base_agent import BaseAgent
 from .party_agent import PartyAgent
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain.agents import create_tool_calling_agent, AgentExecutor
-from langsmith import Client
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from ..utilities.agent_prompt import load_agent_prompt
+from .llm_cache import cache_mode_scope, CACHE_MODES
+from .politician_persona import simulation_session_scope
 
 # Import the simulation modules
-from ..simulation.party_discussion import discuss_legislation, PartyPosition
+from ..simulation.party_discussion import discuss_legislation, adiscuss_legislation, PartyPosition
 from ..simulation.inter_party_debate import conduct_inter_party_debate, InterPartyDebate
-from ..simulation.voting_system import simulate_voting
+from ..simulation.voting_system import simulate_voting, asimulate_voting, VotingResult
+
+def _in_simulation_scope(method):
+    """Run a supervisor method with the simulation's settings applied to every LLM call"""
+    if asyncio.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def async_wrapper(self, *args, **kwargs):
+            with self.simulation_scope():
+                return await method(self, *args, **kwargs)
+        return async_wrapper
+    
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.simulation_scope():
+            return method(self, *args, **kwargs)
+    return wrapper
+
 
 class SupervisorAgent(BaseAgent):
     """
     Agent that manages the coordination of the system and information flow.
     """
-    def __init__(self):
+    def __init__(self, concurrent_deliberation: bool = True, max_concurrency: int = 4,
+                 cache_mode: Optional[str] = None):
         """
         Initialize a supervisor agent.
+        
+        Args:
+            concurrent_deliberation: Whether parties deliberate internally at the same time
+            max_concurrency: Maximum number of parties deliberating (and politicians voting) at once
+            cache_mode: "replay" to answer from recorded LLM responses, "fresh" to always
+                        call the model, or None to use the process default (LLM_CACHE_MODE)
         """
+        if cache_mode is not None and cache_mode not in CACHE_MODES:
+            raise ValueError(f"Unknown LLM cache mode: {cache_mode}")
+        
         super().__init__()
+        self.cache_mode = cache_mode
         self.parties: List[PartyAgent] = []
         self.legislation_text = ""
         self.simulation_results = {}
+        self.concurrent_deliberation = concurrent_deliberation
+        self.max_concurrency = max_concurrency
+        # Memory and legislation of every politician in this simulation (personas are shared between simulations)
+        self.persona_sessions: Dict = {}
         
         # Set up agent
         self.system_prompt = self._set_system_prompt()
@@ -44,6 +80,16 @@ class SupervisorAgent(BaseAgent):
         self.parties.append(party)
         print(f"Added party: {party.party_name} to the simulation")
     
+    @contextmanager
+    def simulation_scope(self):
+        """
+        Apply this simulation's settings (such as the LLM cache mode and the politicians'
+        memories) to the calls made inside the block.
+        """
+        with cache_mode_scope(self.cache_mode), simulation_session_scope(self.persona_sessions):
+            yield
+    
+    @_in_simulation_scope
     def set_legislation(self, legislation_text: str):
         """
         Set the legislation text for the simulation.
@@ -52,7 +98,11 @@ class SupervisorAgent(BaseAgent):
             legislation_text: The text of the legislation
         """
         self.legislation_text = legislation_text
+        
+        for party in self.parties:
+            party.update_members_on_legislation(legislation_text)
     
+    @_in_simulation_scope
     def run_intra_party_deliberation(self):
         """
         Run the intra-party deliberation phase using the party_discussion module.
@@ -61,8 +111,39 @@ class SupervisorAgent(BaseAgent):
             A dictionary containing the results of the deliberation
         """
         # Use the discuss_legislation function from party_discussion.py
-        party_positions = discuss_legislation(self.parties, self.legislation_text)
+        party_positions = discuss_legislation(
+            self.parties,
+            self.legislation_text,
+            concurrent=self.concurrent_deliberation,
+            max_workers=self.max_concurrency
+        )
+        return self._record_party_positions(party_positions)
+    
+    @_in_simulation_scope
+    async def arun_intra_party_deliberation(self):
+        """
+        Run the intra-party deliberation phase on the event loop.
         
+        Returns:
+            A dictionary containing the results of the deliberation
+        """
+        party_positions = await adiscuss_legislation(
+            self.parties,
+            self.legislation_text,
+            max_concurrency=self.max_concurrency
+        )
+        return self._record_party_positions(party_positions)
+    
+    def _record_party_positions(self, party_positions: Dict[str, PartyPosition]):
+        """
+        Store the deliberation results.
+        
+        Args:
+            party_positions: A dictionary mapping party names to their positions
+            
+        Returns:
+            A dictionary containing the results of the deliberation
+        """
         # Format results for compatibility with existing code
         party_stances = {}
         for party_name, position in party_positions.items():
@@ -76,6 +157,7 @@ class SupervisorAgent(BaseAgent):
         self.simulation_results["intra_party_deliberation"] = party_stances
         return party_stances
     
+    @_in_simulation_scope
     def run_inter_party_debate(self):
         """
         Run the inter-party debate phase using the inter_party_debate module.
@@ -88,7 +170,35 @@ class SupervisorAgent(BaseAgent):
         
         # Use the conduct_inter_party_debate function from inter_party_debate.py
         debate = InterPartyDebate(self.parties, self.legislation_text)
-        debate_history = debate.conduct_debate(rounds=2)
+        debate.conduct_debate(rounds=2)
+        return self._record_debate(debate)
+    
+    @_in_simulation_scope
+    async def arun_inter_party_debate(self):
+        """
+        Run the inter-party debate phase on the event loop.
+        
+        Returns:
+            A dictionary containing the results of the debate
+        """
+        if "intra_party_deliberation" not in self.simulation_results:
+            await self.arun_intra_party_deliberation()
+        
+        debate = InterPartyDebate(self.parties, self.legislation_text)
+        await debate.aconduct_debate(rounds=2)
+        return self._record_debate(debate)
+    
+    def _record_debate(self, debate: InterPartyDebate):
+        """
+        Store the debate results.
+        
+        Args:
+            debate: The finished inter-party debate
+            
+        Returns:
+            A dictionary containing the results of the debate
+        """
+        debate_history = debate.debate_history
         party_positions = debate.get_final_positions()
         
         # Store the results in a format compatible with the rest of the system
@@ -121,6 +231,7 @@ class SupervisorAgent(BaseAgent):
         # To maintain backward compatibility with tests, ensure debate_results is directly returnable
         return debate_results
     
+    @_in_simulation_scope
     def run_voting(self):
         """
         Run the voting phase using the voting_system module.
@@ -131,6 +242,35 @@ class SupervisorAgent(BaseAgent):
         if "inter_party_debate" not in self.simulation_results:
             self.run_inter_party_debate()
         
+        # Use the simulate_voting function from voting_system.py
+        voting_result = simulate_voting(self.parties, self._get_party_positions())
+        return self._record_voting(voting_result)
+    
+    @_in_simulation_scope
+    async def arun_voting(self):
+        """
+        Run the voting phase on the event loop.
+        
+        Returns:
+            A dictionary containing the results of the voting
+        """
+        if "inter_party_debate" not in self.simulation_results:
+            await self.arun_inter_party_debate()
+        
+        voting_result = await asimulate_voting(
+            self.parties,
+            self._get_party_positions(),
+            max_concurrency=self.max_concurrency
+        )
+        return self._record_voting(voting_result)
+    
+    def _get_party_positions(self) -> Dict[str, bool]:
+        """
+        Get the party positions the vote is based on.
+        
+        Returns:
+            A dictionary mapping party names to whether they support the legislation
+        """
         # Get party positions from the debate results
         party_positions = {}
         if "inter_party_debate" in self.simulation_results and "party_positions" in self.simulation_results["inter_party_debate"]:
@@ -140,9 +280,18 @@ class SupervisorAgent(BaseAgent):
             for party_name, data in self.simulation_results.get("intra_party_deliberation", {}).items():
                 party_positions[party_name] = data.get("supports", False)
         
-        # Use the simulate_voting function from voting_system.py
-        voting_result = simulate_voting(self.parties, party_positions)
+        return party_positions
+    
+    def _record_voting(self, voting_result: VotingResult):
+        """
+        Store the voting results.
         
+        Args:
+            voting_result: The result of the vote
+            
+        Returns:
+            A dictionary containing the results of the voting
+        """
         # Format results for compatibility with existing code
         party_votes = {}
         for party in self.parties:
@@ -204,6 +353,24 @@ class SupervisorAgent(BaseAgent):
         
         return self.get_simulation_summary()
     
+    async def arun_full_simulation(self, legislation_text: str):
+        """
+        Run the full simulation on the event loop.
+        
+        Args:
+            legislation_text: The text of the legislation
+            
+        Returns:
+            A dictionary containing the results of the simulation
+        """
+        self.set_legislation(legislation_text)
+        await self.arun_intra_party_deliberation()
+        await self.arun_inter_party_debate()
+        await self.arun_voting()
+        
+        return await self.aget_simulation_summary()
+    
+    @_in_simulation_scope
     def get_simulation_summary(self):
         """
         Get a summary of the simulation results.
@@ -214,6 +381,30 @@ class SupervisorAgent(BaseAgent):
         if "voting" not in self.simulation_results:
             return {"error": "Simulation has not been completed yet."}
         
+        response = self.answer_question(self._summary_prompt())
+        return self._build_summary(response)
+    
+    @_in_simulation_scope
+    async def aget_simulation_summary(self):
+        """
+        Get a summary of the simulation results on the event loop.
+        
+        Returns:
+            A dictionary containing a summary of the simulation results
+        """
+        if "voting" not in self.simulation_results:
+            return {"error": "Simulation has not been completed yet."}
+        
+        response = await self.aanswer_question(self._summary_prompt())
+        return self._build_summary(response)
+    
+    def _summary_prompt(self) -> str:
+        """
+        Build the prompt asking for a summary of the simulation.
+        
+        Returns:
+            The summary prompt as a string
+        """
         voting_results = self.simulation_results["voting"]
         
         # Gather party arguments from the intra-party deliberation phase
@@ -243,12 +434,21 @@ class SupervisorAgent(BaseAgent):
             party_votes_formatted=party_votes_formatted,
             party_arguments_text=party_args_text
         )
+        return summary_prompt
+    
+    def _build_summary(self, response: str):
+        """
+        Combine the summary text with the stored results.
         
-        response = self.answer_question(summary_prompt)
-        
+        Args:
+            response: The supervisor's summary of the simulation
+            
+        Returns:
+            A dictionary containing a summary of the simulation results
+        """
         return {
             "legislation_text": self.legislation_text,
-            "voting_results": voting_results,
+            "voting_results": self.simulation_results["voting"],
             "summary": response,
             "full_results": self.simulation_results
         }
@@ -300,6 +500,24 @@ class SupervisorAgent(BaseAgent):
         
         return response.content
     
+    async def aanswer_question(self, question: str) -> str:
+        """
+        Answer a question as the supervisor without blocking the event loop.
+        
+        Args:
+            question: The question to answer
+            
+        Returns:
+            The supervisor's response
+        """
+        messages = [
+            SystemMessage(content=self.system_prompt),
+            HumanMessage(content=question)
+        ]
+        
+        response = await self.model.ainvoke(messages)
+        return response.content
+    
     def _set_system_prompt(self) -> str:
         """
         Set the system prompt for the supervisor agent.
@@ -325,9 +543,7 @@ class SupervisorAgent(BaseAgent):
         Returns:
             The configured agent
         """
-        langsmith_api_key = os.getenv("LANGSMITH_API_KEY")
-        hub_client = Client(api_key=langsmith_api_key)
-        basic_prompt = hub_client.pull_prompt("hwchase17/openai-tools-agent")
+        basic_prompt = load_agent_prompt("hwchase17/openai-tools-agent")
         return create_tool_calling_agent(self.llm, self.tools, basic_prompt)
     
     def _get_context(self) -> Dict[str, Any]:
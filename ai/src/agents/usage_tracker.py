@@ -0,0 +1,62 @@
+# ai/src/agents/usage_tracker.py
+import threading
+from typing import Any, Dict
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+
+class LLMUsageTracker(BaseCallbackHandler):
+    """Collects token usage from every LLM response, including provider-side prompt cache hits"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Reset all counters"""
+        with self._lock:
+            self._calls = 0
+            self._replayed_calls = 0
+            self._input_tokens = 0
+            self._cached_input_tokens = 0
+            self._output_tokens = 0
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        """Record the usage reported in the response metadata"""
+        for generations in response.generations:
+            for generation in generations:
+                # Responses replayed from the LLM response cache carry the usage of the recorded call
+                if (generation.generation_info or {}).get('cached'):
+                    with self._lock:
+                        self._replayed_calls += 1
+                    continue
+
+                usage = getattr(getattr(generation, 'message', None), 'usage_metadata', None)
+                if not usage:
+                    continue
+
+                cached_tokens = (usage.get('input_token_details') or {}).get('cache_read', 0) or 0
+                with self._lock:
+                    self._calls += 1
+                    self._input_tokens += usage.get('input_tokens', 0) or 0
+                    self._cached_input_tokens += cached_tokens
+                    self._output_tokens += usage.get('output_tokens', 0) or 0
+
+    def get_stats(self) -> Dict:
+        """Get usage statistics, including the prompt cache hit ratio"""
+        with self._lock:
+            return {
+                'calls': self._calls,
+                'replayed_calls': self._replayed_calls,
+                'input_tokens': self._input_tokens,
+                'cached_input_tokens': self._cached_input_tokens,
+                'output_tokens': self._output_tokens,
+                'prompt_cache_hit_ratio': (
+                    self._cached_input_tokens / self._input_tokens if self._input_tokens else 0.0
+                )
+            }
+
+
+# Create global usage tracker attached to every LLM client
+llm_usage_tracker = LLMUsageTracker()
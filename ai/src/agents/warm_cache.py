@@ -1,54 +1,356 @@
-# scripts/warm_cache.py
-"""Pre-populate cache with common politicians and parties"""
+# ai/src/agents/warm_cache.py
+"""Pre-populate the cache with parties and politicians"""
 
-from ai.src.agents import PartyAgent, PoliticianAgent
-from ai.src.agents.cache_manager import cache_manager
+import os
 import time
+import uuid
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
-def warm_cache():
-    """Warm up the cache with common politicians and parties"""
-    
-    print("🔥 Warming up cache...")
-    
-    # Common parties
-    parties = [
-        ("Platforma Obywatelska", "PO"),
-        ("Prawo i Sprawiedliwość", "PiS"),
-        ("Lewica", ""),
-        ("Polska 2050", "PL2050"),
-        ("Konfederacja", "")
-    ]
-    
-    # Common politicians per party
-    politicians = {
-        "Platforma Obywatelska": [
-            {"name": "Donald Tusk", "role": "Przewodniczący"},
-            {"name": "Rafał Trzaskowski", "role": "Prezydent Warszawy"},
-            {"name": "Ewa Kopacz", "role": "Poseł"}
-        ],
-        "Prawo i Sprawiedliwość": [
-            {"name": "Jarosław Kaczyński", "role": "Prezes"},
-            {"name": "Mateusz Morawiecki", "role": "Premier"},
-            {"name": "Jacek Sasin", "role": "Minister"}
-        ],
-        "Lewica": [
-            {"name": "Robert Biedroń", "role": "Współprzewodniczący"},
-            {"name": "Adrian Zandberg", "role": "Współprzewodniczący"}
+import yaml
+
+from .cache_manager import cache_manager, POLITICIANS
+from .party_agent import PartyAgent
+from .politician_agent import persona_fingerprint
+from .politician_persona import _refresh_persona
+from .politician_registry import politician_registry
+from .rate_limiter import TokenBucket
+
+# frontend/config/default_parties.yml of the repository (the backend image copies it elsewhere, see DEFAULT_PARTIES_PATH)
+DEFAULT_PARTIES_PATH = Path(__file__).resolve().parents[3] / "frontend" / "config" / "default_parties.yml"
+# Number of finished jobs whose status is kept
+MAX_FINISHED_JOBS = 20
+
+
+def split_party_name(party_name: str) -> Tuple[str, str]:
+    """Split "Party Name (ACRONYM)" into the name and the acronym (same format as create_simulation)"""
+    if "(" in party_name and ")" in party_name:
+        acronym_start = party_name.find("(") + 1
+        acronym_end = party_name.find(")")
+        return party_name[:acronym_start - 1].strip(), party_name[acronym_start:acronym_end]
+    return party_name, ""
+
+
+def split_full_name(full_name: str) -> Tuple[str, str]:
+    """Split a full name into the first and last name (same split as PartyAgent.add_politician)"""
+    parts = full_name.split(maxsplit=1)
+    return parts[0], parts[1] if len(parts) > 1 else ""
+
+
+def load_default_parties(path: Optional[str] = None) -> Tuple[List[str], Dict[str, List[Dict[str, str]]]]:
+    """
+    Load the default parties and politicians of the frontend configuration.
+
+    Args:
+        path: Path of default_parties.yml (defaults to DEFAULT_PARTIES_PATH or the repository copy)
+
+    Returns:
+        The party names ("Party Name (ACRONYM)") and the politicians of each party, in the format
+        accepted by create_simulation
+    """
+    path = path or os.getenv("DEFAULT_PARTIES_PATH") or DEFAULT_PARTIES_PATH
+    with open(path, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f) or {}
+
+    party_names = []
+    politicians_per_party = {}
+    for name, party in (config.get('parties') or {}).items():
+        acronym = party.get('abbreviation', '')
+        party_name = f"{name} ({acronym})" if acronym else name
+        party_names.append(party_name)
+        politicians_per_party[party_name] = [
+            {'name': politician['name'], 'role': politician.get('role', '')}
+            for politician in party.get('politicians', [])
         ]
-    }
-    
-    # Warm parties
-    for party_name, acronym in parties:
-        print(f"\n📊 Warming party: {party_name}")
-        party = PartyAgent(party_name, acronym)
-        
-        # Warm politicians for this party
-        if party_name in politicians:
-            for pol in politicians[party_name]:
-                print(f"  👤 Warming politician: {pol['name']}")
-                party.add_politician(pol['name'], pol['role'])
-                time.sleep(0.5)  # Be nice to APIs
-    
+    return party_names, politicians_per_party
+
+
+class CacheWarmJob:
+    """Progress of a cache warming run"""
+
+    def __init__(self, party_names: List[str], politicians_per_party: Dict[str, List[Dict[str, str]]],
+                 max_workers: int, rate_per_minute: float):
+        self.id = uuid.uuid4().hex[:12]
+        self.party_names = party_names
+        self.politicians_per_party = politicians_per_party
+        self.max_workers = max_workers
+        self.rate_per_minute = rate_per_minute
+        self.status = "pending"
+        self.total = len(party_names) + sum(len(politicians_per_party.get(name, [])) for name in party_names)
+        self.warmed = 0
+        self.refreshing = 0
+        self.skipped = 0
+        self.errors: List[Dict[str, str]] = []
+        self.created_at = datetime.now().isoformat()
+        self.started_at: Optional[str] = None
+        self.finished_at: Optional[str] = None
+        self._lock = threading.Lock()
+
+    @property
+    def done(self) -> int:
+        return self.warmed + self.refreshing + self.skipped + len(self.errors)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("completed", "failed")
+
+    def record(self, outcome: str):
+        """Count an entry as 'warmed', 'refreshing' (stale, refreshed in the background) or 'skipped'"""
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def record_error(self, entry: str, error: Exception):
+        with self._lock:
+            self.errors.append({'entry': entry, 'error': str(error)})
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            return {
+                'job_id': self.id,
+                'status': self.status,
+                'parties': self.party_names,
+                'total': self.total,
+                'done': self.done,
+                'warmed': self.warmed,
+                'refreshing': self.refreshing,
+                'skipped': self.skipped,
+                'failed': len(self.errors),
+                'errors': list(self.errors),
+                'max_workers': self.max_workers,
+                'rate_per_minute': self.rate_per_minute,
+                'created_at': self.created_at,
+                'started_at': self.started_at,
+                'finished_at': self.finished_at
+            }
+
+
+class CacheWarmer:
+    """
+    Warms party and politician cache entries concurrently.
+
+    Parties are loaded first, then all their politicians, each phase on a thread pool of
+    max_workers (CACHE_WARM_WORKERS). Every lookup that actually hits Wikipedia or the LLM
+    first takes a token from a bucket refilled at rate_per_minute (CACHE_WARM_RATE_PER_MINUTE,
+    0 disables the limit). Entries that are already fresh are skipped; expired ones are
+    refreshed through the usual stale-while-revalidate path.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, rate_per_minute: Optional[float] = None):
+        self.max_workers = max_workers or int(os.getenv("CACHE_WARM_WORKERS", "4"))
+        self.rate_per_minute = (rate_per_minute if rate_per_minute is not None
+                                else float(os.getenv("CACHE_WARM_RATE_PER_MINUTE", "30")))
+        self._jobs: "OrderedDict[str, CacheWarmJob]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create_job(self, party_names: Optional[List[str]] = None,
+                   politicians_per_party: Optional[Dict[str, List[Dict[str, str]]]] = None,
+                   max_workers: Optional[int] = None, rate_per_minute: Optional[float] = None) -> CacheWarmJob:
+        """
+        Create a warming job (run it with run()).
+
+        Args:
+            party_names: Parties to warm ("Party Name (ACRONYM)"); defaults to the default parties
+            politicians_per_party: Politicians of each party; for parties without an entry, the default
+                                   politicians of the party are used
+            max_workers: Maximum number of entries loaded at the same time
+            rate_per_minute: Maximum number of lookups started per minute
+
+        Returns:
+            The new job
+        """
+        job = self._new_job(party_names, politicians_per_party, max_workers, rate_per_minute)
+        with self._lock:
+            self._add_job(job)
+        return job
+
+    def create_job_if_idle(self, party_names: Optional[List[str]] = None,
+                           politicians_per_party: Optional[Dict[str, List[Dict[str, str]]]] = None,
+                           max_workers: Optional[int] = None, rate_per_minute: Optional[float] = None) -> CacheWarmJob:
+        """
+        Create a warming job unless another one is pending or running (see create_job()).
+
+        Returns:
+            The new job
+
+        Raises:
+            RuntimeError: If another warming job is pending or running
+        """
+        job = self._new_job(party_names, politicians_per_party, max_workers, rate_per_minute)
+        with self._lock:
+            # Checked and added under one lock, so concurrent requests cannot both start a job
+            running = self._find_running_job()
+            if running is not None:
+                raise RuntimeError(f"Cache warming job {running.id} is already running")
+            self._add_job(job)
+        return job
+
+    def _new_job(self, party_names: Optional[List[str]], politicians_per_party: Optional[Dict[str, List[Dict[str, str]]]],
+                 max_workers: Optional[int], rate_per_minute: Optional[float]) -> CacheWarmJob:
+        default_names, default_politicians = load_default_parties()
+        if party_names is None:
+            party_names = default_names
+        politicians_per_party = dict(politicians_per_party or {})
+        for party_name in party_names:
+            if party_name not in politicians_per_party:
+                politicians_per_party[party_name] = default_politicians.get(party_name, [])
+
+        job = CacheWarmJob(
+            party_names, politicians_per_party,
+            max_workers or self.max_workers,
+            rate_per_minute if rate_per_minute is not None else self.rate_per_minute
+        )
+        return job
+
+    def _add_job(self, job: CacheWarmJob):
+        """Keep a new job, forgetting the oldest finished ones (caller holds the lock)"""
+        self._jobs[job.id] = job
+        finished = [job_id for job_id, other in self._jobs.items() if other.finished]
+        for job_id in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self._jobs[job_id]
+
+    def get_job(self, job_id: Optional[str] = None) -> Optional[CacheWarmJob]:
+        """Get a job by ID, or the most recent job"""
+        with self._lock:
+            if job_id is None:
+                return next(reversed(self._jobs.values()), None)
+            return self._jobs.get(job_id)
+
+    def running_job(self) -> Optional[CacheWarmJob]:
+        """Get the job currently pending or running, if any"""
+        with self._lock:
+            return self._find_running_job()
+
+    def _find_running_job(self) -> Optional[CacheWarmJob]:
+        """Get the job currently pending or running (caller holds the lock)"""
+        return next((job for job in self._jobs.values() if not job.finished), None)
+
+    def run(self, job: CacheWarmJob) -> Dict:
+        """
+        Run a warming job to completion.
+
+        Args:
+            job: The job created with create_job()
+
+        Returns:
+            The final status of the job
+        """
+        job.status = "running"
+        job.started_at = datetime.now().isoformat()
+        bucket = TokenBucket(job.rate_per_minute, capacity=job.max_workers)
+        fingerprint = persona_fingerprint()
+        print(f"🔥 Warming cache: {len(job.party_names)} parties, {job.total} entries "
+              f"({job.max_workers} workers, {job.rate_per_minute:g}/min)...")
+
+        start_time = time.time()
+        try:
+            with ThreadPoolExecutor(max_workers=job.max_workers, thread_name_prefix="cache-warm") as executor:
+                # Parties first: politicians are added to their party's cache entry
+                futures = {
+                    executor.submit(self._warm_party, job, bucket, fingerprint, party_name): party_name
+                    for party_name in job.party_names
+                }
+                parties = {}
+                for future in as_completed(futures):
+                    try:
+                        party = future.result()
+                        if party is not None:
+                            parties[futures[future]] = party
+                    except Exception as e:
+                        print(f"❌ Error warming party {futures[future]}: {e}")
+                        job.record_error(futures[future], e)
+                        # Its politicians are not warmed either
+                        for politician in job.politicians_per_party.get(futures[future], []):
+                            job.record_error(politician['name'], e)
+
+                futures = {
+                    executor.submit(self._warm_politician, job, bucket, fingerprint, party, politician):
+                        politician['name']
+                    for party_name, party in parties.items()
+                    for politician in job.politicians_per_party.get(party_name, [])
+                }
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        print(f"❌ Error warming politician {futures[future]}: {e}")
+                        job.record_error(futures[future], e)
+            job.status = "completed"
+        except Exception as e:
+            print(f"❌ Cache warming failed: {e}")
+            job.record_error("job", e)
+            job.status = "failed"
+        finally:
+            job.finished_at = datetime.now().isoformat()
+
+        print(f"⏱️ Warmed cache in {time.time() - start_time:.2f}s "
+              f"({job.warmed} warmed, {job.refreshing} refreshing, {job.skipped} skipped, {len(job.errors)} failed)")
+        return job.to_dict()
+
+    def _warm_party(self, job: CacheWarmJob, bucket: TokenBucket, fingerprint: str,
+                    party_name: str) -> Optional[PartyAgent]:
+        """Load a party unless it and all its politicians are fresh"""
+        name, acronym = split_party_name(party_name)
+        entry = cache_manager.get_party_entry(name, acronym)
+        fresh = entry is not None and not entry.stale and entry.data.get('party_info_found', True)
+
+        if fresh:
+            job.record("skipped")
+            politicians = job.politicians_per_party.get(party_name, [])
+            if all(self._politician_fresh(entry.data, fingerprint, name, politician) for politician in politicians):
+                for _ in politicians:
+                    job.record("skipped")
+                return None
+            # Loads from the cache, no lookup
+            return PartyAgent(name, acronym)
+
+        bucket.acquire()
+        party = PartyAgent(name, acronym)
+        job.record("refreshing" if entry is not None else "warmed")
+        return party
+
+    @staticmethod
+    def _politician_fresh(party_data: Dict, fingerprint: str, party_name: str, politician: Dict) -> bool:
+        """Check whether a politician's persona is fresh and listed in the cached party"""
+        if not any(entry.get('full_name') == politician['name'] for entry in party_data.get('politicians_data', [])):
+            return False
+        first_name, last_name = split_full_name(politician['name'])
+        entry = cache_manager.get_politician_entry(first_name, last_name, party_name, fingerprint=fingerprint)
+        return entry is not None and not entry.stale
+
+    def _warm_politician(self, job: CacheWarmJob, bucket: TokenBucket, fingerprint: str,
+                         party: PartyAgent, politician: Dict):
+        """Load a politician into its party unless it is already fresh"""
+        party_data = cache_manager.get_party(party.party_name, party.party_acronym) or {}
+        if self._politician_fresh(party_data, fingerprint, party.party_name, politician):
+            job.record("skipped")
+            return
+
+        first_name, last_name = split_full_name(politician['name'])
+        entry = cache_manager.get_politician_entry(first_name, last_name, party.party_name, fingerprint=fingerprint)
+        if entry is None or entry.stale:
+            bucket.acquire()
+        party.add_politician(politician['name'], politician.get('role', ''))
+        if entry is not None and entry.stale:
+            # A persona already in the registry is not loaded again, so nothing else refreshes it
+            cache_manager.revalidate(
+                POLITICIANS, cache_manager.get_politician_key(first_name, last_name, party.party_name),
+                _refresh_persona, politician_registry.get(politician['name'], party.party_name)
+            )
+        job.record("refreshing" if entry is not None and entry.stale else "warmed")
+
+
+# Create global cache warmer shared by the API and the command line
+cache_warmer = CacheWarmer()
+
+
+def warm_cache():
+    """Warm up the cache with the default parties and politicians"""
+    result = cache_warmer.run(cache_warmer.create_job())
+
     # Show cache stats
     stats = cache_manager.get_cache_stats()
     print(f"\n📈 Cache statistics:")
@@ -56,6 +358,8 @@ def warm_cache():
     print(f"  - Parties: {stats['parties']}")
     print(f"  - Wikipedia: {stats['wikipedia']}")
     print(f"  - Total size: {stats['total_size_mb']:.2f} MB")
+    return result
+
 
 if __name__ == "__main__":
-    warm_cache()
\ No newline at end of file
+    warm_cache()
@@ -0,0 +1,158 @@
+# ai/src/agents/wikipedia_client.py
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+# Same limits as LangChain's WikipediaAPIWrapper, so results look the same as before
+WIKIPEDIA_MAX_QUERY_LENGTH = 300
+NO_RESULT = "No good Wikipedia Search Result was found"
+
+# Keep-alive HTTP client shared by every WikipediaClient (each party and lookup creates a client)
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+
+def _get_http_client() -> httpx.Client:
+    """Get the shared HTTP client, creating it on first use"""
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = httpx.Client(headers={'User-Agent': 'AIParliament/1.0'})
+    return _http_client
+
+
+class WikipediaClient:
+    """
+    Minimal MediaWiki API client returning page summaries together with their revision IDs.
+
+    The API endpoint defaults to https://<lang>.wikipedia.org/w/api.php and can be pointed
+    at another server (e.g. a local fake for tests) with WIKIPEDIA_API_URL.
+    """
+
+    def __init__(self, lang: str = "pl", api_url: Optional[str] = None, top_k_results: int = 3,
+                 doc_content_chars_max: int = 4000, timeout: float = 30):
+        self.api_url = api_url or os.getenv("WIKIPEDIA_API_URL") or f"https://{lang}.wikipedia.org/w/api.php"
+        self.top_k_results = top_k_results
+        self.doc_content_chars_max = doc_content_chars_max
+        self.timeout = timeout
+
+    def _query(self, **params) -> Dict:
+        response = _get_http_client().get(self.api_url, params={'format': 'json', 'formatversion': 2, **params},
+                                          timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    @staticmethod
+    def _resolve_titles(titles: List[str], query: Dict) -> Dict[str, str]:
+        """Map requested titles to the page titles they normalize or redirect to"""
+        resolved = {title: title for title in titles}
+        for mapping in query.get('normalized', []) + query.get('redirects', []):
+            for title, target in resolved.items():
+                if target == mapping['from']:
+                    resolved[title] = mapping['to']
+        return resolved
+
+    def search(self, query: str) -> List[str]:
+        """
+        Search for pages matching a query.
+
+        Args:
+            query: The search query
+
+        Returns:
+            The titles of the best matching pages
+        """
+        data = self._query(action='query', list='search', srprop='',
+                           srsearch=query[:WIKIPEDIA_MAX_QUERY_LENGTH], srlimit=self.top_k_results)
+        return [result['title'] for result in data.get('query', {}).get('search', [])]
+
+    def get_pages(self, titles: List[str]) -> Dict[str, Dict]:
+        """
+        Get the introduction and current revision ID of pages.
+
+        Args:
+            titles: The page titles
+
+        Returns:
+            A dictionary with 'summary' and 'revision' of every existing page, by requested title
+        """
+        if not titles:
+            return {}
+
+        data = self._query(action='query', prop='extracts|revisions', exintro=1, explaintext=1,
+                           rvprop='ids', redirects=1, titles='|'.join(titles))
+        query = data.get('query', {})
+        pages = {page['title']: page for page in query.get('pages', []) if not page.get('missing')}
+
+        result = {}
+        for title, target in self._resolve_titles(titles, query).items():
+            page = pages.get(target)
+            if page is None:
+                continue
+            revisions = page.get('revisions') or [{}]
+            result[title] = {'summary': page.get('extract', ''), 'revision': revisions[0].get('revid')}
+        return result
+
+    def get_revisions(self, titles: List[str]) -> Dict[str, int]:
+        """
+        Get the current revision IDs of pages (a cheap check whether cached content is still current).
+
+        Args:
+            titles: The page titles
+
+        Returns:
+            The revision ID of every existing page, by requested title
+        """
+        if not titles:
+            return {}
+
+        data = self._query(action='query', prop='revisions', rvprop='ids', redirects=1, titles='|'.join(titles))
+        query = data.get('query', {})
+        revisions = {
+            page['title']: (page.get('revisions') or [{}])[0].get('revid')
+            for page in query.get('pages', []) if not page.get('missing')
+        }
+        return {
+            title: revisions[target]
+            for title, target in self._resolve_titles(titles, query).items() if target in revisions
+        }
+
+    def run(self, query: str) -> Tuple[str, Dict[str, int]]:
+        """
+        Search Wikipedia and summarize the best matching pages.
+
+        Args:
+            query: The search query
+
+        Returns:
+            The page summaries (formatted like LangChain's Wikipedia tool) and the revision ID of each page
+        """
+        sections, revisions = self.run_sections(query)
+        return self.join_sections(sections), revisions
+
+    def run_sections(self, query: str) -> Tuple[List[str], Dict[str, int]]:
+        """
+        Search Wikipedia and summarize the best matching pages, one section per page.
+
+        Args:
+            query: The search query
+
+        Returns:
+            The formatted summary of every page and the revision ID of each page
+        """
+        pages = self.get_pages(self.search(query))
+        sections = [
+            f"Page: {title}\nSummary: {page['summary']}"
+            for title, page in pages.items() if page['summary']
+        ]
+        revisions = {title: page['revision'] for title, page in pages.items() if page['summary']}
+        return sections, revisions
+
+    def join_sections(self, sections: List[str]) -> str:
+        """Join page sections into the result returned to agents"""
+        if not sections:
+            return NO_RESULT
+        return "\n\n".join(sections)[:self.doc_content_chars_max]
@@ -1,5 +1,6 @@
 from typing import List, Dict, Optional
 from dataclasses import dataclass
+import asyncio
 import random
 try:
     from ..utilities.prompt_manager import PromptManager
@@ -61,9 +62,61 @@ class InterPartyDebate:
             
         return self.debate_history
     
+    async def aconduct_debate(self, rounds: int = 2) -> List[DebateArgument]:
+        """
+        Conduct inter-party debate on the event loop
+        
+        Opening and closing statements do not depend on each other, so they are
+        requested concurrently and recorded in party order. Rebuttal rounds stay
+        sequential because every response reads the debate history so far.
+        
+        Args:
+            rounds: Number of debate rounds
+            
+        Returns:
+            List of debate arguments
+        """
+        print("\n" + "="*60)
+        print("INTER-PARTY DEBATE")
+        print("="*60)
+        
+        # First round - opening statements
+        print("\n--- ROUND 1: Opening statements ---")
+        openings = [self._opening_statement_prompt(party) for party in self.parties]
+        responses = await asyncio.gather(*(speaker.aanswer_question(prompt) for speaker, prompt in openings))
+        for party, (speaker, _), response in zip(self.parties, openings, responses):
+            self._record_opening_statement(party, speaker, response)
+        
+        # Subsequent rounds - responses and rebuttals
+        for round_num in range(2, rounds + 1):
+            print(f"\n--- ROUND {round_num}: Responses and rebuttals ---")
+            
+            # Each party responds to previous arguments
+            for party in self.parties:
+                request = self._response_prompt(party)
+                if request is None:
+                    continue
+                speaker, target_argument, prompt = request
+                response = await speaker.aanswer_question(prompt)
+                self._record_response(party, speaker, target_argument, response)
+        
+        # Final statements
+        print("\n--- FINAL POSITIONS ---")
+        closings = [self._closing_statement_prompt(party) for party in self.parties]
+        responses = await asyncio.gather(*(party.aanswer_question(prompt) for party, prompt in zip(self.parties, closings)))
+        for party, response in zip(self.parties, responses):
+            self._record_closing_statement(party, response)
+            
+        return self.debate_history
+    
     def _party_opening_statement(self, party):
         """Generate opening statement for a party"""
-        # Select representative speaker
+        speaker, prompt = self._opening_statement_prompt(party)
+        response = speaker.answer_question(prompt)
+        self._record_opening_statement(party, speaker, response)
+    
+    def _opening_statement_prompt(self, party):
+        """Select a representative speaker and build the opening statement prompt"""
         speaker = random.choice(party.politicians)
         
         prompt = self.prompt_manager.format_prompt(
@@ -73,8 +126,10 @@ class InterPartyDebate:
             party_name=party.name,
             legislation_text=self.legislation_text
         )
-        
-        response = speaker.answer_question(prompt)
+        return speaker, prompt
+    
+    def _record_opening_statement(self, party, speaker, response: str):
+        """Add an opening statement to the debate history"""
         is_supporting = ("support" in response.lower() and "not support" not in response.lower() and "don't support" not in response.lower())
         
         argument = DebateArgument(
@@ -90,6 +145,16 @@ class InterPartyDebate:
         
     def _party_response(self, party, round_num):
         """Generate response to other parties' arguments"""
+        request = self._response_prompt(party)
+        if request is None:
+            return
+        
+        speaker, target_argument, prompt = request
+        response = speaker.answer_question(prompt)
+        self._record_response(party, speaker, target_argument, response)
+    
+    def _response_prompt(self, party):
+        """Select a speaker and a target argument and build the rebuttal prompt"""
         # Get opposing arguments
         opposing_arguments = [
             arg for arg in self.debate_history 
@@ -97,7 +162,7 @@ class InterPartyDebate:
         ]
         
         if not opposing_arguments:
-            return
+            return None
             
         # Select argument to respond to
         target_argument = random.choice(opposing_arguments[-len(self.parties):])
@@ -120,9 +185,10 @@ class InterPartyDebate:
             target_speaker=target_argument.speaker_name,
             target_party=target_argument.party_name
         )
-        
-        response = speaker.answer_question(prompt)
-        
+        return speaker, target_argument, prompt
+    
+    def _record_response(self, party, speaker, target_argument: DebateArgument, response: str):
+        """Add a rebuttal to the debate history"""
         argument = DebateArgument(
             party_name=party.name,
             speaker_name=speaker.name,
@@ -137,14 +203,20 @@ class InterPartyDebate:
         
     def _party_closing_statement(self, party):
         """Generate closing statement for a party"""
-        prompt = self.prompt_manager.format_prompt(
+        response = party.answer_question(self._closing_statement_prompt(party))
+        self._record_closing_statement(party, response)
+    
+    def _closing_statement_prompt(self, party) -> str:
+        """Build the closing statement prompt for a party leader"""
+        return self.prompt_manager.format_prompt(
             'simulation',
             'inter_party_debate.closing_statement_prompt',
             party_name=party.name,
             legislation_text=self.legislation_text
         )
-        
-        response = party.answer_question(prompt)
+    
+    def _record_closing_statement(self, party, response: str):
+        """Add a closing statement to the debate history"""
         is_supporting = "votes for" in response.lower() or "vote for" in response.lower()
         
         argument = DebateArgument(
@@ -195,3 +267,20 @@ def conduct_inter_party_debate(parties: List, legislation_text: str, rounds: int
     debate = InterPartyDebate(parties, legislation_text)
     debate.conduct_debate(rounds)
     return debate.get_final_positions()
+
+
+async def aconduct_inter_party_debate(parties: List, legislation_text: str, rounds: int = 2) -> Dict[str, bool]:
+    """
+    Conduct debate between parties on the event loop and return their final positions
+    
+    Args:
+        parties: List of PartyAgent instances
+        legislation_text: The legislation being debated
+        rounds: Number of debate rounds
+        
+    Returns:
+        Dictionary mapping party names to their final positions (True = support, False = oppose)
+    """
+    debate = InterPartyDebate(parties, legislation_text)
+    await debate.aconduct_debate(rounds)
+    return debate.get_final_positions()
@@ -1,6 +1,11 @@
-from typing import List, Dict, TypedDict, Annotated
+from typing import List, Dict, Optional, TypedDict, Annotated
 from dataclasses import dataclass
-from langgraph.graph import StateGraph, END
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import contextvars
+from langchain_core.runnables import RunnableLambda
+from langgraph.graph import StateGraph, START, END
+from langgraph.types import Send
 from langsmith import traceable
 import operator
 try:
@@ -18,22 +23,43 @@ class PartyPosition:
     individual_opinions: Dict[str, str]
 
 
+def _merge_dicts(left: Dict[str, str], right: Dict[str, str]) -> Dict[str, str]:
+    """Reducer combining the per-politician results written by parallel branches"""
+    return {**left, **right}
+
+
 class DiscussionState(TypedDict):
     """State for the party discussion workflow"""
     party_name: str
     legislation_text: str
-    individual_opinions: Dict[str, str]
+    individual_opinions: Annotated[Dict[str, str], _merge_dicts]
+    debate_responses: Annotated[Dict[str, str], _merge_dicts]
     debate_summary: str
     final_position: str
     supports: bool
     arguments: List[str]
 
 
+class PoliticianTurnState(TypedDict):
+    """State sent to a single politician branch of the workflow"""
+    party_name: str
+    legislation_text: str
+    politician_name: str
+    opinions_text: str
+
+
 class PartyDiscussion:
     """Manages internal party discussion using LangGraph"""
     
-    def __init__(self, party_agent):
+    def __init__(self, party_agent, max_concurrency: Optional[int] = None):
+        """
+        Args:
+            party_agent: The PartyAgent whose members discuss the legislation
+            max_concurrency: Maximum number of politician branches running at once
+                             (None lets LangGraph run every branch in parallel)
+        """
         self.party = party_agent
+        self.max_concurrency = max_concurrency
         self.prompt_manager = PromptManager()
         self.workflow = self._create_workflow()
     
@@ -41,116 +67,206 @@ class PartyDiscussion:
         """Create the LangGraph workflow for party discussion"""
         workflow = StateGraph(DiscussionState)
         
-        # Add nodes
-        workflow.add_node("gather_opinions", self._gather_opinions)
-        workflow.add_node("conduct_debate", self._conduct_debate)
-        workflow.add_node("formulate_position", self._formulate_position)
+        # Add nodes (LLM nodes carry an async variant so the same graph serves invoke and ainvoke)
+        workflow.add_node("gather_opinion", RunnableLambda(self._gather_opinion, afunc=self._agather_opinion))
+        workflow.add_node("collect_opinions", self._collect_opinions)
+        workflow.add_node("debate_response", RunnableLambda(self._debate_response, afunc=self._adebate_response))
+        workflow.add_node("summarize_debate", self._summarize_debate)
+        workflow.add_node("formulate_position", RunnableLambda(self._formulate_position, afunc=self._aformulate_position))
         
-        # Add edges
-        workflow.set_entry_point("gather_opinions")
-        workflow.add_edge("gather_opinions", "conduct_debate")
-        workflow.add_edge("conduct_debate", "formulate_position")
+        # Fan out one branch per politician, then fan back in before the next phase
+        workflow.add_conditional_edges(START, self._assign_opinions, ["gather_opinion", "collect_opinions"])
+        workflow.add_edge("gather_opinion", "collect_opinions")
+        workflow.add_conditional_edges("collect_opinions", self._assign_debate_responses, ["debate_response", "summarize_debate"])
+        workflow.add_edge("debate_response", "summarize_debate")
+        workflow.add_edge("summarize_debate", "formulate_position")
         workflow.add_edge("formulate_position", END)
         
         return workflow.compile()
     
-    def _gather_opinions(self, state: DiscussionState) -> DiscussionState:
-        """Node: Gather initial opinions from each politician"""
+    def _get_politician(self, politician_name: str):
+        """Find a party member by name"""
+        for politician in self.party.politicians:
+            if politician.name == politician_name:
+                return politician
+        raise KeyError(f"{politician_name} is not a member of {self.party.name}")
+    
+    def _assign_opinions(self, state: DiscussionState):
+        """Edge: Send each politician to their own opinion branch"""
         print(f"\n=== Gathering opinions in party {state['party_name']} ===")
         
-        opinions = {}
-        for politician in self.party.politicians:
-            prompt = self.prompt_manager.format_prompt(
-                'simulation',
-                'party_discussion.gather_opinions_prompt',
-                legislation_text=state['legislation_text'],
-                politician_name=politician.name
-            )
-            
-            response = politician.answer_question(prompt)
-            opinions[politician.name] = response
-            print(f"\n{politician.name}: {response}")
+        if not self.party.politicians:
+            return "collect_opinions"
         
-        state['individual_opinions'] = opinions
-        return state
+        return [
+            Send("gather_opinion", {
+                "party_name": state['party_name'],
+                "legislation_text": state['legislation_text'],
+                "politician_name": politician.name,
+                "opinions_text": ""
+            })
+            for politician in self.party.politicians
+        ]
     
+    def _gather_opinion(self, state: PoliticianTurnState) -> Dict[str, Dict[str, str]]:
+        """Node: Gather the initial opinion of a single politician"""
+        politician = self._get_politician(state['politician_name'])
+        response = politician.answer_question(self._opinion_prompt(state))
+        print(f"\n{politician.name}: {response}")
+        return {"individual_opinions": {politician.name: response}}
     
-    def _conduct_debate(self, state: DiscussionState) -> DiscussionState:
-        """Node: Politicians respond to each other's opinions"""
+    async def _agather_opinion(self, state: PoliticianTurnState) -> Dict[str, Dict[str, str]]:
+        """Async node: Gather the initial opinion of a single politician"""
+        politician = self._get_politician(state['politician_name'])
+        response = await politician.aanswer_question(self._opinion_prompt(state))
+        print(f"\n{politician.name}: {response}")
+        return {"individual_opinions": {politician.name: response}}
+    
+    def _opinion_prompt(self, state: PoliticianTurnState) -> str:
+        """Build the opinion prompt for a politician branch"""
+        return self.prompt_manager.format_prompt(
+            'simulation',
+            'party_discussion.gather_opinions_prompt',
+            legislation_text=state['legislation_text'],
+            politician_name=state['politician_name']
+        )
+    
+    def _collect_opinions(self, state: DiscussionState) -> Dict:
+        """Node: Join point after every opinion branch has finished"""
+        return {}
+    
+    def _assign_debate_responses(self, state: DiscussionState):
+        """Edge: Send each politician to their own debate branch"""
         print(f"\n=== Debate in party {state['party_name']} ===")
         
-        debate_points = []
+        if not self.party.politicians:
+            return "summarize_debate"
+        
         opinions_text = "\n".join([f"{name}: {opinion}" 
-                                  for name, opinion in state['individual_opinions'].items()])
+                                  for name, opinion in self._ordered(state['individual_opinions'])])
         
         # Each politician can respond to others
-        for politician in self.party.politicians:
-            prompt = self.prompt_manager.format_prompt(
-                'simulation',
-                'party_discussion.conduct_debate_prompt',
-                opinions_text=opinions_text,
-                politician_name=politician.name
-            )
-            
-            response = politician.answer_question(prompt)
-            debate_points.append(f"{politician.name}: {response}")
-            print(f"\n{politician.name}: {response}")
-        
-        state['debate_summary'] = "\n".join(debate_points)
-        return state
+        return [
+            Send("debate_response", {
+                "party_name": state['party_name'],
+                "legislation_text": state['legislation_text'],
+                "politician_name": politician.name,
+                "opinions_text": opinions_text
+            })
+            for politician in self.party.politicians
+        ]
+    
+    def _debate_response(self, state: PoliticianTurnState) -> Dict[str, Dict[str, str]]:
+        """Node: A single politician responds to the colleagues' opinions"""
+        politician = self._get_politician(state['politician_name'])
+        response = politician.answer_question(self._debate_prompt(state))
+        print(f"\n{politician.name}: {response}")
+        return {"debate_responses": {politician.name: response}}
     
-    def _formulate_position(self, state: DiscussionState) -> DiscussionState:
+    async def _adebate_response(self, state: PoliticianTurnState) -> Dict[str, Dict[str, str]]:
+        """Async node: A single politician responds to the colleagues' opinions"""
+        politician = self._get_politician(state['politician_name'])
+        response = await politician.aanswer_question(self._debate_prompt(state))
+        print(f"\n{politician.name}: {response}")
+        return {"debate_responses": {politician.name: response}}
+    
+    def _debate_prompt(self, state: PoliticianTurnState) -> str:
+        """Build the debate prompt for a politician branch"""
+        return self.prompt_manager.format_prompt(
+            'simulation',
+            'party_discussion.conduct_debate_prompt',
+            opinions_text=state['opinions_text'],
+            politician_name=state['politician_name']
+        )
+    
+    def _summarize_debate(self, state: DiscussionState) -> Dict[str, str]:
+        """Node: Join the debate branches into a single summary"""
+        debate_points = [f"{name}: {response}" 
+                         for name, response in self._ordered(state['debate_responses'])]
+        return {"debate_summary": "\n".join(debate_points)}
+    
+    def _ordered(self, results: Dict[str, str]) -> List:
+        """Return branch results in party member order, regardless of completion order"""
+        order = {politician.name: index for index, politician in enumerate(self.party.politicians)}
+        return sorted(results.items(), key=lambda item: order.get(item[0], len(order)))
+    
+    def _formulate_position(self, state: DiscussionState) -> Dict:
         """Node: Party leader formulates final position"""
         print(f"\n=== Formulating party position for {state['party_name']} ===")
         
+        response = self.party.answer_question(self._position_prompt(state))
+        print(f"\nParty position: {response}")
+        return self._parse_position(response)
+    
+    async def _aformulate_position(self, state: DiscussionState) -> Dict:
+        """Async node: Party leader formulates final position"""
+        print(f"\n=== Formulating party position for {state['party_name']} ===")
+        
+        response = await self.party.aanswer_question(self._position_prompt(state))
+        print(f"\nParty position: {response}")
+        return self._parse_position(response)
+    
+    def _position_prompt(self, state: DiscussionState) -> str:
+        """Build the prompt asking the party leader for the final position"""
         # Combine all discussion points
-        full_discussion = f"Initial opinions:\n{chr(10).join([f'{k}: {v}' for k,v in state['individual_opinions'].items()])}\n\nDebate:\n{state['debate_summary']}"
+        full_discussion = f"Initial opinions:\n{chr(10).join([f'{k}: {v}' for k,v in self._ordered(state['individual_opinions'])])}\n\nDebate:\n{state['debate_summary']}"
         
-        prompt = self.prompt_manager.format_prompt(
+        return self.prompt_manager.format_prompt(
             'simulation',
             'party_discussion.formulate_position_prompt',
             party_name=state['party_name'],
             legislation_text=state['legislation_text'],
             full_discussion=full_discussion
         )
-        
-        response = self.party.answer_question(prompt)
-        print(f"\nParty position: {response}")
-        
-        # Parse response
-        state['final_position'] = response
-        state['supports'] = "SUPPORTS" in response and "NOT SUPPORT" not in response
-        
+    
+    def _parse_position(self, response: str) -> Dict:
+        """Parse the party leader's answer into state updates"""
         # Extract arguments
         arguments = []
         for line in response.split('\n'):
             if line.strip().startswith('ARGUMENT'):
                 arguments.append(line.split(':', 1)[1].strip())
         
-        state['arguments'] = arguments[:3]  # Take max 3 arguments
-        return state
+        return {
+            "final_position": response,
+            "supports": "SUPPORTS" in response and "NOT SUPPORT" not in response,
+            "arguments": arguments[:3]  # Take max 3 arguments
+        }
     
     @traceable(name="Conduct Party Debate")
     def conduct_discussion(self, legislation_text: str) -> PartyPosition:
         """Run the discussion workflow and return party position"""
-        
-        # Initial state
-        initial_state = {
+        final_state = self.workflow.invoke(self._initial_state(legislation_text), config=self._run_config())
+        return self._to_party_position(final_state)
+    
+    @traceable(name="Conduct Party Debate")
+    async def aconduct_discussion(self, legislation_text: str) -> PartyPosition:
+        """Run the discussion workflow on the event loop and return party position"""
+        final_state = await self.workflow.ainvoke(self._initial_state(legislation_text), config=self._run_config())
+        return self._to_party_position(final_state)
+    
+    def _initial_state(self, legislation_text: str) -> DiscussionState:
+        """Build the initial workflow state"""
+        return {
             "party_name": self.party.name,
             "legislation_text": legislation_text,
             "individual_opinions": {},
+            "debate_responses": {},
             "debate_summary": "",
             "final_position": "",
             "supports": False,
             "arguments": []
         }
-        
-        # Run workflow
-        final_state = self.workflow.invoke(initial_state)
-        
+    
+    def _run_config(self) -> Optional[Dict]:
+        """Workflow run configuration"""
+        return {"max_concurrency": self.max_concurrency} if self.max_concurrency else None
+    
+    def _to_party_position(self, final_state: DiscussionState) -> PartyPosition:
+        """Convert the final workflow state into a PartyPosition"""
         # Determine individual positions from their initial opinions
         individual_positions = {}
-        for name, opinion in final_state['individual_opinions'].items():
+        for name, opinion in self._ordered(final_state['individual_opinions']):
             # More robust parsing
             opinion_lower = opinion.lower()
             if ("support" in opinion_lower and "not support" not in opinion_lower) or "i support" in opinion_lower:
@@ -167,17 +283,29 @@ class PartyDiscussion:
         )
 
 
-def discuss_legislation(parties: List, legislation_text: str) -> Dict[str, PartyPosition]:
+def discuss_legislation(parties: List, legislation_text: str,
+                        concurrent: bool = False, max_workers: int = 4) -> Dict[str, PartyPosition]:
     """
     Have multiple parties discuss legislation internally using LangGraph
     
     Args:
         parties: List of PartyAgent instances
         legislation_text: The legislation to discuss
+        concurrent: Whether to run the party discussions at the same time
+        max_workers: Maximum number of in-flight LLM calls in concurrent mode, shared
+                     between the party discussions and the members of each party
         
     Returns:
         Dictionary mapping party names to their positions
+        
+    Raises:
+        ValueError: If two parties have the same name
     """
+    _check_party_names(parties)
+    
+    if concurrent and len(parties) > 1:
+        return _discuss_legislation_concurrently(parties, legislation_text, max_workers)
+    
     positions = {}
     
     for party in parties:
@@ -189,9 +317,89 @@ def discuss_legislation(parties: List, legislation_text: str) -> Dict[str, Party
         position = discussion.conduct_discussion(legislation_text)
         positions[party.name] = position
         
-        print(f"\nSummary for {party.name}:")
-        print(f"  Position: {'SUPPORTS' if position.supports_legislation else 'DOES NOT SUPPORT'}")
-        print(f"  Votes: For={sum(1 for v in position.individual_opinions.values() if v=='For')}, "
-              f"Against={sum(1 for v in position.individual_opinions.values() if v=='Against')}")
+        _print_position_summary(party.name, position)
+    
+    return positions
+
+
+def _check_party_names(parties: List):
+    """Positions are keyed by party name, so a repeated name would overwrite another party's position"""
+    seen = set()
+    for party in parties:
+        if party.name in seen:
+            raise ValueError(f"Duplicate party name: {party.name}")
+        seen.add(party.name)
+
+
+def _discuss_legislation_concurrently(parties: List, legislation_text: str,
+                                      max_workers: int) -> Dict[str, PartyPosition]:
+    """Run one party discussion per worker; parties never share state while deliberating"""
+    print(f"\n{'='*60}")
+    print(f"PARTY DISCUSSIONS (concurrent): {', '.join(party.name for party in parties)}")
+    print(f"{'='*60}")
+    
+    workers = max(1, min(max_workers, len(parties)))
+    # Each discussion fans out to its members; split the budget so the total stays within max_workers
+    member_concurrency = max(1, max_workers // workers)
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Copy the caller's context so tracing and per-simulation settings follow each worker
+        futures = {
+            party.name: executor.submit(
+                contextvars.copy_context().run,
+                PartyDiscussion(party, max_concurrency=member_concurrency).conduct_discussion,
+                legislation_text
+            )
+            for party in parties
+        }
+        
+        # Collect in the original party order so results are deterministic
+        positions = {}
+        for party in parties:
+            position = futures[party.name].result()
+            positions[party.name] = position
+            _print_position_summary(party.name, position)
+    
+    return positions
+
+
+async def adiscuss_legislation(parties: List, legislation_text: str,
+                               max_concurrency: int = 4) -> Dict[str, PartyPosition]:
+    """
+    Have multiple parties discuss legislation internally on the event loop
+    
+    Args:
+        parties: List of PartyAgent instances
+        legislation_text: The legislation to discuss
+        max_concurrency: Maximum number of party discussions running at once
+        
+    Returns:
+        Dictionary mapping party names to their positions
+        
+    Raises:
+        ValueError: If two parties have the same name
+    """
+    _check_party_names(parties)
+    
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    
+    async def discuss(party) -> PartyPosition:
+        async with semaphore:
+            return await PartyDiscussion(party).aconduct_discussion(legislation_text)
+    
+    results = await asyncio.gather(*(discuss(party) for party in parties))
+    
+    positions = {}
+    for party, position in zip(parties, results):
+        positions[party.name] = position
+        _print_position_summary(party.name, position)
     
     return positions
+
+
+def _print_position_summary(party_name: str, position: PartyPosition):
+    """Print a short summary of a party's position"""
+    print(f"\nSummary for {party_name}:")
+    print(f"  Position: {'SUPPORTS' if position.supports_legislation else 'DOES NOT SUPPORT'}")
+    print(f"  Votes: For={sum(1 for v in position.individual_opinions.values() if v=='For')}, "
+          f"Against={sum(1 for v in position.individual_opinions.values() if v=='Against')}")
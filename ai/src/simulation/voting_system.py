@@ -1,6 +1,7 @@
 from typing import List, Dict, Tuple
 from dataclasses import dataclass
 from collections import defaultdict
+import asyncio
 from langsmith import traceable
 try:
     from ..utilities.prompt_manager import PromptManager
@@ -92,6 +93,65 @@ class VotingSystem:
         self._display_summary(result)
         
         return result
+    
+    @traceable(name="Conduct Voting")
+    async def aconduct_vote(self, allow_dissent: bool = True, dissent_probability: float = 0.1,
+                            max_concurrency: int = 4) -> VotingResult:
+        """
+        Conduct the actual vote on the event loop, asking several politicians at once
+        
+        Args:
+            allow_dissent: Whether politicians can vote against party line
+            dissent_probability: Probability of voting against party line
+            max_concurrency: Maximum number of politicians deciding their vote at once
+            
+        Returns:
+            VotingResult with detailed voting information
+        """
+        print("\n" + "="*60)
+        print("VOTING")
+        print("="*60)
+        
+        ballots = [
+            (party, politician)
+            for party in self.parties
+            for politician in party.politicians
+        ]
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def decide(party, politician) -> str:
+            async with semaphore:
+                return await self._adetermine_vote(
+                    politician,
+                    self.party_positions.get(party.name, False),
+                    allow_dissent,
+                    dissent_probability
+                )
+        
+        decisions = await asyncio.gather(*(decide(party, politician) for party, politician in ballots))
+        
+        # Record votes in party order so the output matches the sequential run
+        current_party = None
+        for (party, politician), vote in zip(ballots, decisions):
+            if party is not current_party:
+                print(f"\n--- {party.name} ---")
+                current_party = party
+            
+            self.votes.append(Vote(
+                politician_name=politician.name,
+                party_name=party.name,
+                vote=vote
+            ))
+            
+            print(f"{politician.name}: {vote}")
+        
+        # Calculate results
+        result = self._calculate_results()
+        
+        # Display summary
+        self._display_summary(result)
+        
+        return result
         
     def _determine_vote(self, politician, party_supports: bool, 
                        allow_dissent: bool, dissent_probability: float) -> str:
@@ -101,17 +161,35 @@ class VotingSystem:
             # Vote strictly along party lines
             return "For" if party_supports else "Against"
         
+        response = politician.answer_question(self._vote_prompt(politician, party_supports))
+        return self._parse_vote(response, party_supports)
+    
+    async def _adetermine_vote(self, politician, party_supports: bool,
+                               allow_dissent: bool, dissent_probability: float) -> str:
+        """Determine how a politician votes without blocking the event loop"""
+        
+        if not allow_dissent:
+            # Vote strictly along party lines
+            return "For" if party_supports else "Against"
+        
+        response = await politician.aanswer_question(self._vote_prompt(politician, party_supports))
+        return self._parse_vote(response, party_supports)
+    
+    def _vote_prompt(self, politician, party_supports: bool) -> str:
+        """Build the prompt asking a politician for their vote"""
         # Ask politician for their personal stance
         party_position = 'SUPPORT' if party_supports else 'OPPOSE'
         
-        prompt = self.prompt_manager.format_prompt(
+        return self.prompt_manager.format_prompt(
             'simulation',
             'voting_system.vote_prompt',
             politician_name=politician.name,
             party_position=party_position
         )
-        
-        response = politician.answer_question(prompt).strip().upper()
+    
+    def _parse_vote(self, response: str, party_supports: bool) -> str:
+        """Turn a politician's answer into a vote"""
+        response = response.strip().upper()
         
         # Parse response
         if "FOR" in response and "AGAINST" not in response:
@@ -196,3 +274,23 @@ def simulate_voting(parties: List, party_positions: Dict[str, bool],
     """
     voting_system = VotingSystem(parties, party_positions)
     return voting_system.conduct_vote(allow_dissent, dissent_probability)
+
+
+async def asimulate_voting(parties: List, party_positions: Dict[str, bool], 
+                           allow_dissent: bool = True, dissent_probability: float = 0.1,
+                           max_concurrency: int = 4) -> VotingResult:
+    """
+    Simulate the voting process on the event loop
+    
+    Args:
+        parties: List of PartyAgent instances
+        party_positions: Dict mapping party names to their positions
+        allow_dissent: Whether politicians can vote against party line
+        dissent_probability: Probability of dissent
+        max_concurrency: Maximum number of politicians deciding their vote at once
+        
+    Returns:
+        VotingResult with detailed voting information
+    """
+    voting_system = VotingSystem(parties, party_positions)
+    return await voting_system.aconduct_vote(allow_dissent, dissent_probability, max_concurrency)
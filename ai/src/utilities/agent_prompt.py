@@ -0,0 +1,115 @@
+"""
+Agent Prompt Loader for AI Parliament
+
+This module loads the tool-calling agent prompt shared by all agents.
+The prompt is pulled from LangChain Hub at most once per process and a copy is kept on disk,
+so agents can still be built when the hub is unreachable or the system runs fully offline
+(AGENT_PROMPT_OFFLINE=true).
+"""
+
+import os
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Dict
+
+from langchain_core.load import dumpd, load
+from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_AGENT_PROMPT = "hwchase17/openai-tools-agent"
+
+_prompts: Dict[str, ChatPromptTemplate] = {}
+_lock = threading.Lock()
+
+
+def load_agent_prompt(name: str = DEFAULT_AGENT_PROMPT) -> ChatPromptTemplate:
+    """
+    Get an agent prompt, pulling it from LangChain Hub only on first use.
+
+    Args:
+        name: The hub name of the prompt
+
+    Returns:
+        The agent prompt template
+    """
+    prompt = _prompts.get(name)
+    if prompt is not None:
+        return prompt
+
+    with _lock:
+        if name not in _prompts:
+            _prompts[name] = _load_prompt(name)
+        return _prompts[name]
+
+
+def _load_prompt(name: str) -> ChatPromptTemplate:
+    """
+    Load a prompt from the hub, falling back to the on-disk copy and then to the built-in default.
+
+    Args:
+        name: The hub name of the prompt
+
+    Returns:
+        The agent prompt template
+    """
+    if os.getenv("AGENT_PROMPT_OFFLINE", "false").lower() != "true":
+        try:
+            prompt = _pull_from_hub(name)
+            _save_local_copy(name, prompt)
+            return prompt
+        except Exception as e:
+            logger.warning(f"Could not pull prompt {name} from LangChain Hub: {e}")
+
+    prompt_path = _get_local_copy_path(name)
+    if prompt_path.exists():
+        try:
+            with open(prompt_path, 'r', encoding='utf-8') as f:
+                return load(json.load(f))
+        except Exception as e:
+            logger.error(f"Error loading local copy of prompt {name} from {prompt_path}: {e}")
+
+    if name == DEFAULT_AGENT_PROMPT:
+        logger.info(f"Using built-in copy of prompt {name}")
+        return _default_agent_prompt()
+
+    raise RuntimeError(f"Prompt {name} is not available from LangChain Hub or a local copy")
+
+
+def _pull_from_hub(name: str) -> ChatPromptTemplate:
+    """Pull a prompt from LangChain Hub"""
+    from langsmith import Client
+
+    hub_client = Client(api_key=os.getenv("LANGSMITH_API_KEY"))
+    return hub_client.pull_prompt(name)
+
+
+def _get_local_copy_path(name: str) -> Path:
+    """Get the path of the on-disk copy of a prompt"""
+    prompt_dir = Path(os.getenv("AGENT_PROMPT_DIR", "cache/prompts"))
+    return prompt_dir / f"{name.replace('/', '__')}.json"
+
+
+def _save_local_copy(name: str, prompt: ChatPromptTemplate):
+    """Write the on-disk copy of a prompt (atomically, so readers never see a partial file)"""
+    prompt_path = _get_local_copy_path(name)
+    try:
+        prompt_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = prompt_path.with_name(f"{prompt_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(dumpd(prompt), f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, prompt_path)
+    except Exception as e:
+        logger.warning(f"Could not save local copy of prompt {name}: {e}")
+
+
+def _default_agent_prompt() -> ChatPromptTemplate:
+    """Built-in equivalent of hwchase17/openai-tools-agent"""
+    return ChatPromptTemplate.from_messages([
+        ("system", "You are a helpful assistant"),
+        MessagesPlaceholder("chat_history", optional=True),
+        ("human", "{input}"),
+        MessagesPlaceholder("agent_scratchpad"),
+    ])
@@ -7,8 +7,10 @@ If a prompt is not found in the YAML file, it falls back to default prompts.
 """
 
 import os
+import json
 import yaml
-from typing import Dict, Any, Optional
+import hashlib
+from typing import Dict, Any, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -290,6 +292,22 @@ class PromptManager:
             logger.error(f"Error formatting prompt {agent_type}.{prompt_type}: {e}")
             return None
     
+    def fingerprint(self, *prompts: Tuple[str, str], extra: Any = None) -> str:
+        """
+        Get a short fingerprint of prompt templates, used to version data generated with them.
+        
+        Args:
+            *prompts: (agent_type, prompt_type) pairs of the prompts the data depends on
+            extra: Anything else the data depends on (e.g. the model name)
+            
+        Returns:
+            A hex digest that changes whenever one of the templates or extra changes
+        """
+        templates = [(agent_type, prompt_type, self.get_prompt(agent_type, prompt_type))
+                     for agent_type, prompt_type in prompts]
+        payload = json.dumps([templates, extra], sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()[:16]
+    
     def reload_prompts(self) -> bool:
         """
         Reload the prompts from the YAML file.
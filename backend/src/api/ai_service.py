@@ -1,10 +1,16 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from src.ai.agents.agent_manager import AgentManager
 from src.ai.agents.supervisor_agent import SupervisorAgent
+from src.ai.agents.llm_gateway import llm_gateway
+from src.ai.agents.llm_cache import llm_cache
+from src.ai.agents.cache_manager import cache_manager
+from src.ai.agents.warm_cache import cache_warmer
+from src.ai.agents.simulation_snapshot import save_snapshot, load_snapshot, snapshot_path
 from src.ai.database.vector_db import VectorDatabase
 from src.ai.simulation.party_discussion import PartyDiscussion
 from src.ai.simulation.inter_party_debate import InterPartyDebate
 from src.ai.simulation.voting_system import VotingSystem
+from .simulation_pool import SimulationPool, default_pool_configs
 
 
 class AIService:
@@ -16,9 +22,11 @@ class AIService:
         Initialize the AI service.
         """
         self.agent_manager = AgentManager()
+        self.simulation_pool = SimulationPool(self._build_pooled_simulation)
         # self.vector_db = VectorDatabase()
     
-    def create_simulation(self, party_names: List[str], politicians_per_party: Dict[str, List[Dict[str, str]]]) -> Dict[str, Any]:
+    def create_simulation(self, party_names: List[str], politicians_per_party: Dict[str, List[Dict[str, str]]],
+                          cache_mode: Optional[str] = None) -> Dict[str, Any]:
         """
         Create a simulation with the specified parties and politicians.
         
@@ -26,32 +34,130 @@ class AIService:
             party_names: A list of party names
             politicians_per_party: A dictionary mapping party names to lists of politician dictionaries
                                   (each containing 'name' and optionally 'role')
+            cache_mode: LLM response cache mode ("replay" reuses recorded responses, "fresh" calls the model)
             
         Returns:
             A dictionary containing the simulation configuration
         """
-        supervisor = self.agent_manager.create_simulation(party_names, politicians_per_party)
+        # A simulation of a default configuration is usually ready in the pool
+        supervisor = self.simulation_pool.acquire(party_names, politicians_per_party, cache_mode)
+        if supervisor is not None:
+            load_report = {"pooled": True}
+        else:
+            supervisor = self.agent_manager.create_simulation(party_names, politicians_per_party, cache_mode)
+            load_report = self.agent_manager.last_load_report
         
         # Store the supervisor in the instance for later use
         self.supervisor = supervisor
         
         # Return the configuration
-        return {
-            "parties": [
-                {
-                    "name": party.party_name,
-                    "acronym": party.party_acronym,
-                    "politicians": [
-                        {
-                            "name": politician.full_name,
-                            "role": politician.role
-                        }
-                        for politician in party.politicians
-                    ]
-                }
-                for party in supervisor.parties
-            ]
-        }
+        result = self._describe_simulation(supervisor)
+        result["load_report"] = load_report
+        return result
+    
+    @staticmethod
+    def _build_pooled_simulation(party_names: List[str], politicians_per_party: Dict[str, List[Dict[str, str]]],
+                                 cache_mode: Optional[str] = None) -> SupervisorAgent:
+        # Each pooled simulation gets its own party agents (their discussion history is per simulation)
+        return AgentManager().create_simulation(party_names, politicians_per_party, cache_mode)
+    
+    def start_simulation_pool(self):
+        """
+        Start building the pooled simulations of the default configurations in the background.
+        """
+        if self.simulation_pool.size <= 0:
+            return
+        
+        for party_names, politicians_per_party in default_pool_configs():
+            self.simulation_pool.add_config(party_names, politicians_per_party)
+    
+    def stop_simulation_pool(self):
+        """
+        Stop building pooled simulations.
+        """
+        self.simulation_pool.shutdown()
+    
+    async def close_llm_clients(self):
+        """
+        Close the HTTP clients shared by the LLM models.
+        """
+        await llm_gateway.aclose()
+    
+    def get_simulation_pool_stats(self) -> Dict[str, Any]:
+        """
+        Get simulation pool statistics.
+        
+        Returns:
+            A dictionary with the hits, misses and builds of the pool and the ready simulations per configuration
+        """
+        return self.simulation_pool.get_stats()
+    
+    def _describe_simulation(self, supervisor: SupervisorAgent) -> Dict[str, Any]:
+        """
+        Describe the parties and politicians of a simulation.
+        
+        Args:
+            supervisor: The simulation
+            
+        Returns:
+            A dictionary containing the simulation configuration
+        """
+        # Roles are kept per simulation
+        with supervisor.simulation_scope():
+            return {
+                "parties": [
+                    {
+                        "name": party.party_name,
+                        "acronym": party.party_acronym,
+                        "politicians": [
+                            {
+                                "name": politician.full_name,
+                                "role": politician.role
+                            }
+                            for politician in party.politicians
+                        ]
+                    }
+                    for party in supervisor.parties
+                ]
+            }
+    
+    def save_snapshot(self, name: str, include_memory: bool = True) -> Dict[str, Any]:
+        """
+        Save the current simulation to a named snapshot.
+        
+        Args:
+            name: The snapshot name (letters, digits, "-" and "_")
+            include_memory: Whether to save the conversation so far, to resume the session later
+            
+        Returns:
+            A summary of the snapshot
+        """
+        if not hasattr(self, 'supervisor'):
+            return {"error": "No simulation has been created yet."}
+        
+        return save_snapshot(self.supervisor, snapshot_path(self._snapshot_name(name)), include_memory)
+    
+    def load_snapshot(self, name: str) -> Dict[str, Any]:
+        """
+        Restore a simulation from a named snapshot and make it the current simulation.
+        
+        Args:
+            name: The snapshot name
+            
+        Returns:
+            A dictionary containing the simulation configuration
+            
+        Raises:
+            FileNotFoundError: If there is no such snapshot
+        """
+        self.supervisor = load_snapshot(snapshot_path(self._snapshot_name(name)))
+        return self._describe_simulation(self.supervisor)
+    
+    @staticmethod
+    def _snapshot_name(name: str) -> str:
+        if not name or not all(char.isalnum() or char in "-_" for char in name):
+            raise ValueError("Snapshot names may only contain letters, digits, '-' and '_'")
+        return name
     
     def generate_legislation(self, topic: str) -> str:
         """
@@ -169,3 +275,82 @@ class AIService:
             return {"error": "No simulation has been created yet."}
         
         return self.supervisor.get_simulation_summary()
+    
+    def get_llm_stats(self) -> Dict[str, Any]:
+        """
+        Get LLM client statistics, including token usage and prompt cache hit ratio.
+        
+        Returns:
+            A dictionary containing gateway, rate limiter, usage and response cache statistics
+        """
+        stats = llm_gateway.get_stats()
+        stats["response_cache"] = llm_cache.get_stats()
+        return stats
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get politician, party and Wikipedia cache statistics.
+        
+        Returns:
+            A dictionary containing the cache statistics
+        """
+        return cache_manager.get_cache_stats()
+    
+    def clear_cache(self, max_age_days: Optional[int] = None) -> int:
+        """
+        Clear old cache entries.
+        
+        Args:
+            max_age_days: Entries not updated for this many days are removed (defaults to CACHE_STALE_MAX_DAYS)
+            
+        Returns:
+            The number of entries removed
+        """
+        return cache_manager.clear_old_cache(max_age_days)
+    
+    def start_cache_warming(self, party_names: Optional[List[str]] = None,
+                            politicians_per_party: Optional[Dict[str, List[Dict[str, str]]]] = None,
+                            max_workers: Optional[int] = None,
+                            rate_per_minute: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Create a cache warming job (run it with run_cache_warming).
+        
+        Args:
+            party_names: Parties to warm, in the create_simulation format (defaults to the default parties)
+            politicians_per_party: Politicians of each party (defaults to the default politicians)
+            max_workers: Maximum number of entries loaded at the same time
+            rate_per_minute: Maximum number of lookups started per minute
+            
+        Returns:
+            The status of the new job
+            
+        Raises:
+            RuntimeError: If another warming job is still running
+        """
+        job = cache_warmer.create_job_if_idle(party_names, politicians_per_party, max_workers, rate_per_minute)
+        return job.to_dict()
+    
+    def run_cache_warming(self, job_id: str) -> Dict[str, Any]:
+        """
+        Run a cache warming job to completion.
+        
+        Args:
+            job_id: The ID returned by start_cache_warming
+            
+        Returns:
+            The final status of the job
+        """
+        return cache_warmer.run(cache_warmer.get_job(job_id))
+    
+    def get_cache_warming_status(self, job_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get the progress of a cache warming job.
+        
+        Args:
+            job_id: The job ID (defaults to the most recent job)
+            
+        Returns:
+            The status of the job, or None if there is no such job
+        """
+        job = cache_warmer.get_job(job_id)
+        return job.to_dict() if job else None
@@ -2,8 +2,9 @@
 API routes for the backend server.
 """
 
-from fastapi import APIRouter, FastAPI, HTTPException
-from pydantic import BaseModel
+from contextlib import asynccontextmanager
+from fastapi import APIRouter, BackgroundTasks, FastAPI, HTTPException
+from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Optional
 from .ai_service import AIService
 
@@ -24,6 +25,7 @@ def health_check():
 class SimulationCreateRequest(BaseModel):
     party_names: List[str]
     politicians_per_party: Dict[str, List[Dict[str, str]]]
+    cache_mode: Optional[str] = None
 
 
 class GenerateLegislationRequest(BaseModel):
@@ -34,6 +36,18 @@ class LegislationRequest(BaseModel):
     legislation_text: str
 
 
+class SnapshotRequest(BaseModel):
+    name: str
+    include_memory: bool = True
+
+
+class CacheWarmRequest(BaseModel):
+    party_names: Optional[List[str]] = None
+    politicians_per_party: Optional[Dict[str, List[Dict[str, str]]]] = None
+    max_workers: Optional[int] = Field(None, ge=1)
+    rate_per_minute: Optional[float] = Field(None, ge=0)
+
+
 # API routes
 @router.post("/create_simulation")
 def create_simulation(request: SimulationCreateRequest):
@@ -41,8 +55,10 @@ def create_simulation(request: SimulationCreateRequest):
     Create a new simulation with the specified parties and politicians.
     """
     try:
-        result = ai_service.create_simulation(request.party_names, request.politicians_per_party)
+        result = ai_service.create_simulation(request.party_names, request.politicians_per_party, request.cache_mode)
         return result
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -106,31 +122,126 @@ def get_simulation_summary():
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
     
-# backend/src/api/routes.py
-@router.get("/api/cache/stats")
-async def get_cache_stats():
-    """Get cache statistics"""
-    from ai.src.agents.cache_manager import cache_manager
-    return cache_manager.get_cache_stats()
-
-@router.post("/api/cache/clear")
-async def clear_cache(max_age_days: int = 30):
-    """Clear old cache entries"""
-    from ai.src.agents.cache_manager import cache_manager
-    cleared = cache_manager.clear_old_cache(max_age_days)
-    return {"cleared": cleared}
-
-@router.post("/api/cache/warm")
-async def warm_cache(party_names: List[str] = None):
-    """Warm cache for specific parties"""
-    # Implementation of cache warming
-    pass
+@router.post("/simulation/snapshot")
+def save_simulation_snapshot(request: SnapshotRequest):
+    """
+    Save the current simulation to a named snapshot.
+    """
+    try:
+        return ai_service.save_snapshot(request.name, request.include_memory)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/simulation/restore")
+def restore_simulation_snapshot(request: SnapshotRequest):
+    """
+    Restore a simulation from a named snapshot and make it the current simulation.
+    """
+    try:
+        return ai_service.load_snapshot(request.name)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail=f"Snapshot {request.name} not found")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/simulation/pool")
+def get_simulation_pool_stats():
+    """
+    Get the state of the pool of ready simulations.
+    """
+    try:
+        return ai_service.get_simulation_pool_stats()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/llm/stats")
+def get_llm_stats():
+    """
+    Get LLM usage statistics (tokens, prompt cache hits, rate limiting).
+    """
+    try:
+        return ai_service.get_llm_stats()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    
+@router.get("/cache/stats")
+def get_cache_stats():
+    """
+    Get cache statistics.
+    """
+    try:
+        return ai_service.get_cache_stats()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/cache/clear")
+def clear_cache(max_age_days: Optional[int] = None):
+    """
+    Clear old cache entries.
+    """
+    try:
+        return {"cleared": ai_service.clear_cache(max_age_days)}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/cache/warm", status_code=202)
+def warm_cache(background_tasks: BackgroundTasks, request: Optional[CacheWarmRequest] = None):
+    """
+    Start warming the cache in the background (the default parties unless parties are posted).
+    """
+    request = request or CacheWarmRequest()
+    try:
+        status = ai_service.start_cache_warming(
+            request.party_names, request.politicians_per_party, request.max_workers, request.rate_per_minute
+        )
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    background_tasks.add_task(ai_service.run_cache_warming, status["job_id"])
+    return status
+
+
+@router.get("/cache/warm/status")
+def get_cache_warm_status(job_id: Optional[str] = None):
+    """
+    Get the progress of a cache warming job (the most recent one by default).
+    """
+    status = ai_service.get_cache_warming_status(job_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Cache warming job not found")
+    return status
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Fill the simulation pool on startup; stop it and close the LLM HTTP clients on shutdown.
+    """
+    try:
+        ai_service.start_simulation_pool()
+    except Exception as e:
+        # The backend works without the pool, only the first simulations are slower
+        print(f"❌ Error starting simulation pool: {e}")
+    yield
+    ai_service.stop_simulation_pool()
+    await ai_service.close_llm_clients()
 
 
 def create_app():
     """
     Create and configure the FastAPI application.
     """
-    app = FastAPI(title="AI Parliament Backend API")
+    app = FastAPI(title="AI Parliament Backend API", lifespan=lifespan)
     app.include_router(router)
     return app
\ No newline at end of file
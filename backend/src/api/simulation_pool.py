@@ -0,0 +1,193 @@
+"""
+Pool of ready-built simulations for the default parliament configurations.
+"""
+
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+import yaml
+
+from src.ai.agents.politician_registry import normalize_name
+from src.ai.agents.supervisor_agent import SupervisorAgent
+from src.ai.agents.warm_cache import DEFAULT_PARTIES_PATH
+
+PoolKey = Tuple
+
+
+def pool_key(party_names: List[str], politicians_per_party: Dict[str, List[Dict[str, str]]],
+             cache_mode: Optional[str] = None) -> PoolKey:
+    """
+    Get the identity of a simulation configuration.
+
+    Names are compared like PoliticianRegistry compares them (case, whitespace and diacritics
+    are ignored); the order of parties and politicians and the roles must match.
+    """
+    return cache_mode, tuple(
+        (
+            normalize_name(party_name),
+            tuple(
+                (normalize_name(politician["name"]), (politician.get("role") or "").strip())
+                for politician in politicians_per_party.get(party_name, [])
+            )
+        )
+        for party_name in party_names
+    )
+
+
+def default_pool_configs(party_counts: Optional[List[int]] = None,
+                         path: Optional[str] = None) -> List[Tuple[List[str], Dict[str, List[Dict[str, str]]]]]:
+    """
+    Get the simulation configurations the frontend sends when its defaults are kept.
+
+    Args:
+        party_counts: Numbers of default parties to build configurations for
+                      (defaults to SIMULATION_POOL_PARTY_COUNTS, "2" like parliament.parties.default_count)
+        path: Path of default_parties.yml (defaults to DEFAULT_PARTIES_PATH or the repository copy)
+
+    Returns:
+        (party_names, politicians_per_party) of each configuration
+    """
+    if party_counts is None:
+        party_counts = [int(count) for count in os.getenv("SIMULATION_POOL_PARTY_COUNTS", "2").split(",") if count.strip()]
+
+    path = path or os.getenv("DEFAULT_PARTIES_PATH") or DEFAULT_PARTIES_PATH
+    with open(path, 'r', encoding='utf-8') as f:
+        parties = (yaml.safe_load(f) or {}).get("parties") or {}
+
+    configs = []
+    for count in party_counts:
+        party_names = list(parties)[:count]
+        politicians_per_party = {
+            party_name: [
+                {"name": politician["name"], "role": politician.get("role", "")}
+                for politician in parties[party_name].get("politicians", [])
+            ]
+            for party_name in party_names
+        }
+        configs.append((party_names, politicians_per_party))
+    return configs
+
+
+class SimulationPool:
+    """
+    Keeps up to `size` ready simulations for each registered configuration.
+
+    A simulation is handed out once (it holds the state of its session); taking one
+    schedules a replacement, built in the background on a small thread pool.
+    """
+
+    def __init__(self, build: Callable[[List[str], Dict[str, List[Dict[str, str]]], Optional[str]], SupervisorAgent],
+                 size: Optional[int] = None, max_workers: Optional[int] = None):
+        """
+        Initialize the pool.
+
+        Args:
+            build: Builds a simulation from (party_names, politicians_per_party, cache_mode)
+            size: Ready simulations kept per configuration (defaults to SIMULATION_POOL_SIZE)
+            max_workers: Simulations built at the same time (defaults to SIMULATION_POOL_WORKERS)
+        """
+        self.size = size if size is not None else int(os.getenv("SIMULATION_POOL_SIZE", "1"))
+        self._build = build
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or int(os.getenv("SIMULATION_POOL_WORKERS", "1")),
+            thread_name_prefix="simulation-pool"
+        )
+        self._lock = threading.Lock()
+        self._configs: Dict[PoolKey, Tuple] = {}
+        self._ready: Dict[PoolKey, Deque[SupervisorAgent]] = {}
+        self._building: Dict[PoolKey, int] = {}
+        self._stats = {"hits": 0, "misses": 0, "built": 0, "failed": 0}
+        self._closed = False
+
+    def add_config(self, party_names: List[str], politicians_per_party: Dict[str, List[Dict[str, str]]],
+                   cache_mode: Optional[str] = None):
+        """
+        Keep simulations of a configuration ready, starting to build them in the background.
+
+        Args:
+            party_names: The party names, as sent to create_simulation
+            politicians_per_party: The politicians of each party, as sent to create_simulation
+            cache_mode: The LLM response cache mode of the simulations
+        """
+        key = pool_key(party_names, politicians_per_party, cache_mode)
+        with self._lock:
+            self._configs[key] = (party_names, politicians_per_party, cache_mode)
+            self._ready.setdefault(key, deque())
+            self._building.setdefault(key, 0)
+        self._refill(key)
+
+    def acquire(self, party_names: List[str], politicians_per_party: Dict[str, List[Dict[str, str]]],
+                cache_mode: Optional[str] = None) -> Optional[SupervisorAgent]:
+        """
+        Take a ready simulation matching a configuration.
+
+        Args:
+            party_names: The requested party names
+            politicians_per_party: The requested politicians of each party
+            cache_mode: The requested LLM response cache mode
+
+        Returns:
+            A ready simulation, or None if none is ready (the caller builds one itself)
+        """
+        key = pool_key(party_names, politicians_per_party, cache_mode)
+        with self._lock:
+            ready = self._ready.get(key)
+            supervisor = ready.popleft() if ready else None
+            self._stats["hits" if supervisor is not None else "misses"] += 1
+
+        if key in self._configs:
+            self._refill(key)
+        return supervisor
+
+    def _refill(self, key: PoolKey):
+        """Start building the simulations a configuration is missing"""
+        with self._lock:
+            if self._closed:
+                return
+            missing = self.size - len(self._ready[key]) - self._building[key]
+            self._building[key] += max(0, missing)
+
+        for _ in range(missing):
+            self._executor.submit(self._build_one, key)
+
+    def _build_one(self, key: PoolKey):
+        party_names, politicians_per_party, cache_mode = self._configs[key]
+        try:
+            supervisor = self._build(party_names, politicians_per_party, cache_mode)
+        except Exception as e:
+            # Not retried right away; the next request for this configuration schedules a new build
+            print(f"❌ Error building pooled simulation {party_names}: {e}")
+            with self._lock:
+                self._building[key] -= 1
+                self._stats["failed"] += 1
+            return
+
+        with self._lock:
+            self._building[key] -= 1
+            self._ready[key].append(supervisor)
+            self._stats["built"] += 1
+        print(f"✅ Pooled simulation ready: {', '.join(party_names)}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = self.size
+            stats["configs"] = [
+                {
+                    "party_names": self._configs[key][0],
+                    "ready": len(self._ready[key]),
+                    "building": self._building[key]
+                }
+                for key in self._configs
+            ]
+        return stats
+
+    def shutdown(self):
+        """Stop building simulations (builds in progress are abandoned)"""
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=False, cancel_futures=True)